@@ -0,0 +1,9 @@
+"""
+Performance benchmarks of the parsing, validation and serialization hot paths.
+
+Requires `pytest-benchmark`. The xml backend is selected at import time so every backend is benchmarked
+in a separate run::
+
+    pytest benchmarks
+    FORCE_STD_XML=true pytest benchmarks
+"""
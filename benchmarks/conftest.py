@@ -0,0 +1,22 @@
+from typing import List
+
+import pytest
+
+from pydantic_xml import config
+
+from .models import CASES, Case
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    # benchmarks are skipped if pytest-benchmark is not installed
+    collect_ignore_glob = ['test_*.py']
+
+
+def pytest_report_header() -> List[str]:
+    return [f"xml backend: {'std' if config.FORCE_STD_XML else 'lxml'}"]
+
+
+@pytest.fixture(params=list(CASES), scope='module')
+def case(request: pytest.FixtureRequest) -> Case:
+    return CASES[request.param]()
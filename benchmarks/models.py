@@ -0,0 +1,310 @@
+"""
+Benchmark fixtures: models and documents covering the serializers hot paths.
+"""
+
+import datetime as dt
+from typing import Dict, List, Literal, NamedTuple, Optional, Union
+
+from pydantic import Field
+from typing_extensions import Annotated
+
+from pydantic_xml import BaseXmlModel, attr, element, wrapped
+from pydantic_xml.element.native import ElementT, etree
+
+NSMAP = {
+    '': 'http://benchmark.org',
+    'bm1': 'http://benchmark1.org',
+    'bm2': 'http://benchmark2.org',
+}
+
+
+class Case(NamedTuple):
+    model: type
+    obj: BaseXmlModel
+
+
+# wide elements
+
+
+class Wide(BaseXmlModel, tag='wide'):
+    attr0: int = attr()
+    attr1: str = attr()
+    attr2: float = attr()
+    attr3: bool = attr()
+    attr4: dt.date = attr()
+    attr5: Optional[str] = attr(default=None)
+    element0: int = element()
+    element1: str = element()
+    element2: float = element()
+    element3: bool = element()
+    element4: dt.datetime = element()
+    element5: Optional[str] = element(default=None)
+    element6: int = element()
+    element7: str = element()
+    element8: float = element()
+    element9: bool = element()
+
+
+class WideList(BaseXmlModel, tag='wides'):
+    items: List[Wide]
+
+
+def make_wide() -> Case:
+    return Case(
+        WideList,
+        WideList(
+            items=[
+                Wide(
+                    attr0=idx, attr1=f'value{idx}', attr2=idx / 2, attr3=idx % 2 == 0, attr4=dt.date(2020, 1, 1),
+                    attr5='value',
+                    element0=idx, element1=f'value{idx}', element2=idx / 3, element3=idx % 3 == 0,
+                    element4=dt.datetime(2020, 1, 1, 12, 30), element6=idx, element7=f'value{idx}', element8=idx / 4,
+                    element9=idx % 4 == 0,
+                )
+                for idx in range(500)
+            ],
+        ),
+    )
+
+
+# deep nesting
+
+
+class Node(BaseXmlModel, tag='node'):
+    name: str = attr()
+    value: int = element()
+    node: Optional['Node'] = None
+
+
+class Tree(BaseXmlModel, tag='tree'):
+    nodes: List[Node]
+
+
+def make_deep() -> Case:
+    def make_node(depth: int) -> Node:
+        return Node(name=f'node{depth}', value=depth, node=make_node(depth - 1) if depth else None)
+
+    return Case(Tree, Tree(nodes=[make_node(50) for _ in range(20)]))
+
+
+# deep nesting with extra entities forbidden
+
+
+class StrictNode(BaseXmlModel, tag='node', extra='forbid'):
+    name: str = attr()
+    value: int = element()
+    node: Optional['StrictNode'] = None
+
+
+class StrictTree(BaseXmlModel, tag='tree', extra='forbid'):
+    nodes: List[StrictNode]
+
+
+def make_forbid() -> Case:
+    def make_node(depth: int) -> StrictNode:
+        return StrictNode(name=f'node{depth}', value=depth, node=make_node(depth - 1) if depth else None)
+
+    return Case(StrictTree, StrictTree(nodes=[make_node(50) for _ in range(20)]))
+
+
+# large homogeneous lists
+
+
+class Values(BaseXmlModel, tag='values'):
+    ints: List[int] = element(tag='int')
+    strs: List[str] = element(tag='str')
+    floats: List[float] = element(tag='float')
+
+
+def make_homogeneous() -> Case:
+    return Case(
+        Values,
+        Values(
+            ints=list(range(5000)),
+            strs=[f'value{idx}' for idx in range(5000)],
+            floats=[idx / 7 for idx in range(5000)],
+        ),
+    )
+
+
+# unions with many choices
+
+
+class Choice1(BaseXmlModel, tag='choice1'):
+    value: int = attr()
+
+
+class Choice2(BaseXmlModel, tag='choice2'):
+    value: str = attr()
+
+
+class Choice3(BaseXmlModel, tag='choice3'):
+    value: float = attr()
+
+
+class Choice4(BaseXmlModel, tag='choice4'):
+    value: int = element()
+
+
+class Choice5(BaseXmlModel, tag='choice5'):
+    value: str = element()
+
+
+class Choice6(BaseXmlModel, tag='choice6'):
+    value: float = element()
+
+
+class Choices(BaseXmlModel, tag='choices'):
+    items: List[Union[Choice1, Choice2, Choice3, Choice4, Choice5, Choice6]]
+    values: List[Union[int, float, dt.date]] = element(tag='value')
+
+
+def make_union() -> Case:
+    choices = [
+        Choice1(value=1), Choice2(value='value'), Choice3(value=1.5),
+        Choice4(value=1), Choice5(value='value'), Choice6(value=1.5),
+    ]
+    values = [1, 1.5, dt.date(2020, 1, 1)]
+
+    return Case(
+        Choices,
+        Choices(
+            items=[choices[idx % len(choices)] for idx in range(1200)],
+            values=[values[idx % len(values)] for idx in range(1200)],
+        ),
+    )
+
+
+# tagged unions
+
+
+class Event1(BaseXmlModel, tag='event'):
+    type: Literal['type1'] = attr()
+    value: int = element()
+
+
+class Event2(BaseXmlModel, tag='event'):
+    type: Literal['type2'] = attr()
+    value: str = element()
+
+
+class Event3(BaseXmlModel, tag='event'):
+    type: Literal['type3'] = attr()
+    value: float = element()
+
+
+class Event4(BaseXmlModel, tag='event'):
+    type: Literal['type4'] = attr()
+    value: bool = element()
+
+
+class Events(BaseXmlModel, tag='events'):
+    items: List[Annotated[Union[Event1, Event2, Event3, Event4], Field(discriminator='type')]]
+
+
+def make_tagged_union() -> Case:
+    events = [
+        Event1(type='type1', value=1), Event2(type='type2', value='value'),
+        Event3(type='type3', value=1.5), Event4(type='type4', value=True),
+    ]
+
+    return Case(Events, Events(items=[events[idx % len(events)] for idx in range(2000)]))
+
+
+# wrapped paths
+
+
+class Wrapped(BaseXmlModel, tag='wrapped'):
+    ints: List[int] = wrapped('data/ints', element(tag='int'))
+    strs: List[str] = wrapped('data/strs', element(tag='str'))
+    attr1: str = wrapped('data/meta', attr())
+    text1: str = wrapped('data/meta/info')
+
+
+class WrappedList(BaseXmlModel, tag='wrappeds'):
+    items: List[Wrapped]
+
+
+def make_wrapped() -> Case:
+    return Case(
+        WrappedList,
+        WrappedList(
+            items=[
+                Wrapped(ints=list(range(10)), strs=[f'value{idx}' for idx in range(10)], attr1='value', text1='text')
+                for _ in range(200)
+            ],
+        ),
+    )
+
+
+# raw fields
+
+
+class Raw(BaseXmlModel, tag='raw', arbitrary_types_allowed=True):
+    name: str = attr()
+    payload: ElementT = element()
+
+
+class RawList(BaseXmlModel, tag='raws', arbitrary_types_allowed=True):
+    items: List[Raw]
+
+
+def make_raw() -> Case:
+    def make_payload() -> ElementT:
+        payload = etree.Element('payload')
+        for idx in range(10):
+            sub_element = etree.SubElement(payload, 'item', attrib={'idx': str(idx)})
+            sub_element.text = f'value{idx}'
+
+        return payload
+
+    return Case(RawList, RawList(items=[Raw(name=f'raw{idx}', payload=make_payload()) for idx in range(500)]))
+
+
+# namespaced attributes
+
+
+class NamespacedAttrs(BaseXmlModel, tag='attrs', ns='bm2', nsmap=NSMAP, ns_attrs=True):
+    attrs: Dict[str, str]
+
+
+class Namespaced(BaseXmlModel, tag='namespaced', ns='bm1', nsmap=NSMAP, ns_attrs=True):
+    attr1: str = attr(ns='bm1')
+    attr2: int = attr(ns='bm2')
+    attr3: str = attr(ns='bm1')
+    attr4: int = attr(ns='bm2')
+    attr5: str = attr()
+    element1: str = element(ns='bm2')
+    attrs: NamespacedAttrs
+
+
+class NamespacedList(BaseXmlModel, tag='namespaceds', nsmap=NSMAP):
+    items: List[Namespaced]
+
+
+def make_namespaced() -> Case:
+    return Case(
+        NamespacedList,
+        NamespacedList(
+            items=[
+                Namespaced(
+                    attr1='value', attr2=idx, attr3='value', attr4=idx, attr5='value', element1='value',
+                    attrs=NamespacedAttrs(attrs={f'attr{idx}': str(idx) for idx in range(10)}),
+                )
+                for idx in range(500)
+            ],
+        ),
+    )
+
+
+CASES = {
+    'wide': make_wide,
+    'deep': make_deep,
+    'forbid': make_forbid,
+    'homogeneous': make_homogeneous,
+    'union': make_union,
+    'tagged-union': make_tagged_union,
+    'wrapped': make_wrapped,
+    'raw': make_raw,
+    'namespaced': make_namespaced,
+}
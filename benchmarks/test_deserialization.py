@@ -0,0 +1,31 @@
+from pydantic_xml.element.native import etree
+
+from .models import Case
+
+
+def test_from_xml(benchmark, case: Case):
+    xml = case.obj.to_xml()
+
+    benchmark.group = 'from_xml'
+    obj = benchmark(case.model.from_xml, xml)
+
+    assert obj.to_xml() == xml
+
+
+def test_from_xml_tree(benchmark, case: Case):
+    xml = case.obj.to_xml()
+    root = etree.fromstring(xml)
+
+    benchmark.group = 'from_xml_tree'
+    obj = benchmark(case.model.from_xml_tree, root)
+
+    assert obj.to_xml() == xml
+
+
+def test_from_xml_without_validation(benchmark, case: Case):
+    xml = case.obj.to_xml()
+
+    benchmark.group = 'from_xml (validate=False)'
+    obj = benchmark(case.model.from_xml, xml, validate=False)
+
+    assert obj.to_xml() == xml
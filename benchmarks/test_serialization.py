@@ -0,0 +1,17 @@
+from pydantic_xml.element.native import etree
+
+from .models import Case
+
+
+def test_to_xml(benchmark, case: Case):
+    benchmark.group = 'to_xml'
+    xml = benchmark(case.obj.to_xml)
+
+    assert case.model.from_xml(xml).to_xml() == xml
+
+
+def test_to_xml_tree(benchmark, case: Case):
+    benchmark.group = 'to_xml_tree'
+    root = benchmark(case.obj.to_xml_tree)
+
+    assert etree.tostring(root) == case.obj.to_xml()
@@ -0,0 +1,38 @@
+import re
+from typing import Dict
+
+from pydantic_xml import BaseXmlModel
+from pydantic_xml.utils import QName, split_uri
+
+URIS = [f'{{http://test{idx % 4}.org}}attr{idx}' for idx in range(50)] + [f'attr{idx}' for idx in range(50)]
+
+
+def split_uri_regex(uri: str) -> QName:
+    m = re.match(r'({(.*)})?(.*)', uri)
+    assert m is not None
+
+    return QName(tag=m[3], ns=m[2])
+
+
+def test_uri_split_regex(benchmark):
+    benchmark(lambda: [split_uri_regex(uri) for uri in URIS])
+
+
+def test_uri_split(benchmark):
+    benchmark(lambda: [split_uri(uri) for uri in URIS])
+
+
+def test_qname_from_uri(benchmark):
+    benchmark(lambda: [QName.from_uri(uri) for uri in URIS])
+
+
+def test_namespaced_attributes_deserialization(benchmark):
+    class TestModel(BaseXmlModel, tag='model', ns_attrs=True, nsmap={'tst': 'http://test.org'}):
+        attrs: Dict[str, str]
+
+    xml = '<model xmlns:tst="http://test.org" {}/>'.format(
+        ' '.join(f'tst:attr{idx}="{idx}"' for idx in range(50)),
+    )
+
+    obj = benchmark(TestModel.from_xml, xml)
+    assert len(obj.attrs) == 50
@@ -3,12 +3,14 @@ pydantic compatibility module.
 """
 
 import re
-from typing import Tuple
+from typing import Any, Dict, Set, Tuple, Type, TypeVar
 
 import pydantic as pd
 from pydantic._internal._model_construction import ModelMetaclass  # noqa
 from pydantic.root_model import _RootModelMetaclass as RootModelMetaclass  # noqa
 
+ModelT = TypeVar('ModelT', bound=pd.BaseModel)
+
 VERSION_RE = re.compile(
     r"(?P<major>[0-9]+)?.*?\.?"
     r"(?P<minor>[0-9]+)?.*?\.?"
@@ -34,3 +36,37 @@ def merge_field_infos(*field_infos: pd.fields.FieldInfo) -> pd.fields.FieldInfo:
         return pd.fields.FieldInfo._construct(list(field_infos))
     else:
         return pd.fields.FieldInfo.merge_field_infos(*field_infos)
+
+
+def is_plain_model(model: Type[pd.BaseModel]) -> bool:
+    """
+    Checks if the model instance can be created by just setting its fields
+    (the model has no private attributes, post-init hook, extra fields or data-dependent default factories).
+    """
+
+    return (
+        not model.__pydantic_post_init__ and
+        not model.__private_attributes__ and
+        model.model_config.get('extra') != 'allow' and
+        not any(getattr(field_info, 'default_factory_takes_data', False) for field_info in model.model_fields.values())
+    )
+
+
+def construct_plain_model(model: Type[ModelT], fields: Dict[str, Any], fields_set: Set[str]) -> ModelT:
+    """
+    Creates a plain model instance without validation. A lightweight alternative to `model_construct`
+    for the models :py:func:`is_plain_model` returns `True` for.
+
+    :param model: model class
+    :param fields: model fields including the default ones in the model fields order
+    :param fields_set: explicitly set fields
+    :return: model instance
+    """
+
+    obj = model.__new__(model)
+    object.__setattr__(obj, '__dict__', fields)
+    object.__setattr__(obj, '__pydantic_fields_set__', fields_set)
+    object.__setattr__(obj, '__pydantic_extra__', None)
+    object.__setattr__(obj, '__pydantic_private__', None)
+
+    return obj
@@ -17,3 +17,5 @@ def strtobool(val: str) -> bool:
 
 REGISTER_NS_PREFIXES = strtobool(os.environ.get('REGISTER_NS_PREFIXES', 'true'))
 FORCE_STD_XML = strtobool(os.environ.get('FORCE_STD_XML', 'false'))
+LAZY_SERIALIZERS = strtobool(os.environ.get('LAZY_SERIALIZERS', 'false'))
+SERIALIZER_CACHE_SIZE = int(os.environ.get('SERIALIZER_CACHE_SIZE', '0'))
@@ -1,2 +1,2 @@
-from .element import SearchMode, XmlElement, XmlElementReader, XmlElementWriter
+from .element import Journal, SearchMode, XmlElement, XmlElementBuilder, XmlElementReader, XmlElementWriter
 from .utils import is_element_nill, make_element_nill
@@ -1,12 +1,18 @@
 import abc
+import bisect
+import typing
+from collections import deque
 from enum import Enum
-from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, TypeVar
+from typing import Any, Callable, Deque, Dict, Generic, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar
 
-from pydantic_xml.typedefs import NsMap
+from pydantic_xml.typedefs import ElementBinding, NsMap
 
 PathElementT = TypeVar('PathElementT')
 PathT = Tuple[PathElementT, ...]
 
+# minimum number of not yet consumed sub-elements the tag index is built for
+INDEXED_SEARCH_THRESHOLD = 16
+
 
 class XmlElementReader(abc.ABC):
     """
@@ -142,6 +148,31 @@ class XmlElementReader(abc.ABC):
         Applies a snapshot to the current element.
         """
 
+    @abc.abstractmethod
+    def create_checkpoint(self) -> int:
+        """
+        Creates a checkpoint of the element tree state. All the subsequent element tree modifications
+        are recorded until the checkpoint is rolled back or released.
+
+        :return: created checkpoint
+        """
+
+    @abc.abstractmethod
+    def rollback_checkpoint(self, checkpoint: int) -> None:
+        """
+        Reverts all the element tree modifications made since the checkpoint has been created.
+
+        :param checkpoint: checkpoint to roll back to
+        """
+
+    @abc.abstractmethod
+    def release_checkpoint(self, checkpoint: int) -> None:
+        """
+        Keeps all the element tree modifications made since the checkpoint has been created.
+
+        :param checkpoint: checkpoint to be released
+        """
+
     @abc.abstractmethod
     def step_forward(self) -> None:
         """
@@ -156,6 +187,15 @@ class XmlElementReader(abc.ABC):
         :return: native element
         """
 
+    @abc.abstractmethod
+    def has_unbound(self) -> bool:
+        """
+        Checks if the element may have unbound entities. The check doesn't walk the element sub-tree
+        so it may report entities that turn out to be bound (see :py:meth:`get_unbound`) but never misses them.
+
+        :return: `False` if the element sub-tree has no unbound entities otherwise `True`
+        """
+
     @abc.abstractmethod
     def get_unbound(self) -> List[Tuple[PathT['XmlElementReader'], Optional[str], str]]:
         """
@@ -213,7 +253,7 @@ class XmlElementWriter(abc.ABC):
         """
 
     @abc.abstractmethod
-    def append_element(self, element: 'XmlElement[Any]') -> None:
+    def append_element(self, element: 'XmlElementWriter') -> None:
         """
         Appends a new sub-element to the xml element.
 
@@ -221,7 +261,7 @@ class XmlElementWriter(abc.ABC):
         """
 
     @abc.abstractmethod
-    def make_element(self, tag: str, nsmap: Optional[NsMap]) -> 'XmlElement[Any]':
+    def make_element(self, tag: str, nsmap: Optional[NsMap]) -> 'XmlElementWriter':
         """
         Creates an element of the current element type.
 
@@ -244,15 +284,67 @@ class XmlElementWriter(abc.ABC):
 
     @classmethod
     @abc.abstractmethod
-    def from_native(cls, element: Any) -> 'XmlElement[Any]':
+    def from_native(cls, element: Any) -> 'XmlElementWriter':
         """
-        Creates a instance of `XmlElement` from native element.
+        Creates an element of the current element type from native element.
 
         :param element: native element
-        :return: `XmlElement`
+        :return: created element
         """
 
 
+class Journal:
+    """
+    Xml element tree modification journal.
+    Records the element states changes made after a checkpoint so that they can be cheaply rolled back.
+    """
+
+    __slots__ = ('_records', '_depth', 'active')
+
+    def __init__(self) -> None:
+        self._records: List[Tuple[Any, Any, Any]] = []
+        self._depth = 0
+        # plain attribute not a property since it is checked on every element modification
+        self.active = False
+
+    def record(self, target: Any, key: Any, value: Any) -> None:
+        """
+        Records the previous value of a state attribute or a list item.
+
+        :param target: element state or list
+        :param key: attribute name or item index
+        :param value: previous value
+        """
+
+        self._records.append((target, key, value))
+
+    def create_checkpoint(self) -> int:
+        self._depth += 1
+        self.active = True
+
+        return len(self._records)
+
+    def rollback_checkpoint(self, checkpoint: int) -> None:
+        records = self._records
+        while len(records) > checkpoint:
+            target, key, value = records.pop()
+            if isinstance(target, list):
+                target[key] = value
+            else:
+                setattr(target, key, value)
+
+        self._release()
+
+    def release_checkpoint(self, checkpoint: int) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        self._depth -= 1
+        if self._depth == 0:
+            self.active = False
+            self._records.clear()
+
+
 NativeElement = TypeVar('NativeElement')
 
 
@@ -264,7 +356,7 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
     NativeElementInner = TypeVar('NativeElementInner')
 
     class State(Generic[NativeElementInner]):
-        __slots__ = ('text', 'tail', 'attrib', 'elements', 'next_element_idx')
+        __slots__ = ('text', 'tail', 'attrib', 'elements', 'next_element_idx', 'index', 'unbound')
 
         def __init__(
                 self,
@@ -279,16 +371,31 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
             self.attrib = attrib
             self.elements = elements
             self.next_element_idx = next_element_idx
+            # sub-element tag to positions index used by ordered and unordered searchers (built lazily)
+            self.index: Optional[Dict[str, Deque[int]]] = None
+            # number of not consumed entities: text, tail, attributes and sub-elements not known to be consumed
+            # (a sub-element is counted until its own counter drops to zero)
+            self.unbound = (
+                (not text.isspace() if text else False) +
+                (not tail.isspace() if tail else False) +
+                (len(attrib) if attrib else 0) +
+                len(elements)
+            )
 
-    __slots__ = ('_tag', '_nsmap', '_state')
+    __slots__ = ('_tag', '_nsmap', '_state', '_sourceline', '_journal', '_parent')
 
     @classmethod
     @abc.abstractmethod
-    def from_native(cls, element: NativeElement) -> 'XmlElement[NativeElement]':
+    def from_native(
+            cls,
+            element: NativeElement,
+            binding: Optional[ElementBinding] = None,
+    ) -> 'XmlElement[NativeElement]':
         """
         Creates a instance of `XmlElement` from native element.
 
         :param element: native element
+        :param binding: sub-elements binding, sub-elements that are not bound are skipped (all are kept if `None`)
         :return: `XmlElement`
         """
 
@@ -300,6 +407,16 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
         :return: native element
         """
 
+    @abc.abstractmethod
+    def make_element(self, tag: str, nsmap: Optional[NsMap]) -> 'XmlElement[NativeElement]':
+        """
+        Creates an element of the current element type.
+
+        :param tag: element tag
+        :param nsmap: element namespace map
+        :return: created element
+        """
+
     def __init__(
             self,
             tag: str,
@@ -309,6 +426,7 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
             elements: Optional[Iterable['XmlElement[NativeElement]']] = None,
             nsmap: Optional[NsMap] = None,
             sourceline: int = -1,
+            journal: Optional[Journal] = None,
     ):
         self._tag = tag
         self._nsmap = nsmap
@@ -320,6 +438,69 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
             next_element_idx=0,
         )
         self._sourceline = sourceline
+        self._journal = journal
+        self._parent: Optional[XmlElement[NativeElement]] = None
+
+        for element in self._state.elements:
+            element._parent = self
+            if element._is_consumed():
+                self._state.unbound -= 1
+
+    if not typing.TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any:
+            # the state of an element created lazily is loaded on the first access
+            if name == '_state':
+                self._state = state = self._load_state()
+                if state.unbound == 0 and (parent := self._parent) is not None:
+                    parent._add_unbound(-1)
+                return state
+
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    def _load_state(self) -> 'XmlElement.State[NativeElement]':
+        """
+        Loads the state of a lazily created element.
+
+        :return: element state
+        """
+
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '_state'")
+
+    def _is_consumed(self) -> bool:
+        """
+        Checks if the element is known to have no unbound entities. Not loaded elements are never consumed.
+        """
+
+        try:
+            # the state is not loaded by the check
+            state = object.__getattribute__(self, '_state')
+        except AttributeError:
+            return False
+
+        return state.unbound == 0
+
+    def _add_unbound(self, delta: int) -> None:
+        """
+        Updates the element unbound entities counter. The parent counter is updated as well
+        if the element becomes consumed or not consumed.
+
+        :param delta: counter change
+        """
+
+        element: Optional[XmlElement[NativeElement]] = self
+        while element is not None and delta:
+            state = element._state
+            prev = state.unbound
+            if (journal := element._journal) is not None and journal.active:
+                journal.record(state, 'unbound', prev)
+            state.unbound = prev + delta
+
+            if prev and state.unbound:
+                # the element consumption status is not changed so the parents are not affected
+                break
+
+            delta = 1 if state.unbound else -1
+            element = element._parent
 
     @abc.abstractmethod
     def get_sourceline(self) -> int:
@@ -355,8 +536,35 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
         self._state.attrib = snapshot._state.attrib
         self._state.elements = snapshot._state.elements
         self._state.next_element_idx = snapshot._state.next_element_idx
+        self._state.index = None
+        for element in self._state.elements:
+            element._parent = self
+        self._add_unbound(snapshot._state.unbound - self._state.unbound)
+
+    def create_checkpoint(self) -> int:
+        if self._journal is None:
+            self._attach_journal(Journal())
+
+        assert self._journal is not None
+        return self._journal.create_checkpoint()
+
+    def rollback_checkpoint(self, checkpoint: int) -> None:
+        assert self._journal is not None, "checkpoint not found"
+        self._journal.rollback_checkpoint(checkpoint)
+
+    def release_checkpoint(self, checkpoint: int) -> None:
+        assert self._journal is not None, "checkpoint not found"
+        self._journal.release_checkpoint(checkpoint)
+
+    def _attach_journal(self, journal: Journal) -> None:
+        self._journal = journal
+        for element in self._state.elements:
+            element._attach_journal(journal)
 
     def step_forward(self) -> None:
+        if (journal := self._journal) is not None and journal.active:
+            journal.record(self._state, 'next_element_idx', self._state.next_element_idx)
+
         self._state.next_element_idx += 1
 
     def is_empty(self) -> bool:
@@ -366,45 +574,96 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
             return False
 
     def set_text(self, text: str) -> None:
+        self._add_unbound(_has_data(text) - _has_data(self._state.text))
         self._state.text = text
 
     def set_attribute(self, name: str, value: str) -> None:
         if self._state.attrib is None:
             self._state.attrib = {}
 
+        if name not in self._state.attrib:
+            self._add_unbound(1)
         self._state.attrib[name] = value
 
     def set_attributes(self, attributes: Dict[str, str]) -> None:
+        self._add_unbound(len(attributes) - len(self._state.attrib or ()))
         self._state.attrib = dict(attributes)
 
-    def append_element(self, element: 'XmlElement[NativeElement]') -> None:
-        self._state.elements.append(element)
-        self._state.next_element_idx += 1
+    def append_element(self, element: XmlElementWriter) -> None:
+        self._append_element(typing.cast(XmlElement[NativeElement], element))
+
+    def _append_element(self, element: 'XmlElement[NativeElement]') -> None:
+        state = self._state
+        state.elements.append(element)
+        state.next_element_idx += 1
+        if state.index is not None:
+            state.index.setdefault(element.tag, deque()).append(len(state.elements) - 1)
+
+        element._parent = self
+        if not element._is_consumed():
+            self._add_unbound(1)
 
     def get_attrib(self, name: str) -> Optional[str]:
         return self._state.attrib.get(name, None) if self._state.attrib else None
 
     def pop_text(self) -> Optional[str]:
         result, self._state.text = self._state.text, None
+        if (journal := self._journal) is not None and journal.active:
+            journal.record(self._state, 'text', result)
+        if result and not result.isspace():
+            self._add_unbound(-1)
 
         return result
 
     def pop_tail(self) -> Optional[str]:
         result, self._state.tail = self._state.tail, None
+        if (journal := self._journal) is not None and journal.active:
+            journal.record(self._state, 'tail', result)
+        if result and not result.isspace():
+            self._add_unbound(-1)
 
         return result
 
     def pop_attrib(self, name: str) -> Optional[str]:
-        return self._state.attrib.pop(name, None) if self._state.attrib else None
+        if not (attrib := self._state.attrib):
+            return None
+
+        if (journal := self._journal) is not None and journal.active and name in attrib:
+            # the attributes are copied not to change their order on rollback
+            journal.record(self._state, 'attrib', attrib)
+            self._state.attrib = attrib = dict(attrib)
+
+        if (result := attrib.pop(name, None)) is not None:
+            self._add_unbound(-1)
+
+        return result
 
     def pop_attributes(self) -> Optional[Dict[str, str]]:
         result, self._state.attrib = self._state.attrib, None
+        if (journal := self._journal) is not None and journal.active:
+            journal.record(self._state, 'attrib', result)
+        if result:
+            self._add_unbound(-len(result))
 
         return result
 
     def pop_elements(self) -> Tuple['XmlElement[NativeElement]', ...]:
         elements, self._state.elements = self._state.elements, []
-        self._state.next_element_idx = 0
+        next_element_idx, self._state.next_element_idx = self._state.next_element_idx, 0
+        self._state.index = None
+        journal = self._journal if self._journal is not None and self._journal.active else None
+        if journal is not None:
+            journal.record(self._state, 'elements', elements)
+            journal.record(self._state, 'next_element_idx', next_element_idx)
+
+        unbound = 0
+        for element in elements:
+            if journal is not None:
+                journal.record(element, '_parent', element._parent)
+            element._parent = None
+            if not element._is_consumed():
+                unbound += 1
+        self._add_unbound(-unbound)
 
         return tuple(elements)
 
@@ -416,7 +675,7 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
     ) -> Optional['XmlElement[NativeElement]']:
         searcher: Searcher[NativeElement] = get_searcher(search_mode)
 
-        element = searcher(self._state, tag, False, True)
+        element = searcher(self._state, tag, False, True, self._journal)
         if element is not None and remove:
             return self.__class__(
                 tag=element.tag,
@@ -450,8 +709,7 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
     ) -> 'XmlElement[NativeElement]':
         if (sub_element := self.find_element(tag, search_mode)) is None:
             sub_element = self.make_element(tag=tag, nsmap=nsmap)
-            self._state.elements.append(sub_element)
-            self._state.next_element_idx += 1
+            self._append_element(sub_element)
 
         return sub_element
 
@@ -464,7 +722,10 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
     ) -> Optional['XmlElement[NativeElement]']:
         searcher: Searcher[NativeElement] = get_searcher(search_mode)
 
-        return searcher(self._state, tag, look_behind, step_forward)
+        return searcher(self._state, tag, look_behind, step_forward, self._journal)
+
+    def has_unbound(self) -> bool:
+        return self._state.unbound != 0
 
     def get_unbound(
             self,
@@ -482,12 +743,122 @@ class XmlElement(XmlElementReader, XmlElementWriter, Generic[NativeElement]):
             for name, value in attrs.items():
                 result.append((path, name, value))
 
+        unbound = len(result)
         for sub_element in self._state.elements:
-            result.extend(sub_element.get_unbound(path + (sub_element,)))
+            if sub_result := sub_element.get_unbound(path + (sub_element,)):
+                result.extend(sub_result)
+                unbound += 1
+
+        # the counter may overestimate the unbound entities (sub-elements having nothing to consume
+        # or checked ones) so it is synchronized with the actual value
+        self._add_unbound(unbound - self._state.unbound)
 
         return result
 
 
+class XmlElementBuilder:
+    """
+    Xml parser target building an `XmlElement` tree right from the parser events
+    so that the native element tree is never built.
+    Sub-elements that are not bound are skipped (see :py:meth:`XmlElement.from_native`).
+    Element source lines are not available through the parser target interface and are not tracked.
+
+    :param element_cls: element class to build the tree of
+    :param binding: root element sub-elements binding
+    :param drop_comments_tails: drop the text following comments and processing instructions
+                                (native trees keep that text in the comment tail which is not loaded)
+    """
+
+    __slots__ = (
+        '_element_cls', '_binding', '_drop_comments_tails', '_journal', '_stack', '_bindings', '_skip_depth',
+        '_data_target', '_root',
+    )
+
+    def __init__(
+            self,
+            element_cls: Type[XmlElement[Any]],
+            binding: Optional[ElementBinding] = None,
+            drop_comments_tails: bool = True,
+    ):
+        self._element_cls = element_cls
+        self._binding = binding
+        self._drop_comments_tails = drop_comments_tails
+        self._journal = Journal()
+        self._stack: List[XmlElement[Any]] = []
+        self._bindings: List[Optional[ElementBinding]] = []
+        self._skip_depth = 0
+        # the element state attribute the character data is appended to (`None` if the data is dropped)
+        self._data_target: Optional[Tuple[XmlElement.State[Any], str]] = None
+        self._root: Optional[XmlElement[Any]] = None
+
+    def start(self, tag: str, attrib: Dict[str, str], nsmap: Optional[NsMap] = None) -> None:
+        if self._skip_depth:
+            self._skip_depth += 1
+            return
+
+        if self._stack:
+            binding = self._bindings[-1]
+            if binding is not None and tag not in binding:
+                self._skip_depth = 1
+                self._data_target = None
+                return
+            sub_binding = binding[tag] if binding is not None else None
+        else:
+            sub_binding = self._binding
+
+        element = self._element_cls(tag, attributes=attrib, journal=self._journal)
+        if self._stack:
+            element._parent = parent = self._stack[-1]
+            parent._state.elements.append(element)
+        else:
+            self._root = element
+
+        self._stack.append(element)
+        self._bindings.append(sub_binding)
+        self._data_target = (element._state, 'text')
+
+    def end(self, tag: str) -> None:
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+
+        element = self._stack.pop()
+        self._bindings.pop()
+        self._data_target = (element._state, 'tail')
+
+        # the unbound entities counter is set when the element text and the sub-elements tails are collected
+        state = element._state
+        unbound = _has_data(state.text) + (len(state.attrib) if state.attrib else 0)
+        for sub_element in state.elements:
+            sub_state = sub_element._state
+            if _has_data(sub_state.tail):
+                sub_state.unbound += 1
+            if sub_state.unbound:
+                unbound += 1
+        state.unbound = unbound
+
+    def data(self, data: str) -> None:
+        if self._skip_depth or (data_target := self._data_target) is None:
+            return
+
+        state, attr = data_target
+        prev = getattr(state, attr)
+        setattr(state, attr, data if prev is None else prev + data)
+
+    def comment(self, text: str) -> None:
+        if self._drop_comments_tails:
+            self._data_target = None
+
+    def pi(self, target: str, data: Optional[str] = None) -> None:
+        if self._drop_comments_tails:
+            self._data_target = None
+
+    def close(self) -> XmlElement[Any]:
+        assert self._root is not None, "document root element not found"
+
+        return self._root
+
+
 class SearchMode(str, Enum):
     """
     Element search mode.
@@ -502,7 +873,10 @@ class SearchMode(str, Enum):
     UNORDERED = 'unordered'
 
 
-Searcher = Callable[[XmlElement.State[NativeElement], str, bool, bool], Optional[XmlElement[NativeElement]]]
+Searcher = Callable[
+    [XmlElement.State[NativeElement], str, bool, bool, Optional[Journal]],
+    Optional[XmlElement[NativeElement]],
+]
 
 
 def get_searcher(search_mode: SearchMode) -> Searcher[NativeElement]:
@@ -521,6 +895,7 @@ def strict_search(
         tag: str,
         look_behind: bool = False,
         step_forward: bool = True,
+        journal: Optional[Journal] = None,
 ) -> Optional[XmlElement[NativeElement]]:
     """
     Searches for a sub-element sequentially one by one.
@@ -529,6 +904,7 @@ def strict_search(
     :param tag: sub-element tag for be searched for
     :param look_behind: look in the previous element
     :param step_forward: increment next element index
+    :param journal: element tree modification journal
     :return: found element or `None` if the element not found
     """
 
@@ -540,6 +916,8 @@ def strict_search(
     if state.next_element_idx < len(state.elements) and state.elements[state.next_element_idx].tag == tag:
         result = state.elements[state.next_element_idx]
         if step_forward:
+            if journal is not None and journal.active:
+                journal.record(state, 'next_element_idx', state.next_element_idx)
             state.next_element_idx += 1
 
     return result
@@ -550,6 +928,7 @@ def ordered_search(
         tag: str,
         look_behind: bool = False,
         step_forward: bool = True,
+        journal: Optional[Journal] = None,
 ) -> Optional[XmlElement[NativeElement]]:
     """
     Searches for an element sequentially skipping unmatched ones.
@@ -558,6 +937,7 @@ def ordered_search(
     :param tag: sub-element tag for be searched for
     :param look_behind: look in the previous element
     :param step_forward: increment next element index
+    :param journal: element tree modification journal
     :return: found element or `None` if the element not found
     """
 
@@ -566,6 +946,16 @@ def ordered_search(
     if look_behind and (result := _look_behind(state, tag)) is not None:
         return result
 
+    if (index := _get_index(state, journal)) is not None:
+        if positions := _get_positions(state, index, tag):
+            result = state.elements[positions[0]]
+            if step_forward:
+                if journal is not None and journal.active:
+                    journal.record(state, 'next_element_idx', state.next_element_idx)
+                state.next_element_idx = positions[0] + 1
+
+        return result
+
     next_element_idx = state.next_element_idx
     while next_element_idx < len(state.elements):
         element = state.elements[next_element_idx]
@@ -573,6 +963,8 @@ def ordered_search(
 
         if element.tag == tag:
             if step_forward:
+                if journal is not None and journal.active:
+                    journal.record(state, 'next_element_idx', state.next_element_idx)
                 state.next_element_idx = next_element_idx
 
             result = element
@@ -586,6 +978,7 @@ def unordered_search(
         tag: str,
         look_behind: bool = False,
         step_forward: bool = True,
+        journal: Optional[Journal] = None,
 ) -> Optional[XmlElement[NativeElement]]:
     """
     Searches search for an element ignoring elements order.
@@ -594,6 +987,7 @@ def unordered_search(
     :param tag: sub-element tag for be searched for
     :param look_behind: look in the previous element
     :param step_forward: increment next element index
+    :param journal: element tree modification journal
     :return: found element or `None` if the requested element not found
     """
 
@@ -602,13 +996,34 @@ def unordered_search(
     if look_behind and (result := _look_behind(state, tag)) is not None:
         return result
 
+    if (index := _get_index(state, journal)) is not None:
+        if positions := _get_positions(state, index, tag):
+            idx = positions[0]
+            result = state.elements[idx]
+            if idx != state.next_element_idx:
+                _swap_elements(state, idx, journal)
+
+                # the found element is moved to the next element position, the replaced one - to the found one
+                positions[0] = state.next_element_idx
+                replaced_positions = _get_positions(state, index, state.elements[idx].tag)
+                replaced_positions.popleft()
+                bisect.insort(replaced_positions, idx)
+
+            if step_forward:
+                if journal is not None and journal.active:
+                    journal.record(state, 'next_element_idx', state.next_element_idx)
+                state.next_element_idx += 1
+
+        return result
+
     for idx in range(state.next_element_idx, len(state.elements)):
         element = state.elements[idx]
         if element.tag == tag:
-            state.elements[state.next_element_idx], state.elements[idx] = \
-                state.elements[idx], state.elements[state.next_element_idx]
+            _swap_elements(state, idx, journal)
 
             if step_forward:
+                if journal is not None and journal.active:
+                    journal.record(state, 'next_element_idx', state.next_element_idx)
                 state.next_element_idx += 1
 
             result = element
@@ -617,6 +1032,57 @@ def unordered_search(
     return result
 
 
+def _swap_elements(state: XmlElement.State[NativeElement], idx: int, journal: Optional[Journal]) -> None:
+    if journal is not None and journal.active:
+        journal.record(state.elements, idx, state.elements[idx])
+        journal.record(state.elements, state.next_element_idx, state.elements[state.next_element_idx])
+
+    state.elements[state.next_element_idx], state.elements[idx] = \
+        state.elements[idx], state.elements[state.next_element_idx]
+
+
+def _get_index(state: XmlElement.State[NativeElement], journal: Optional[Journal]) -> Optional[Dict[str, Deque[int]]]:
+    """
+    Returns the sub-elements tag index building it if the number of unconsumed sub-elements is large enough.
+    The index contains positions of all the sub-elements starting from the next element index.
+    Positions preceding the next element index are stale and removed lazily.
+    """
+
+    if (index := state.index) is None:
+        if len(state.elements) - state.next_element_idx < INDEXED_SEARCH_THRESHOLD:
+            return None
+
+        index = {}
+        for idx in range(state.next_element_idx, len(state.elements)):
+            index.setdefault(state.elements[idx].tag, deque()).append(idx)
+        state.index = index
+
+    if journal is not None and journal.active:
+        # the index is modified in place so it is dropped on rollback and rebuilt on demand
+        journal.record(state, 'index', None)
+
+    return index
+
+
+def _get_positions(state: XmlElement.State[NativeElement], index: Dict[str, Deque[int]], tag: str) -> Deque[int]:
+    positions = index.get(tag)
+    if positions is None:
+        return deque()
+
+    while positions and positions[0] < state.next_element_idx:
+        positions.popleft()
+
+    return positions
+
+
+def _has_data(text: Optional[str]) -> bool:
+    """
+    Checks if the text is not blank (whitespaces are never bound so they are not counted as unbound entities).
+    """
+
+    return text is not None and text != '' and not text.isspace()
+
+
 def _look_behind(state: XmlElement.State[NativeElement], tag: str) -> Optional[XmlElement[NativeElement]]:
     if state.next_element_idx != 0:
         candidate = state.elements[state.next_element_idx - 1]
@@ -1,10 +1,16 @@
-from typing import Any, Type
+from typing import Any, Callable, ContextManager, Iterator, Type
 
 from pydantic_xml import config
 from pydantic_xml.element import XmlElement as BaseXmlElement
 
 XmlElement: Type[BaseXmlElement[Any]]
+ElementWriter: Type[Any]
 ElementT: Type[Any]
+iterparse: Callable[..., Iterator[Any]]
+xmlstream: Callable[..., ContextManager[Any]]
+ParserPool: Type[Any]
+PullParser: Type[Any]
+parse_events: Callable[..., BaseXmlElement[Any]]
 
 if config.FORCE_STD_XML:
     from .std import *  # noqa: F403
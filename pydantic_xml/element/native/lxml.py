@@ -1,49 +1,103 @@
+import contextlib
+import copy
+import os
+import threading
 import typing
-from typing import Optional, Union
+from typing import IO, Any, Dict, Iterator, Optional, Tuple, Union
 
 from lxml import etree
 
+from pydantic_xml import errors
+from pydantic_xml.element import Journal, SearchMode
 from pydantic_xml.element import XmlElement as BaseXmlElement
-from pydantic_xml.typedefs import NsMap
+from pydantic_xml.element import XmlElementBuilder, XmlElementWriter
+from pydantic_xml.typedefs import ElementBinding, FrozenNsMap, NsMap, XmlSource
 
 __all__ = (
     'ElementT',
+    'ElementWriter',
     'XmlElement',
     'etree',
+    'iterparse',
+    'parse_events',
+    'ParserPool',
+    'PullParser',
+    'xmlstream',
 )
 
 ElementT = etree._Element
 
+# arguments of the document parsing functions not the parser itself
+DOCUMENT_OPTIONS = frozenset(('base_url',))
+
 
 class XmlElement(BaseXmlElement[ElementT]):
+    __slots__ = ('_native', '_binding')
+
+    _native: ElementT
+    _binding: Optional[ElementBinding]
+
+    @classmethod
+    def from_native(cls, element: ElementT, binding: Optional[ElementBinding] = None) -> 'XmlElement':
+        return cls._from_native(element, Journal(), binding)
+
     @classmethod
-    def from_native(cls, element: ElementT) -> 'XmlElement':
-        return cls(
-            tag=element.tag,
+    def _from_native(
+            cls,
+            element: ElementT,
+            journal: Optional[Journal],
+            binding: Optional[ElementBinding],
+            parent: Optional['XmlElement'] = None,
+    ) -> 'XmlElement':
+        # the element state is loaded on the first access so that untouched sub-trees are never copied
+        instance = cls.__new__(cls)
+        instance._tag = element.tag
+        instance._nsmap = None
+        instance._sourceline = typing.cast(int, element.sourceline) if element.sourceline is not None else -1
+        instance._native = element
+        instance._journal = journal
+        instance._binding = binding
+        instance._parent = parent
+
+        return instance
+
+    def _load_state(self) -> BaseXmlElement.State[ElementT]:
+        element = self._native
+
+        return BaseXmlElement.State(
             text=element.text,
             tail=element.tail,
-            attributes={
+            attrib={
                 force_str(name): force_str(value)  # transformation is safe since lxml bytes values are ASCII compatible
                 for name, value in element.attrib.items()
             },
             elements=[
-                XmlElement.from_native(sub_element)
+                XmlElement._from_native(sub_element, self._journal, None, self)
                 for sub_element in element
                 if not is_xml_comment(sub_element)
+            ] if (binding := self._binding) is None else [
+                # sub-elements not consumed by any serializer are pruned
+                XmlElement._from_native(sub_element, self._journal, binding[sub_element.tag], self)
+                for sub_element in element
+                if sub_element.tag in binding
             ],
-            sourceline=typing.cast(int, element.sourceline) if element.sourceline is not None else -1,
+            next_element_idx=0,
         )
 
     def to_native(self) -> ElementT:
-        element = etree.Element(
-            self._tag,
-            attrib=self._state.attrib,
-            # https://github.com/lxml/lxml-stubs/issues/76
-            nsmap={ns or None: uri for ns, uri in self._nsmap.items()} if self._nsmap else None,  # type: ignore[misc]
+        return self._to_native(None)
+
+    def _to_native(self, parent_nsmap: Optional[NsMap]) -> ElementT:
+        # namespaces are declared only if the namespace map differs from the parent one
+        element = make_native_element(
+            self._tag, self._nsmap if self._nsmap is not parent_nsmap else None, self._state.attrib,
         )
         element.text = self._state.text
         element.tail = self._state.tail
-        element.extend([element.to_native() for element in self._state.elements])
+        element.extend([
+            typing.cast(XmlElement, sub_element)._to_native(self._nsmap)
+            for sub_element in self._state.elements
+        ])
 
         return element
 
@@ -54,6 +108,403 @@ class XmlElement(BaseXmlElement[ElementT]):
         return self._sourceline
 
 
+class ElementWriter(XmlElementWriter):
+    """
+    Xml element writer building the native element tree directly during the serialization.
+    """
+
+    __slots__ = ('_native', '_nsmap')
+
+    _native: ElementT
+    _nsmap: Optional[NsMap]
+
+    def __init__(self, tag: str, nsmap: Optional[NsMap] = None):
+        self._native = make_native_element(tag, nsmap)
+        self._nsmap = nsmap
+
+    @classmethod
+    def from_native(cls, element: ElementT) -> 'ElementWriter':
+        # the element is copied since appending it to another tree moves it out from the original one
+        return cls._from_native(copy.deepcopy(element))
+
+    @classmethod
+    def _from_native(cls, element: ElementT, nsmap: Optional[NsMap] = None) -> 'ElementWriter':
+        instance = cls.__new__(cls)
+        instance._native = element
+        instance._nsmap = nsmap
+
+        return instance
+
+    def to_native(self) -> ElementT:
+        return self._native
+
+    def is_empty(self) -> bool:
+        element = self._native
+        if not element.text and not element.tail and not element.attrib and len(element) == 0:
+            return True
+        else:
+            return False
+
+    def set_text(self, text: str) -> None:
+        self._native.text = text
+
+    def set_attribute(self, name: str, value: str) -> None:
+        self._native.set(name, value)
+
+    def set_attributes(self, attributes: Dict[str, str]) -> None:
+        attrib = self._native.attrib
+        attrib.clear()
+        for name, value in attributes.items():
+            attrib[name] = value
+
+    def append_element(self, element: XmlElementWriter) -> None:
+        self._native.append(typing.cast(ElementWriter, element)._native)
+
+    def make_element(self, tag: str, nsmap: Optional[NsMap]) -> 'ElementWriter':
+        # namespaces are declared only if the namespace map differs from the parent one,
+        # otherwise they are resolved using the parent declarations when the element is appended
+        native_nsmap = nsmap if nsmap is not self._nsmap else None
+        return ElementWriter._from_native(make_native_element(tag, native_nsmap), nsmap)
+
+    def find_element_or_create(self, tag: str, search_mode: SearchMode, nsmap: Optional[NsMap]) -> 'ElementWriter':
+        # sub-elements are only appended during the serialization so any search mode
+        # can find only the last one (see `XmlElement.find_element_or_create`)
+        element = self._native
+        if len(element) != 0 and (sub_element := element[-1]).tag == tag:
+            return ElementWriter._from_native(sub_element, nsmap)
+
+        native_nsmap = make_native_nsmap(nsmap) if nsmap is not self._nsmap else None
+        return ElementWriter._from_native(
+            # https://github.com/lxml/lxml-stubs/issues/76
+            etree.SubElement(element, tag, nsmap=native_nsmap),  # type: ignore[arg-type]
+            nsmap,
+        )
+
+
+class StreamWriter(ElementWriter):
+    """
+    Root element writer flushing the completed sub-elements to an xml file.
+    Only the last sub-element is kept in memory since it still can be reused by a wrapped field.
+    The sub-elements are serialized as a part of the root element so that the namespaces declared
+    by the root element are not declared by every sub-element once again.
+    """
+
+    __slots__ = ('_file', '_kwargs', '_head', '_end')
+
+    # root element placeholder sub-element used to split the root element start and end tags
+    MARKER = 'pydantic-xml-stream-marker'
+
+    def __init__(self, file: IO[Any], tag: str, nsmap: Optional[NsMap] = None, **kwargs: Any):
+        super().__init__(tag, nsmap)
+        self._file = file
+        self._kwargs = kwargs
+        self._head: Union[str, bytes, None] = None
+        self._end: Union[str, bytes, None] = None
+
+    def set_text(self, text: str) -> None:
+        self._check_not_started()
+        super().set_text(text)
+
+    def set_attribute(self, name: str, value: str) -> None:
+        self._check_not_started()
+        super().set_attribute(name, value)
+
+    def set_attributes(self, attributes: Dict[str, str]) -> None:
+        self._check_not_started()
+        super().set_attributes(attributes)
+
+    def append_element(self, element: XmlElementWriter) -> None:
+        self.flush()
+        super().append_element(element)
+
+    def make_element(self, tag: str, nsmap: Optional[NsMap]) -> 'ElementWriter':
+        return ElementWriter._from_native(make_native_element(tag, self._get_undeclared_nsmap(nsmap)), nsmap)
+
+    def find_element_or_create(self, tag: str, search_mode: SearchMode, nsmap: Optional[NsMap]) -> 'ElementWriter':
+        element = self._native
+        if len(element) != 0 and (sub_element := element[-1]).tag == tag:
+            return ElementWriter._from_native(sub_element, nsmap)
+
+        self.flush()
+        return ElementWriter._from_native(
+            # https://github.com/lxml/lxml-stubs/issues/76
+            etree.SubElement(
+                element, tag, nsmap=make_native_nsmap(self._get_undeclared_nsmap(nsmap)),  # type: ignore[arg-type]
+            ),
+            nsmap,
+        )
+
+    def flush(self) -> None:
+        """
+        Writes the pending sub-elements to the file.
+        """
+
+        element = self._native
+        if len(element) == 0:
+            return
+
+        self._start()
+        assert self._head is not None and self._end is not None
+
+        data = etree.tostring(element, **dict(self._kwargs, xml_declaration=False))
+        self._file.write(data[len(self._head):len(data) - len(self._end)])
+        del element[:]
+
+    def close(self) -> None:
+        """
+        Writes the pending sub-elements and the root element end tag to the file.
+        """
+
+        self.flush()
+        self._start()
+        self._file.write(self._end)
+
+    def _get_undeclared_nsmap(self, nsmap: Optional[NsMap]) -> Optional[NsMap]:
+        # the namespaces declared by the root element are not declared by its sub-elements once again
+        if nsmap is self._nsmap:
+            return None
+        if not nsmap or not self._nsmap:
+            return nsmap
+
+        root_nsmap = self._nsmap
+        return {prefix: uri for prefix, uri in nsmap.items() if root_nsmap.get(prefix) != uri}
+
+    def _start(self) -> None:
+        if self._end is not None:
+            return
+
+        element = self._native
+        shell = make_native_element(element.tag, self._nsmap, typing.cast(Dict[str, str], dict(element.attrib)))
+        shell.text = element.text
+        etree.SubElement(shell, self.MARKER)
+
+        data = etree.tostring(shell, **self._kwargs)
+        start, end = self._split(data, strip=not element.text)
+        self._file.write(data[:start])
+        self._end = data[end:]
+
+        data = etree.tostring(shell, **dict(self._kwargs, xml_declaration=False))
+        start, end = self._split(data, strip=not element.text)
+        self._head = data[:start]
+
+    def _split(self, data: Union[str, bytes], strip: bool) -> Tuple[int, int]:
+        # returns the root element start tag end and the end tag start positions,
+        # the pretty printing indentation is written along with every sub-element
+        if isinstance(data, bytes):
+            start, end = data.index(b'<' + self.MARKER.encode()), data.rindex(b'</')
+        else:
+            start, end = data.index('<' + self.MARKER), data.rindex('</')
+
+        if strip:
+            start, end = len(data[:start].rstrip()), len(data[:end].rstrip())
+
+        return start, end
+
+    def _check_not_started(self) -> None:
+        if self._end is not None:
+            raise errors.SerializationError("root element text and attributes can't be set after its sub-elements")
+
+
+@contextlib.contextmanager
+def xmlstream(file: Any, tag: str, nsmap: Optional[NsMap], **kwargs: Any) -> Iterator[StreamWriter]:
+    """
+    Opens an xml stream writing the root element sub-elements to the file as soon as they are completed.
+
+    :param file: file name or file object
+    :param tag: root element tag
+    :param nsmap: root element namespace map
+    :param kwargs: additional `lxml.etree.tostring` arguments
+    :return: root element writer
+    """
+
+    with contextlib.ExitStack() as stack:
+        if not hasattr(file, 'write'):
+            file = stack.enter_context(open(file, 'w' if kwargs.get('encoding') == 'unicode' else 'wb'))
+
+        writer = StreamWriter(file, tag, nsmap, **kwargs)
+        yield writer
+        writer.close()
+
+
+def make_native_element(tag: str, nsmap: Optional[NsMap], attrib: Optional[Dict[str, str]] = None) -> ElementT:
+    # https://github.com/lxml/lxml-stubs/issues/76
+    return etree.Element(tag, attrib=attrib, nsmap=make_native_nsmap(nsmap))  # type: ignore[arg-type]
+
+
+# native maps of the frozen namespace maps (the frozen map is kept so that its id is not reused)
+_native_nsmaps: Dict[int, Tuple[FrozenNsMap, Dict[Optional[str], str]]] = {}
+
+
+def make_native_nsmap(nsmap: Optional[NsMap]) -> Optional[Dict[Optional[str], str]]:
+    if not nsmap:
+        return None
+
+    if isinstance(nsmap, FrozenNsMap):
+        if (entry := _native_nsmaps.get(id(nsmap))) is None or entry[0] is not nsmap:
+            entry = _native_nsmaps[id(nsmap)] = (nsmap, {ns or None: uri for ns, uri in nsmap.items()})
+
+        return entry[1]
+
+    return {ns or None: uri for ns, uri in nsmap.items()}
+
+
+class ParserPool:
+    """
+    Thread-local pool of pre-configured xml parsers. A parser can't be used by several threads
+    simultaneously so every thread reuses its own one.
+
+    :param options: xml parser options (see :py:class:`lxml.etree.XMLParser`)
+    """
+
+    def __init__(self, **options: Any):
+        self._options = options
+        self._local = threading.local()
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """
+        Parser options supported by the backend.
+        """
+
+        return self._options
+
+    def get_parser(self, **options: Any) -> etree.XMLParser:
+        """
+        Returns the current thread parser. If options are provided a new parser is created
+        with the pool options overridden by them.
+
+        :param options: parser options overriding the pool ones
+        """
+
+        if options:
+            return etree.XMLParser(**dict(self._options, **options))
+
+        if (parser := getattr(self._local, 'parser', None)) is None:
+            parser = self._local.parser = etree.XMLParser(**self._options)
+
+        return parser
+
+    def parse(self, source: XmlSource, **kwargs: Any) -> ElementT:
+        """
+        Parses an xml document.
+
+        :param source: xml string or buffer
+        :param kwargs: parser options overriding the pool ones and document arguments (`base_url`)
+        :return: root element
+        """
+
+        document_kwargs, parser_kwargs = _split_document_kwargs(kwargs)
+
+        # lxml parses any buffer protocol object while the stubs declare str and bytes only
+        return etree.fromstring(source, self.get_parser(**parser_kwargs), **document_kwargs)  # type: ignore[arg-type]
+
+    def parse_file(self, source: Union[str, 'os.PathLike[str]', IO[bytes]], **kwargs: Any) -> ElementT:
+        """
+        Parses an xml document reading it right from a file.
+
+        :param source: xml file name or file object
+        :param kwargs: parser options overriding the pool ones and document arguments (`base_url`)
+        :return: root element
+        """
+
+        document_kwargs, parser_kwargs = _split_document_kwargs(kwargs)
+
+        return etree.parse(source, self.get_parser(**parser_kwargs), **document_kwargs).getroot()
+
+
+def parse_events(source: XmlSource, binding: Optional[ElementBinding] = None, **kwargs: Any) -> XmlElement:
+    """
+    Parses an xml document building the element tree right from the parser events.
+
+    :param source: xml string or buffer
+    :param binding: root element sub-elements binding
+    :param kwargs: additional parser arguments and document arguments (`base_url`)
+    :return: root element
+    """
+
+    document_kwargs, parser_kwargs = _split_document_kwargs(kwargs)
+
+    # the builder accepts text events only while the stubs target protocol expects bytes as well
+    parser = etree.XMLParser(
+        target=XmlElementBuilder(XmlElement, binding), **parser_kwargs,  # type: ignore[arg-type]
+    )
+
+    return typing.cast(XmlElement, etree.fromstring(source, parser, **document_kwargs))  # type: ignore[arg-type]
+
+
+def _split_document_kwargs(kwargs: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    document_kwargs: Dict[str, Any] = {}
+    parser_kwargs: Dict[str, Any] = {}
+    for name, value in kwargs.items():
+        if name in DOCUMENT_OPTIONS:
+            document_kwargs[name] = value
+        else:
+            parser_kwargs[name] = value
+
+    return document_kwargs, parser_kwargs
+
+
+def iterparse(source: Any, tag: str, **kwargs: Any) -> Iterator[ElementT]:
+    """
+    Incrementally parses an xml document yielding the elements matching `tag` as soon as they are closed.
+    Every yielded element and its already processed siblings are cleared after the consumer resumes iteration.
+
+    :param source: xml file name or file object
+    :param tag: tag of the elements to be yielded
+    :param kwargs: additional parser arguments
+    :return: element iterator
+    """
+
+    for _, element in etree.iterparse(source, events=('end',), tag=tag, **kwargs):
+        yield element
+
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+
+
+class PullParser:
+    """
+    Incremental xml parser fed by data chunks. Yields the elements matching `tag` as soon as they are closed.
+    Every yielded element and its already processed siblings are cleared after the consumer resumes iteration.
+
+    :param tag: tag of the elements to be yielded
+    :param kwargs: additional parser arguments
+    """
+
+    def __init__(self, tag: str, **kwargs: Any):
+        self._parser = etree.XMLPullParser(events=('end',), tag=tag, **kwargs)
+
+    def feed(self, data: Union[str, bytes]) -> Iterator[ElementT]:
+        """
+        Feeds the parser with a data chunk.
+
+        :param data: xml document chunk
+        :return: iterator over the elements closed by the chunk
+        """
+
+        self._parser.feed(data)
+        return self._read_elements()
+
+    def close(self) -> Iterator[ElementT]:
+        """
+        Finishes the document parsing.
+
+        :return: iterator over the remaining closed elements
+        """
+
+        self._parser.close()
+        return self._read_elements()
+
+    def _read_elements(self) -> Iterator[ElementT]:
+        for _, element in typing.cast(Iterator[Tuple[str, Any]], self._parser.read_events()):
+            yield element
+
+            element.clear(keep_tail=True)
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+
 def force_str(val: Union[str, bytes]) -> str:
     if isinstance(val, bytes):
         return val.decode()
@@ -1,31 +1,79 @@
+import contextlib
+import copy
+import os
+import typing
 import xml.etree.ElementTree as etree
-from typing import Optional
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple, Union
 
+from pydantic_xml import errors
+from pydantic_xml.element import Journal, SearchMode
 from pydantic_xml.element import XmlElement as BaseXmlElement
-from pydantic_xml.typedefs import NsMap
+from pydantic_xml.element import XmlElementBuilder, XmlElementWriter
+from pydantic_xml.typedefs import ElementBinding, NsMap, XmlSource
 
 __all__ = (
     'ElementT',
+    'ElementWriter',
     'XmlElement',
     'etree',
+    'iterparse',
+    'parse_events',
+    'ParserPool',
+    'PullParser',
+    'xmlstream',
 )
 
 ElementT = etree.Element
 
 
 class XmlElement(BaseXmlElement[ElementT]):
+    __slots__ = ('_native', '_binding')
+
+    _native: ElementT
+    _binding: Optional[ElementBinding]
+
+    @classmethod
+    def from_native(cls, element: ElementT, binding: Optional[ElementBinding] = None) -> 'XmlElement':
+        return cls._from_native(element, Journal(), binding)
+
     @classmethod
-    def from_native(cls, element: ElementT) -> 'XmlElement':
-        return cls(
-            tag=element.tag,
+    def _from_native(
+            cls,
+            element: ElementT,
+            journal: Optional[Journal],
+            binding: Optional[ElementBinding],
+            parent: Optional['XmlElement'] = None,
+    ) -> 'XmlElement':
+        # the element state is loaded on the first access so that untouched sub-trees are never copied
+        instance = cls.__new__(cls)
+        instance._tag = element.tag
+        instance._nsmap = None
+        instance._sourceline = -1
+        instance._native = element
+        instance._journal = journal
+        instance._binding = binding
+        instance._parent = parent
+
+        return instance
+
+    def _load_state(self) -> BaseXmlElement.State[ElementT]:
+        element = self._native
+
+        return BaseXmlElement.State(
             text=element.text,
             tail=element.tail,
-            attributes=dict(element.attrib),
+            attrib=dict(element.attrib),
             elements=[
-                XmlElement.from_native(sub_element)
+                XmlElement._from_native(sub_element, self._journal, None, self)
                 for sub_element in element
                 if not is_xml_comment(sub_element)
+            ] if (binding := self._binding) is None else [
+                # sub-elements not consumed by any serializer are pruned
+                XmlElement._from_native(sub_element, self._journal, binding[sub_element.tag], self)
+                for sub_element in element
+                if sub_element.tag in binding
             ],
+            next_element_idx=0,
         )
 
     def to_native(self) -> ElementT:
@@ -43,5 +91,349 @@ class XmlElement(BaseXmlElement[ElementT]):
         return -1
 
 
+class ElementWriter(XmlElementWriter):
+    """
+    Xml element writer building the native element tree directly during the serialization.
+    """
+
+    __slots__ = ('_native',)
+
+    _native: ElementT
+
+    def __init__(self, tag: str, nsmap: Optional[NsMap] = None):
+        self._native = etree.Element(tag)
+
+    @classmethod
+    def from_native(cls, element: ElementT) -> 'ElementWriter':
+        # the element is copied so that the resulting tree doesn't share sub-elements with the original one
+        return cls._from_native(copy.deepcopy(element))
+
+    @classmethod
+    def _from_native(cls, element: ElementT) -> 'ElementWriter':
+        instance = cls.__new__(cls)
+        instance._native = element
+
+        return instance
+
+    def to_native(self) -> ElementT:
+        return self._native
+
+    def is_empty(self) -> bool:
+        element = self._native
+        if not element.text and not element.tail and not element.attrib and len(element) == 0:
+            return True
+        else:
+            return False
+
+    def set_text(self, text: str) -> None:
+        self._native.text = text
+
+    def set_attribute(self, name: str, value: str) -> None:
+        self._native.set(name, value)
+
+    def set_attributes(self, attributes: Dict[str, str]) -> None:
+        self._native.attrib = dict(attributes)
+
+    def append_element(self, element: XmlElementWriter) -> None:
+        self._native.append(typing.cast(ElementWriter, element)._native)
+
+    def make_element(self, tag: str, nsmap: Optional[NsMap]) -> 'ElementWriter':
+        return ElementWriter(tag, nsmap)
+
+    def find_element_or_create(self, tag: str, search_mode: SearchMode, nsmap: Optional[NsMap]) -> 'ElementWriter':
+        # sub-elements are only appended during the serialization so any search mode
+        # can find only the last one (see `XmlElement.find_element_or_create`)
+        element = self._native
+        if len(element) != 0 and (sub_element := element[-1]).tag == tag:
+            return ElementWriter._from_native(sub_element)
+
+        return ElementWriter._from_native(etree.SubElement(element, tag))
+
+
+class StreamWriter(ElementWriter):
+    """
+    Root element writer flushing the completed sub-elements to an xml file.
+    Only the last sub-element is kept in memory since it still can be reused by a wrapped field.
+    The sub-elements are serialized as a part of the root element so that the namespaces declared
+    by the root element are not declared by every sub-element once again.
+    """
+
+    __slots__ = ('_file', '_kwargs', '_head', '_end')
+
+    # root element placeholder sub-element used to split the root element start and end tags
+    MARKER = 'pydantic-xml-stream-marker'
+
+    def __init__(self, file: IO[Any], tag: str, nsmap: Optional[NsMap] = None, **kwargs: Any):
+        super().__init__(tag, nsmap)
+        self._file = file
+        self._kwargs = kwargs
+        self._head: Union[str, bytes, None] = None
+        self._end: Union[str, bytes, None] = None
+
+    def set_text(self, text: str) -> None:
+        self._check_not_started()
+        super().set_text(text)
+
+    def set_attribute(self, name: str, value: str) -> None:
+        self._check_not_started()
+        super().set_attribute(name, value)
+
+    def set_attributes(self, attributes: Dict[str, str]) -> None:
+        self._check_not_started()
+        super().set_attributes(attributes)
+
+    def append_element(self, element: XmlElementWriter) -> None:
+        self.flush()
+        super().append_element(element)
+
+    def find_element_or_create(self, tag: str, search_mode: SearchMode, nsmap: Optional[NsMap]) -> 'ElementWriter':
+        element = self._native
+        if len(element) == 0 or element[-1].tag != tag:
+            self.flush()
+
+        return super().find_element_or_create(tag, search_mode, nsmap)
+
+    def flush(self) -> None:
+        """
+        Writes the pending sub-elements to the file.
+        """
+
+        element = self._native
+        if len(element) == 0:
+            return
+
+        self._start()
+        assert self._head is not None and self._end is not None
+
+        kwargs = dict(self._kwargs, xml_declaration=False)
+        data = etree.tostring(element, **kwargs)
+        # all the namespaces are declared by the serialized element, if the sub-elements use
+        # the namespaces not declared by the root element they are serialized separately
+        if data.startswith(self._head) and data.endswith(self._end):
+            self._file.write(data[len(self._head):len(data) - len(self._end)])
+        else:
+            for sub_element in element:
+                self._file.write(etree.tostring(sub_element, **kwargs))
+
+        del element[:]
+
+    def close(self) -> None:
+        """
+        Writes the pending sub-elements and the root element end tag to the file.
+        """
+
+        self.flush()
+        self._start()
+        self._file.write(self._end)
+
+    def _start(self) -> None:
+        if self._end is not None:
+            return
+
+        element = self._native
+        shell = etree.Element(element.tag, element.attrib)
+        shell.text = element.text
+        etree.SubElement(shell, self.MARKER)
+
+        data = etree.tostring(shell, **self._kwargs)
+        start, end = self._split(data)
+        self._file.write(data[:start])
+        self._end = data[end:]
+
+        data = etree.tostring(shell, **dict(self._kwargs, xml_declaration=False))
+        start, end = self._split(data)
+        self._head = data[:start]
+
+    def _split(self, data: Union[str, bytes]) -> Tuple[int, int]:
+        # returns the root element start tag end and the end tag start positions
+        if isinstance(data, bytes):
+            return data.index(b'<' + self.MARKER.encode()), data.rindex(b'</')
+        else:
+            return data.index('<' + self.MARKER), data.rindex('</')
+
+    def _check_not_started(self) -> None:
+        if self._end is not None:
+            raise errors.SerializationError("root element text and attributes can't be set after its sub-elements")
+
+
+@contextlib.contextmanager
+def xmlstream(file: Any, tag: str, nsmap: Optional[NsMap], **kwargs: Any) -> Iterator[StreamWriter]:
+    """
+    Opens an xml stream writing the root element sub-elements to the file as soon as they are completed.
+
+    :param file: file name or file object
+    :param tag: root element tag
+    :param nsmap: root element namespace map
+    :param kwargs: additional `xml.etree.ElementTree.tostring` arguments
+    :return: root element writer
+    """
+
+    with contextlib.ExitStack() as stack:
+        if not hasattr(file, 'write'):
+            file = stack.enter_context(open(file, 'w' if kwargs.get('encoding') == 'unicode' else 'wb'))
+
+        writer = StreamWriter(file, tag, nsmap, **kwargs)
+        yield writer
+        writer.close()
+
+
+class ParserPool:
+    """
+    Pre-configured xml parsers factory. Standard library parsers can't be reused
+    so a new parser is created for every document. Options not supported by the standard library parser
+    (`lxml` specific ones) are ignored.
+
+    :param options: xml parser options (see :py:class:`xml.etree.ElementTree.XMLParser`)
+    """
+
+    SUPPORTED_OPTIONS = frozenset(('encoding',))
+
+    def __init__(self, **options: Any):
+        self._options = {name: value for name, value in options.items() if name in self.SUPPORTED_OPTIONS}
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """
+        Parser options supported by the backend.
+        """
+
+        return self._options
+
+    def get_parser(self, **options: Any) -> etree.XMLParser:
+        """
+        Returns a new parser.
+
+        :param options: parser options overriding the pool ones
+        """
+
+        return etree.XMLParser(**dict(self._options, **options))
+
+    def parse(self, source: XmlSource, **kwargs: Any) -> ElementT:
+        """
+        Parses an xml document.
+
+        :param source: xml string or buffer
+        :param kwargs: parser options overriding the pool ones
+        :return: root element
+        """
+
+        return etree.fromstring(source, self.get_parser(**kwargs))
+
+    def parse_file(self, source: Union[str, 'os.PathLike[str]', IO[bytes]], **kwargs: Any) -> ElementT:
+        """
+        Parses an xml document reading it right from a file.
+
+        :param source: xml file name or file object
+        :param kwargs: parser options overriding the pool ones
+        :return: root element
+        """
+
+        return etree.parse(source, self.get_parser(**kwargs)).getroot()
+
+
+def parse_events(source: XmlSource, binding: Optional[ElementBinding] = None, **kwargs: Any) -> XmlElement:
+    """
+    Parses an xml document building the element tree right from the parser events.
+
+    :param source: xml string or buffer
+    :param binding: root element sub-elements binding
+    :param kwargs: additional parser arguments
+    :return: root element
+    """
+
+    # the default parser drops comments so the text around them is merged
+    parser = etree.XMLParser(target=XmlElementBuilder(XmlElement, binding, drop_comments_tails=False), **kwargs)
+    parser.feed(source)
+
+    return typing.cast(XmlElement, parser.close())
+
+
+def iterparse(source: Any, tag: str, **kwargs: Any) -> Iterator[ElementT]:
+    """
+    Incrementally parses an xml document yielding the elements matching `tag` as soon as they are closed.
+    Every yielded element and its already processed siblings are cleared and detached from their parent
+    after the consumer resumes iteration.
+
+    :param source: xml file name or file object
+    :param tag: tag of the elements to be yielded
+    :param kwargs: additional parser arguments
+    :return: element iterator
+    """
+
+    parents: List[ElementT] = []
+    for event, element in etree.iterparse(source, events=('start', 'end'), **kwargs):
+        if event == 'start':
+            parents.append(element)
+            continue
+
+        parents.pop()
+        if element.tag == tag:
+            yield element
+
+            element.clear()
+            if parents:
+                _remove_processed_children(parents[-1], element)
+
+
+class PullParser:
+    """
+    Incremental xml parser fed by data chunks. Yields the elements matching `tag` as soon as they are closed.
+    Every yielded element and its already processed siblings are cleared and detached from their parent
+    after the consumer resumes iteration.
+
+    :param tag: tag of the elements to be yielded
+    :param kwargs: additional parser arguments
+    """
+
+    def __init__(self, tag: str, **kwargs: Any):
+        self._parser = etree.XMLPullParser(events=('start', 'end'), **kwargs)
+        self._tag = tag
+        self._parents: List[ElementT] = []
+
+    def feed(self, data: Union[str, bytes]) -> Iterator[ElementT]:
+        """
+        Feeds the parser with a data chunk.
+
+        :param data: xml document chunk
+        :return: iterator over the elements closed by the chunk
+        """
+
+        self._parser.feed(data)
+        return self._read_elements()
+
+    def close(self) -> Iterator[ElementT]:
+        """
+        Finishes the document parsing.
+
+        :return: iterator over the remaining closed elements
+        """
+
+        self._parser.close()
+        return self._read_elements()
+
+    def _read_elements(self) -> Iterator[ElementT]:
+        parents = self._parents
+        for event, element in typing.cast(Iterator[Tuple[str, ElementT]], self._parser.read_events()):
+            if event == 'start':
+                parents.append(element)
+                continue
+
+            parents.pop()
+            if element.tag == self._tag:
+                yield element
+
+                element.clear()
+                if parents:
+                    _remove_processed_children(parents[-1], element)
+
+
+def _remove_processed_children(parent: ElementT, element: ElementT) -> None:
+    # the parser may have already built the following siblings so only the preceding ones are removed
+    for idx, child in enumerate(parent):
+        if child is element:
+            del parent[:idx + 1]
+            break
+
+
 def is_xml_comment(element: ElementT) -> bool:
     return element.tag is etree.Comment  # type: ignore[comparison-overlap]
@@ -1,5 +1,12 @@
+import functools
+import inspect
+import os
+import threading
 import typing
-from typing import Any, Callable, ClassVar, Dict, Generic, Optional, Tuple, Type, TypeVar, Union
+import weakref
+from concurrent.futures import Executor
+from typing import IO, Any, AsyncIterable, AsyncIterator, Callable, ClassVar, Dict, Generic, Iterable, Iterator, List
+from typing import Optional, Tuple, Type, TypeVar, Union
 
 import pydantic as pd
 import pydantic_core as pdc
@@ -9,11 +16,11 @@ from pydantic import BaseModel, RootModel
 from . import config, errors, utils
 from .compat import ModelMetaclass, RootModelMetaclass
 from .element import SearchMode, XmlElementReader, XmlElementWriter
-from .element.native import ElementT, XmlElement, etree
+from .element.native import ElementWriter, ParserPool, PullParser, XmlElement, etree, iterparse, parse_events, xmlstream
 from .fields import XmlEntityInfo, XmlFieldSerializer, XmlFieldValidator, attr, element, wrapped
 from .serializers.factories.model import BaseModelSerializer
-from .serializers.serializer import Serializer
-from .typedefs import EntityLocation
+from .serializers.serializer import Serializer, ValidationMode, encode_fallback
+from .typedefs import AsyncReader, Compression, EntityLocation, XmlSource
 from .utils import NsMap
 
 __all__ = (
@@ -26,6 +33,7 @@ __all__ = (
     'ValidatorFunc',
     'ValidatorFuncT',
     'XmlModelMeta',
+    'build_serializers',
 )
 
 
@@ -41,6 +49,8 @@ def create_model(
         __ns_attrs__: Optional[bool] = None,
         __skip_empty__: Optional[bool] = None,
         __search_mode__: Optional[SearchMode] = None,
+        __lazy_serializer__: Optional[bool] = None,
+        __parser_options__: Optional[Dict[str, Any]] = None,
         __base__: Union[Type[Model], Tuple[Type[Model], ...], None] = None,
         __module__: Optional[str] = None,
         **kwargs: Any,
@@ -55,6 +65,8 @@ def create_model(
     :param __ns_attrs__: use namespaced attributes
     :param __skip_empty__: skip empty elements (elements without sub-elements, attributes and text)
     :param __search_mode__: element search mode
+    :param __lazy_serializer__: build the model serializer on the first use
+    :param __parser_options__: xml parser options
     :param __base__: model base class
     :param __module__: module name that the model belongs to
     :param kwargs: pydantic model creation arguments.
@@ -72,6 +84,8 @@ def create_model(
     cls_kwargs['ns_attrs'] = __ns_attrs__
     cls_kwargs['skip_empty'] = __skip_empty__
     cls_kwargs['search_mode'] = __search_mode__
+    cls_kwargs['lazy_serializer'] = __lazy_serializer__
+    cls_kwargs['parser_options'] = __parser_options__
 
     model_base: Union[Type[BaseModel], Tuple[Type[BaseModel], ...]] = __base__ or BaseXmlModel
 
@@ -128,8 +142,9 @@ class XmlModelMeta(ModelMetaclass):
         # find custom validators/serializers in all defined attributes
         # though we want to skip any BaseModel attributes, as these can never be field
         # serializers/validators, and getting certain pydantic fields
-        # may cause recursion errors for recursive / self-referential models
-        for attr_name in set(dir(cls)) - set(dir(BaseModel)):
+        # may cause recursion errors for recursive / self-referential models.
+        # The serializer is skipped too since getting it builds a lazy serializer.
+        for attr_name in set(dir(cls)) - set(dir(BaseModel)) - {'__xml_serializer__'}:
             if func := getattr(cls, attr_name, None):
                 if fields := getattr(func, '__xml_field_serializer__', None):
                     for field in fields:
@@ -139,6 +154,56 @@ class XmlModelMeta(ModelMetaclass):
                         cls.__xml_field_validators__[field] = func
 
 
+# lazy serializers that have not been built yet
+_lazy_serializers: 'weakref.WeakSet[LazySerializer]' = weakref.WeakSet()
+_lazy_serializers_lock = threading.Lock()
+
+
+class LazySerializer:
+    """
+    Model serializer descriptor. Builds the model serializer on the first access
+    and replaces itself with the built serializer.
+
+    :param model: model class the serializer is built for
+    """
+
+    def __init__(self, model: Type['BaseXmlModel']):
+        self._model = model
+        self._lock = threading.Lock()
+
+        with _lazy_serializers_lock:
+            _lazy_serializers.add(self)
+
+    def __get__(self, instance: Any, owner: Type['BaseXmlModel']) -> Optional[BaseModelSerializer]:
+        self.build()
+        return self._model.__xml_serializer__
+
+    def build(self) -> None:
+        """
+        Builds the model serializer if it has not been built yet.
+        """
+
+        with self._lock:
+            if inspect.getattr_static(self._model, '__xml_serializer__') is self:
+                self._model.__build_serializer__(lazy=False)
+
+        with _lazy_serializers_lock:
+            _lazy_serializers.discard(self)
+
+
+def build_serializers() -> None:
+    """
+    Builds all the lazy model serializers that have not been built yet.
+    Can be used to report model definition errors eagerly (in tests for example).
+    """
+
+    with _lazy_serializers_lock:
+        lazy_serializers = list(_lazy_serializers)
+
+    for lazy_serializer in lazy_serializers:
+        lazy_serializer.build()
+
+
 ModelT = TypeVar('ModelT', bound='BaseXmlModel')
 ValidatorFuncT = Callable[[Type[ModelT], XmlElementReader, str], Any]
 ValidatorFunc = ValidatorFuncT['BaseXmlModel']
@@ -157,6 +222,8 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
     __xml_ns_attrs__: ClassVar[bool]
     __xml_skip_empty__: ClassVar[Optional[bool]]
     __xml_search_mode__: ClassVar[SearchMode]
+    __xml_lazy_serializer__: ClassVar[Optional[bool]] = None
+    __xml_parser__: ClassVar[Optional[Any]] = None  # native backend `ParserPool`
     __xml_serializer__: ClassVar[Optional[BaseModelSerializer]] = None
 
     __xml_field_validators__: ClassVar[Dict[str, ValidatorFunc]] = {}
@@ -170,6 +237,8 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
             ns_attrs: Optional[bool] = None,
             skip_empty: Optional[bool] = None,
             search_mode: Optional[SearchMode] = None,
+            lazy_serializer: Optional[bool] = None,
+            parser_options: Optional[Dict[str, Any]] = None,
             **kwargs: Any,
     ):
         """
@@ -181,6 +250,10 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
         :param ns_attrs: use namespaced attributes
         :param skip_empty: skip empty elements (elements without sub-elements, attributes and text)
         :param search_mode: element search mode
+        :param lazy_serializer: build the model serializer on the first use instead of the model creation.
+                                If omitted the `LAZY_SERIALIZERS` config variable is used
+        :param parser_options: xml parser options (`huge_tree`, `remove_comments` and so on).
+                               The configured parsers are reused by `from_xml` calls of the model and its subclasses
         """
 
         super().__init_subclass__(**kwargs)
@@ -191,6 +264,10 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
         cls.__xml_skip_empty__ = skip_empty if skip_empty is not None else getattr(cls, '__xml_skip_empty__', None)
         cls.__xml_search_mode__ = search_mode if search_mode is not None \
             else getattr(cls, '__xml_search_mode__', SearchMode.STRICT)
+        cls.__xml_lazy_serializer__ = lazy_serializer if lazy_serializer is not None \
+            else getattr(cls, '__xml_lazy_serializer__', None)
+        cls.__xml_parser__ = ParserPool(**parser_options) if parser_options is not None \
+            else getattr(cls, '__xml_parser__', None)
 
         if parent_nsmap := getattr(cls, '__xml_nsmap__', None):
             cls.__xml_nsmap__ = dict(parent_nsmap, **(nsmap or {}))
@@ -201,7 +278,13 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
         cls.__xml_field_validators__ = {}
 
     @classmethod
-    def __build_serializer__(cls) -> None:
+    def __build_serializer__(cls, lazy: Optional[bool] = None) -> None:
+        """
+        Builds the model serializer.
+
+        :param lazy: defer the serializer building until the first use
+        """
+
         if cls is BaseXmlModel:
             return
 
@@ -219,7 +302,12 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
         if config.REGISTER_NS_PREFIXES and cls.__xml_nsmap__:
             utils.register_nsmap(cls.__xml_nsmap__)
 
-        if cls.__pydantic_complete__:  # checks that all forward refs are resolved
+        if lazy is None:
+            lazy = cls.__xml_lazy_serializer__ if cls.__xml_lazy_serializer__ is not None else config.LAZY_SERIALIZERS
+
+        if cls.__pydantic_complete__ and lazy:
+            cls.__xml_serializer__ = LazySerializer(cls)  # type: ignore[assignment]
+        elif cls.__pydantic_complete__:  # checks that all forward refs are resolved
             serializer = Serializer.parse_core_schema(
                 schema=cls.__pydantic_core_schema__,
                 ctx=Serializer.Context(
@@ -243,7 +331,8 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
     def model_rebuild(cls, **kwargs: Any) -> None:
         super().model_rebuild(**kwargs)
 
-        if cls.__xml_serializer__ is None and cls.__pydantic_complete__:
+        # the serializer is checked statically since getting it builds a lazy serializer
+        if inspect.getattr_static(cls, '__xml_serializer__') is None and cls.__pydantic_complete__:
             cls.__build_serializer__()
 
     @classmethod
@@ -252,6 +341,9 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
             root: etree.Element,
             context: Optional[Dict[str, Any]] = None,
             empty_as_string: bool = False,
+            track_sourcelines: bool = True,
+            validate: bool = True,
+            validate_once: bool = False,
     ) -> ModelT:
         """
         Deserializes an xml element tree to an object of `cls` type.
@@ -259,21 +351,42 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
         :param root: xml element to deserialize the object from
         :param context: pydantic validation context
         :param empty_as_string: deserialize empty element data as empty string not None
+        :param track_sourcelines: track elements source lines during deserialization, if disabled the source lines
+                                  are restored by deserializing the tree once again only if a validation error occurs
+        :param validate: validate the deserialized data, if disabled the models are constructed without validation
+                         coercing the data to the fields types (use it for trusted documents only)
+        :param validate_once: validate the whole document in a single pydantic call instead of validating
+                              every sub-model separately
         :return: deserialized object
         """
 
         assert cls.__xml_serializer__ is not None, f"model {cls.__name__} is partially initialized"
 
         if root.tag == cls.__xml_serializer__.element_name:
-            obj = typing.cast(
-                ModelT, cls.__xml_serializer__.deserialize(
-                    XmlElement.from_native(root),
+            try:
+                obj = typing.cast(
+                    ModelT, cls.__xml_serializer__.deserialize(
+                        XmlElement.from_native(root, cls.__xml_serializer__.element_binding),
+                        context=context,
+                        sourcemap={} if track_sourcelines else None,
+                        loc=(),
+                        empty_as_string=empty_as_string,
+                        validation=_get_validation_mode(validate, validate_once),
+                    ),
+                )
+            except pd.ValidationError:
+                if track_sourcelines:
+                    raise
+
+                return cls.from_xml_tree(
+                    root,
                     context=context,
-                    sourcemap={},
-                    loc=(),
                     empty_as_string=empty_as_string,
-                ),
-            )
+                    track_sourcelines=True,
+                    validate=validate,
+                    validate_once=validate_once,
+                )
+
             return obj
         else:
             raise errors.ParsingError(
@@ -283,29 +396,289 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
     @classmethod
     def from_xml(
             cls: Type[ModelT],
-            source: Union[str, bytes],
+            source: XmlSource,
             context: Optional[Dict[str, Any]] = None,
             empty_as_string: bool = False,
+            track_sourcelines: bool = True,
+            engine: te.Literal['tree', 'events'] = 'tree',
+            validate: bool = True,
+            validate_once: bool = False,
             **kwargs: Any,
     ) -> ModelT:
         """
         Deserializes an xml string to an object of `cls` type.
 
-        :param source: xml string
+        :param source: xml string or a buffer protocol object (`bytearray`, `memoryview`, `mmap.mmap`) parsed
+                       without copying
         :param context: pydantic validation context
         :param empty_as_string: deserialize empty element data as empty string not None
-        :param kwargs: additional xml deserialization arguments
+        :param track_sourcelines: track elements source lines during deserialization, if disabled the source lines
+                                  are restored by deserializing the document once again only if a validation error
+                                  occurs (`tree` engine only)
+        :param engine: deserialization engine: `tree` parses the document to a native element tree first,
+                       `events` builds the deserialized element tree right from the parser events skipping
+                       the sub-elements not bound to the model (source lines are not available in that mode)
+        :param validate: validate the deserialized data, if disabled the models are constructed without validation
+                         coercing the data to the fields types (use it for trusted documents only)
+        :param validate_once: validate the whole document in a single pydantic call instead of validating
+                              every sub-model separately
+        :param kwargs: additional xml deserialization arguments (xml parser arguments for `events` engine).
+                       The xml parser arguments override the model parser options
         :return: deserialized object
         """
 
+        parser = cls.__xml_parser__
+
+        if engine == 'events':
+            serializer = cls.__xml_serializer__
+            assert serializer is not None, f"model {cls.__name__} is partially initialized"
+
+            parser_options = dict(parser.options, **kwargs) if parser is not None else kwargs
+            root = parse_events(source, serializer.element_binding, **parser_options)
+            if root.tag != serializer.element_name:
+                raise errors.ParsingError(
+                    f"root element not found (actual: {root.tag}, expected: {serializer.element_name})",
+                )
+
+            # source lines are not available so the document is not deserialized once again on errors
+            return typing.cast(
+                ModelT, serializer.deserialize(
+                    root,
+                    context=context,
+                    sourcemap={} if track_sourcelines else None,
+                    loc=(),
+                    empty_as_string=empty_as_string,
+                    validation=_get_validation_mode(validate, validate_once),
+                ),
+            )
+
+        elif engine != 'tree':
+            raise ValueError(f"unknown deserialization engine: {engine}")
+
         return cls.from_xml_tree(
-            etree.fromstring(source, **kwargs),
+            parser.parse(source, **kwargs) if parser is not None else etree.fromstring(source, **kwargs),
             empty_as_string=empty_as_string,
             context=context,
+            track_sourcelines=track_sourcelines,
+            validate=validate,
+            validate_once=validate_once,
         )
 
+    @classmethod
+    def from_xml_file(
+            cls: Type[ModelT],
+            source: Union[str, 'os.PathLike[str]', IO[bytes]],
+            context: Optional[Dict[str, Any]] = None,
+            empty_as_string: bool = False,
+            track_sourcelines: bool = True,
+            validate: bool = True,
+            validate_once: bool = False,
+            compression: Optional[Compression] = None,
+            **kwargs: Any,
+    ) -> ModelT:
+        """
+        Deserializes an xml file to an object of `cls` type. The file is read by the xml parser directly
+        without loading the whole document into a string first.
+
+        :param source: xml file name, path or binary file object
+        :param context: pydantic validation context
+        :param empty_as_string: deserialize empty element data as empty string not None
+        :param track_sourcelines: track elements source lines during deserialization, if disabled the source lines
+                                  are restored by deserializing the document once again only if a validation error
+                                  occurs
+        :param validate: validate the deserialized data, if disabled the models are constructed without validation
+                         coercing the data to the fields types (use it for trusted documents only)
+        :param validate_once: validate the whole document in a single pydantic call instead of validating
+                              every sub-model separately
+        :param compression: file compression (`gzip`, `bz2`, `xz` or `zstd`), `infer` to detect it
+                            by the file name extension. The file is decompressed incrementally as the parser reads it
+        :param kwargs: additional xml deserialization arguments. The xml parser arguments override
+                       the model parser options
+        :return: deserialized object
+        """
+
+        parser = cls.__xml_parser__
+
+        with utils.open_compressed(source, 'rb', compression) as file:
+            if parser is not None:
+                root = parser.parse_file(file, **kwargs)
+            else:
+                root = etree.parse(file, **kwargs).getroot()
+
+        return cls.from_xml_tree(
+            root,
+            empty_as_string=empty_as_string,
+            context=context,
+            track_sourcelines=track_sourcelines,
+            validate=validate,
+            validate_once=validate_once,
+        )
+
+    @classmethod
+    def from_xml_many(
+            cls: Type[ModelT],
+            sources: Iterable[XmlSource],
+            executor: Optional[Executor] = None,
+            chunksize: int = 1,
+            context: Optional[Dict[str, Any]] = None,
+            empty_as_string: bool = False,
+            **kwargs: Any,
+    ) -> List[Union[ModelT, Exception]]:
+        """
+        Deserializes a batch of xml strings to objects of `cls` type.
+        The strings are deserialized using the provided executor (`concurrent.futures.ThreadPoolExecutor`
+        or `concurrent.futures.ProcessPoolExecutor`) or sequentially if the executor is not provided.
+        A process pool requires the model to be importable by the worker processes (defined at a module level).
+
+        Deserialization errors don't abort the batch: a failed item result is the error it failed with
+        (`pydantic.ValidationError` or :py:class:`pydantic_xml.errors.ParsingError` for xml syntax errors).
+        Other errors are raised as is.
+
+        :param sources: xml strings
+        :param executor: executor the strings are deserialized by
+        :param chunksize: number of strings sent to a worker process at once (process pool only)
+        :param context: pydantic validation context
+        :param empty_as_string: deserialize empty element data as empty string not None
+        :param kwargs: additional xml deserialization arguments
+        :return: deserialized objects or errors in the order of the sources
+        """
+
+        func = functools.partial(_from_xml_item, cls, context, empty_as_string, kwargs)
+        if executor is None:
+            return list(map(func, sources))
+        else:
+            return list(executor.map(func, sources, chunksize=chunksize))
+
+    @classmethod
+    def iter_from_xml(
+            cls: Type[ModelT],
+            source: Union[str, 'os.PathLike[str]', IO[bytes]],
+            tag: Optional[str] = None,
+            context: Optional[Dict[str, Any]] = None,
+            empty_as_string: bool = False,
+            compression: Optional[Compression] = None,
+            **kwargs: Any,
+    ) -> Iterator[ModelT]:
+        """
+        Incrementally deserializes an xml document yielding an object of `cls` type
+        for every element matching `tag`. Processed elements are cleared right after deserialization
+        so that the memory consumption doesn't depend on the document size.
+        Elements matching `tag` must not be nested into each other.
+
+        :param source: xml file name or file object
+        :param tag: tag of the elements to deserialize the objects from (the model element name by default)
+        :param context: pydantic validation context
+        :param empty_as_string: deserialize empty element data as empty string not None
+        :param compression: file compression (`gzip`, `bz2`, `xz` or `zstd`), `infer` to detect it
+                            by the file name extension. The file is decompressed incrementally as the parser reads it
+        :param kwargs: additional xml parser arguments
+        :return: deserialized objects iterator
+        """
+
+        serializer = cls.__xml_serializer__
+        assert serializer is not None, f"model {cls.__name__} is partially initialized"
+
+        with utils.open_compressed(source, 'rb', compression) as file:
+            for native_element in iterparse(file, tag or serializer.element_name, **kwargs):
+                yield typing.cast(
+                    ModelT, serializer.deserialize(
+                        XmlElement.from_native(native_element, serializer.element_binding),
+                        context=context,
+                        sourcemap={},
+                        loc=(),
+                        empty_as_string=empty_as_string,
+                        validation=ValidationMode.MODEL,
+                    ),
+                )
+
+    @classmethod
+    async def aiter_from_xml(
+            cls: Type[ModelT],
+            stream: Union[AsyncReader, AsyncIterable[bytes]],
+            tag: Optional[str] = None,
+            context: Optional[Dict[str, Any]] = None,
+            empty_as_string: bool = False,
+            chunk_size: int = 64 * 1024,
+            compression: Optional[Compression] = None,
+            **kwargs: Any,
+    ) -> AsyncIterator[ModelT]:
+        """
+        Incrementally deserializes an xml document read from an asynchronous byte stream yielding
+        an object of `cls` type for every element matching `tag` as soon as the element is closed.
+        Processed elements are cleared right after deserialization.
+        Elements matching `tag` must not be nested into each other.
+
+        :param stream: asynchronous stream (an object with `async read(n)` method like `asyncio.StreamReader`)
+                       or asynchronous iterable of xml document chunks
+        :param tag: tag of the elements to deserialize the objects from (the model element name by default)
+        :param context: pydantic validation context
+        :param empty_as_string: deserialize empty element data as empty string not None
+        :param chunk_size: stream read chunk size
+        :param compression: stream compression (`gzip`, `bz2`, `xz` or `zstd`, `infer` is not supported).
+                            The chunks are decompressed incrementally as they are read
+        :param kwargs: additional xml parser arguments
+        :return: deserialized objects asynchronous iterator
+        """
+
+        serializer = cls.__xml_serializer__
+        assert serializer is not None, f"model {cls.__name__} is partially initialized"
+
+        if compression == 'infer':
+            raise ValueError("compression can't be inferred for a stream, specify it explicitly")
+
+        async def read_chunks() -> AsyncIterator[bytes]:
+            # readers are read by chunks even if they are iterable since
+            # some of them (like asyncio.StreamReader) are iterated by lines
+            if hasattr(stream, 'read'):
+                reader = typing.cast(AsyncReader, stream)
+                while chunk := await reader.read(chunk_size):
+                    yield chunk
+            else:
+                async for chunk in typing.cast(AsyncIterable[bytes], stream):
+                    yield chunk
+
+        async def decompress_chunks() -> AsyncIterator[bytes]:
+            if compression is None:
+                async for chunk in read_chunks():
+                    yield chunk
+                return
+
+            decompressor = utils.StreamDecompressor(compression)
+            async for chunk in read_chunks():
+                if chunk := decompressor.decompress(chunk):
+                    yield chunk
+
+            if chunk := decompressor.flush():
+                yield chunk
+
+        async def read_elements() -> AsyncIterator[Any]:
+            parser = PullParser(tag or serializer.element_name, **kwargs)
+            async for chunk in decompress_chunks():
+                for native_element in parser.feed(chunk):
+                    yield native_element
+
+            for native_element in parser.close():
+                yield native_element
+
+        async for native_element in read_elements():
+            yield typing.cast(
+                ModelT, serializer.deserialize(
+                    XmlElement.from_native(native_element, serializer.element_binding),
+                    context=context,
+                    sourcemap={},
+                    loc=(),
+                    empty_as_string=empty_as_string,
+                    validation=ValidationMode.MODEL,
+                ),
+            )
+
     def to_xml_tree(
-            self, *, skip_empty: bool = False, exclude_none: bool = False, exclude_unset: bool = False,
+            self,
+            *,
+            skip_empty: bool = False,
+            exclude_none: bool = False,
+            exclude_unset: bool = False,
+            lazy_encoding: bool = False,
     ) -> etree.Element:
         """
         Serializes the object to an xml tree.
@@ -313,18 +686,21 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
         :param skip_empty: skip empty elements (elements without sub-elements, attributes and text, Nones)
         :param exclude_none: exclude `None` values
         :param exclude_unset: exclude values that haven't been explicitly set
+        :param lazy_encoding: encode field values model by model during the serialization
+                              instead of encoding the whole object beforehand
         :return: object xml representation
         """
 
         assert self.__xml_serializer__ is not None, f"model {type(self).__name__} is partially initialized"
 
-        root = XmlElement(tag=self.__xml_serializer__.element_name, nsmap=self.__xml_serializer__.nsmap)
+        if lazy_encoding:
+            encoded = pdc.PydanticUndefined
+        else:
+            encoded = pdc.to_jsonable_python(self, by_alias=False, fallback=encode_fallback)
+
+        root = ElementWriter(tag=self.__xml_serializer__.element_name, nsmap=self.__xml_serializer__.nsmap)
         self.__xml_serializer__.serialize(
-            root, self, pdc.to_jsonable_python(
-                self,
-                by_alias=False,
-                fallback=lambda obj: obj if not isinstance(obj, ElementT) else None,  # for raw fields support
-            ),
+            root, self, encoded,
             skip_empty=skip_empty,
             exclude_none=exclude_none,
             exclude_unset=exclude_unset,
@@ -333,7 +709,13 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
         return root.to_native()
 
     def to_xml(
-            self, *, skip_empty: bool = False, exclude_none: bool = False, exclude_unset: bool = False, **kwargs: Any,
+            self,
+            *,
+            skip_empty: bool = False,
+            exclude_none: bool = False,
+            exclude_unset: bool = False,
+            lazy_encoding: bool = False,
+            **kwargs: Any,
     ) -> Union[str, bytes]:
         """
         Serializes the object to an xml string.
@@ -341,15 +723,145 @@ class BaseXmlModel(BaseModel, __xml_abstract__=True, metaclass=XmlModelMeta):
         :param skip_empty: skip empty elements (elements without sub-elements, attributes and text, Nones)
         :param exclude_none: exclude `None` values
         :param exclude_unset: exclude values that haven't been explicitly set
+        :param lazy_encoding: encode field values model by model during the serialization
+                              instead of encoding the whole object beforehand
         :param kwargs: additional xml serialization arguments
         :return: object xml representation
         """
 
         return etree.tostring(
-            self.to_xml_tree(skip_empty=skip_empty, exclude_none=exclude_none, exclude_unset=exclude_unset),
+            self.to_xml_tree(
+                skip_empty=skip_empty,
+                exclude_none=exclude_none,
+                exclude_unset=exclude_unset,
+                lazy_encoding=lazy_encoding,
+            ),
             **kwargs,
         )
 
+    def write_xml(
+            self,
+            file: Union[str, 'os.PathLike[str]', IO[Any]],
+            *,
+            skip_empty: bool = False,
+            exclude_none: bool = False,
+            exclude_unset: bool = False,
+            compression: Optional[Compression] = None,
+            **kwargs: Any,
+    ) -> None:
+        """
+        Incrementally serializes the object to an xml file. The root element sub-elements are written
+        to the file as soon as they are serialized so that only one of them is kept in memory at a time.
+        Field values are encoded model by model (see `lazy_encoding`).
+
+        :param file: xml file name or file object
+        :param skip_empty: skip empty elements (elements without sub-elements, attributes and text, Nones)
+        :param exclude_none: exclude `None` values
+        :param exclude_unset: exclude values that haven't been explicitly set
+        :param compression: file compression (`gzip`, `bz2`, `xz` or `zstd`), `infer` to detect it
+                            by the file name extension. The output is compressed incrementally as it is written
+        :param kwargs: additional xml serialization arguments
+        """
+
+        serializer = self.__xml_serializer__
+        assert serializer is not None, f"model {type(self).__name__} is partially initialized"
+
+        with utils.open_compressed(file, _get_write_mode(kwargs), compression) as output:
+            with xmlstream(output, serializer.element_name, serializer.nsmap, **kwargs) as root:
+                serializer.serialize(
+                    root, self, pdc.PydanticUndefined,
+                    skip_empty=skip_empty,
+                    exclude_none=exclude_none,
+                    exclude_unset=exclude_unset,
+                )
+
+    @classmethod
+    def to_xml_stream(
+            cls: Type[ModelT],
+            objs: Iterable[ModelT],
+            file: Union[str, 'os.PathLike[str]', IO[Any]],
+            tag: str,
+            nsmap: Optional[NsMap] = None,
+            *,
+            skip_empty: bool = False,
+            exclude_none: bool = False,
+            exclude_unset: bool = False,
+            compression: Optional[Compression] = None,
+            **kwargs: Any,
+    ) -> None:
+        """
+        Incrementally serializes the objects to an xml file under the root element `tag`.
+        Every object is written to the file right after serialization so that the memory consumption
+        doesn't depend on the number of the objects.
+
+        :param objs: objects to be serialized
+        :param file: xml file name or file object
+        :param tag: root element tag
+        :param nsmap: root element namespace map
+        :param skip_empty: skip empty elements (elements without sub-elements, attributes and text, Nones)
+        :param exclude_none: exclude `None` values
+        :param exclude_unset: exclude values that haven't been explicitly set
+        :param compression: file compression (`gzip`, `bz2`, `xz` or `zstd`), `infer` to detect it
+                            by the file name extension. The output is compressed incrementally as it is written
+        :param kwargs: additional xml serialization arguments
+        """
+
+        serializer = cls.__xml_serializer__
+        assert serializer is not None, f"model {cls.__name__} is partially initialized"
+
+        with utils.open_compressed(file, _get_write_mode(kwargs), compression) as output:
+            with xmlstream(output, tag, nsmap, **kwargs) as root:
+                for obj in objs:
+                    sub_element = root.make_element(serializer.element_name, nsmap=serializer.nsmap)
+                    serializer.serialize(
+                        sub_element, obj, pdc.PydanticUndefined,
+                        skip_empty=skip_empty,
+                        exclude_none=exclude_none,
+                        exclude_unset=exclude_unset,
+                    )
+                    if not (skip_empty and sub_element.is_empty()):
+                        root.append_element(sub_element)
+
+    @classmethod
+    def to_xml_many(
+            cls: Type[ModelT],
+            objs: Iterable[ModelT],
+            executor: Optional[Executor] = None,
+            chunksize: int = 1,
+            *,
+            skip_empty: bool = False,
+            exclude_none: bool = False,
+            exclude_unset: bool = False,
+            **kwargs: Any,
+    ) -> List[Union[str, bytes, Exception]]:
+        """
+        Serializes a batch of objects to xml strings.
+        The objects are serialized using the provided executor (`concurrent.futures.ThreadPoolExecutor`
+        or `concurrent.futures.ProcessPoolExecutor`) or sequentially if the executor is not provided.
+        A process pool requires the model to be importable by the worker processes (defined at a module level).
+
+        Serialization errors don't abort the batch: a failed item result is the error it failed with
+        (:py:class:`pydantic_xml.errors.SerializationError`). Other errors are raised as is.
+
+        :param objs: objects to be serialized
+        :param executor: executor the objects are serialized by
+        :param chunksize: number of objects sent to a worker process at once (process pool only)
+        :param skip_empty: skip empty elements (elements without sub-elements, attributes and text, Nones)
+        :param exclude_none: exclude `None` values
+        :param exclude_unset: exclude values that haven't been explicitly set
+        :param kwargs: additional xml serialization arguments
+        :return: objects xml representations or errors in the order of the objects
+        """
+
+        func = functools.partial(
+            _to_xml_item,
+            dict(skip_empty=skip_empty, exclude_none=exclude_none, exclude_unset=exclude_unset, **kwargs),
+        )
+        if executor is None:
+            return list(map(func, objs))
+        else:
+            return list(executor.map(func, objs, chunksize=chunksize))
+
 
 @te.dataclass_transform(kw_only_default=True, field_specifiers=(attr, element, wrapped, pd.Field))
 class RootXmlModelMeta(XmlModelMeta, RootModelMetaclass):
@@ -371,8 +883,45 @@ class RootXmlModel(
     """
 
     @classmethod
-    def __build_serializer__(cls) -> None:
+    def __build_serializer__(cls, lazy: Optional[bool] = None) -> None:
         if cls is RootXmlModel:
             return
 
-        super().__build_serializer__()
+        super().__build_serializer__(lazy=lazy)
+
+
+def _get_validation_mode(validate: bool, validate_once: bool) -> ValidationMode:
+    if not validate:
+        return ValidationMode.NONE
+    elif validate_once:
+        return ValidationMode.DOCUMENT
+    else:
+        return ValidationMode.MODEL
+
+
+def _get_write_mode(kwargs: Dict[str, Any]) -> str:
+    # compressed files are opened in text mode for the standard library unicode output
+    return 'wt' if kwargs.get('encoding') == 'unicode' else 'wb'
+
+
+def _from_xml_item(
+        model: Type[ModelT],
+        context: Optional[Dict[str, Any]],
+        empty_as_string: bool,
+        kwargs: Dict[str, Any],
+        source: XmlSource,
+) -> Union[ModelT, Exception]:
+    try:
+        return model.from_xml(source, context=context, empty_as_string=empty_as_string, **kwargs)
+    except (pd.ValidationError, errors.BaseError) as err:
+        return err
+    except etree.ParseError as err:
+        # parser errors are not always picklable so they are not passed from a worker process as is
+        return errors.ParsingError(str(err))
+
+
+def _to_xml_item(kwargs: Dict[str, Any], obj: 'BaseXmlModel') -> Union[str, bytes, Exception]:
+    try:
+        return obj.to_xml(**kwargs)
+    except errors.BaseError as err:
+        return err
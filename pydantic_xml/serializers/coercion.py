@@ -0,0 +1,191 @@
+import decimal
+import typing
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+import pydantic as pd
+import pydantic_core as pdc
+from pydantic_core import core_schema as pcs
+
+from pydantic_xml import errors
+
+Coercer = Callable[[Any], Any]
+
+BOOL_TRUE_VALUES = frozenset(('1', 'on', 't', 'true', 'y', 'yes'))
+
+
+def identity(value: Any) -> Any:
+    return value
+
+
+def coerce_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.strip().lower() in BOOL_TRUE_VALUES
+
+    return bool(value)
+
+
+PRIMITIVE_COERCERS: Dict[str, Coercer] = {
+    'any': identity,
+    'int': int,
+    'float': float,
+    'bool': coerce_bool,
+    'decimal': decimal.Decimal,
+    # models are constructed by their own serializers
+    'model': identity,
+    'is-instance': identity,
+}
+
+COLLECTION_TYPES: Dict[str, Callable[[Any], Any]] = {
+    'list': list,
+    'set': set,
+    'frozenset': frozenset,
+}
+
+
+def build_coercer(
+        schema: pcs.CoreSchema,
+        config: Optional[Mapping[str, Any]] = None,
+        definitions: Optional[Mapping[str, pcs.CoreSchema]] = None,
+) -> Coercer:
+    """
+    Builds a coercer of deserialized data to the schema type. The coercer is used instead of the validation
+    for trusted documents. Primitive values are converted using the schema type information, the types
+    the coercion is not implemented for fall back to the pydantic-core validator.
+
+    :param schema: core schema
+    :param config: model config
+    :param definitions: core schema definitions the schema references are resolved by
+    :return: coercer
+    """
+
+    config = config or {}
+    definitions = definitions or {}
+    schema_type = schema['type']
+
+    if (coercer := PRIMITIVE_COERCERS.get(schema_type)) is not None:
+        return coercer
+
+    elif schema_type == 'str':
+        str_schema = typing.cast(pcs.StringSchema, schema)
+        return _build_str_coercer(
+            str_schema.get('strip_whitespace', config.get('str_strip_whitespace', False)),
+            str_schema.get('to_lower', config.get('str_to_lower', False)),
+            str_schema.get('to_upper', config.get('str_to_upper', False)),
+        )
+
+    elif schema_type == 'definitions':
+        definitions_schema = typing.cast(pcs.DefinitionsSchema, schema)
+        definitions = {
+            **definitions,
+            **{definition['ref']: definition for definition in definitions_schema['definitions']},
+        }
+        return build_coercer(definitions_schema['schema'], config, definitions)
+
+    elif schema_type == 'definition-ref':
+        schema_ref = typing.cast(pcs.DefinitionReferenceSchema, schema)['schema_ref']
+        if (ref_schema := definitions.get(schema_ref)) is None:
+            raise errors.ModelError(f"schema reference {schema_ref} not found")
+
+        return _build_ref_coercer(ref_schema, config, definitions)
+
+    elif schema_type in ('default', 'function-before', 'function-after', 'function-wrap'):
+        # custom validators are not applied, the data is coerced to the validated type
+        return build_coercer(typing.cast(pcs.WithDefaultSchema, schema)['schema'], config, definitions)
+
+    elif schema_type == 'nullable':
+        inner_coercer = build_coercer(typing.cast(pcs.NullableSchema, schema)['schema'], config, definitions)
+        return lambda value: inner_coercer(value) if value is not None else None
+
+    elif (collection_type := COLLECTION_TYPES.get(schema_type)) is not None:
+        items_schema = typing.cast(pcs.ListSchema, schema).get('items_schema') or pcs.any_schema()
+        item_coercer = build_coercer(items_schema, config, definitions)
+        return lambda value: collection_type(item_coercer(item) for item in value)
+
+    elif schema_type == 'tuple':
+        tuple_schema = typing.cast(pcs.TupleSchema, schema)
+        items_coercers = [
+            build_coercer(item_schema, config, definitions) for item_schema in tuple_schema['items_schema']
+        ]
+        return _build_tuple_coercer(items_coercers, tuple_schema.get('variadic_item_index'))
+
+    elif schema_type == 'dict':
+        dict_schema = typing.cast(pcs.DictSchema, schema)
+        keys_coercer = build_coercer(dict_schema.get('keys_schema') or pcs.any_schema(), config, definitions)
+        values_coercer = build_coercer(dict_schema.get('values_schema') or pcs.any_schema(), config, definitions)
+        return lambda value: {keys_coercer(key): values_coercer(val) for key, val in value.items()}
+
+    else:
+        if definitions:
+            # the schema may reference outer definitions
+            schema = pcs.definitions_schema(schema, list(definitions.values()))
+
+        return pdc.SchemaValidator(schema).validate_python
+
+
+def _build_ref_coercer(
+        schema: pcs.CoreSchema,
+        config: Mapping[str, Any],
+        definitions: Mapping[str, pcs.CoreSchema],
+) -> Coercer:
+    # the referenced schema coercer is built lazily since the definitions may be recursive
+    coercer: Optional[Coercer] = None
+
+    def coerce_ref(value: Any) -> Any:
+        nonlocal coercer
+        if coercer is None:
+            coercer = build_coercer(schema, config, definitions)
+
+        return coercer(value)
+
+    return coerce_ref
+
+
+def coerce(coercer: Coercer, value: Any) -> Any:
+    """
+    Coerces the value reporting coercion errors as validation errors.
+
+    :param coercer: value coercer
+    :param value: value to be coerced
+    :return: coerced value
+    """
+
+    try:
+        return coercer(value)
+    except pd.ValidationError:
+        raise
+    except (ValueError, TypeError, ArithmeticError) as err:
+        raise pd.ValidationError.from_exception_data(
+            title='coercion',
+            line_errors=[pdc.InitErrorDetails(type='value_error', loc=(), input=value, ctx={'error': str(err)})],
+        ) from err
+
+
+def _build_str_coercer(strip_whitespace: bool, to_lower: bool, to_upper: bool) -> Coercer:
+    if not (strip_whitespace or to_lower or to_upper):
+        return identity
+
+    def coerce_str(value: Any) -> Any:
+        if strip_whitespace:
+            value = value.strip()
+        if to_lower:
+            value = value.lower()
+        elif to_upper:
+            value = value.upper()
+
+        return value
+
+    return coerce_str
+
+
+def _build_tuple_coercer(items_coercers: List[Coercer], variadic_item_index: Optional[int]) -> Coercer:
+    def coerce_tuple(value: Any) -> Any:
+        result = []
+        for idx, item in enumerate(value):
+            # items after the variadic one are coerced by its coercer
+            if variadic_item_index is not None and idx > variadic_item_index:
+                idx = variadic_item_index
+            result.append(items_coercers[idx](item))
+
+        return tuple(result)
+
+    return coerce_tuple
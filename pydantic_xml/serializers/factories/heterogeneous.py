@@ -1,12 +1,14 @@
+import itertools as it
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pydantic as pd
+import pydantic_core as pdc
 from pydantic_core import core_schema as pcs
 
 from pydantic_xml import errors, utils
 from pydantic_xml.element import XmlElementReader, XmlElementWriter
-from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, Serializer
-from pydantic_xml.typedefs import EntityLocation, Location
+from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, Serializer, ValidationMode
+from pydantic_xml.typedefs import ElementBinding, EntityLocation, Location
 
 
 class ElementSerializer(Serializer):
@@ -32,11 +34,18 @@ class ElementSerializer(Serializer):
         self._inner_serializers = inner_serializers
         self._hide_input_in_errors = hide_input_in_errors
 
+    @property
+    def encoded_required(self) -> bool:
+        return any(serializer.encoded_required for serializer in self._inner_serializers)
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return all(serializer.bind_elements(binding) for serializer in self._inner_serializers)
+
     def serialize(
             self,
             element: XmlElementWriter,
             value: List[Any],
-            encoded: List[Any],
+            encoded: Any,
             *,
             skip_empty: bool = False,
             exclude_none: bool = False,
@@ -51,6 +60,9 @@ class ElementSerializer(Serializer):
         if len(value) != len(self._inner_serializers):
             raise errors.SerializationError("value length is incorrect")
 
+        if encoded is pdc.PydanticUndefined:
+            encoded = it.repeat(encoded)
+
         for serializer, val, enc in zip(self._inner_serializers, value, encoded):
             serializer.serialize(
                 element, val, enc, skip_empty=skip_empty, exclude_none=exclude_none, exclude_unset=exclude_unset,
@@ -63,9 +75,10 @@ class ElementSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[List[Any]]:
         if self._computed:
             return None
@@ -77,10 +90,12 @@ class ElementSerializer(Serializer):
         item_errors: Dict[Union[None, str, int], pd.ValidationError] = {}
         for idx, serializer in enumerate(self._inner_serializers):
             try:
+                item_loc = loc + (idx,) if sourcemap is not None else loc
                 result.append(
                     serializer.deserialize(
                         element,
-                        context=context, sourcemap=sourcemap, loc=loc + (idx,), empty_as_string=empty_as_string,
+                        context=context, sourcemap=sourcemap, loc=item_loc, empty_as_string=empty_as_string,
+                        validation=validation,
                     ),
                 )
             except pd.ValidationError as err:
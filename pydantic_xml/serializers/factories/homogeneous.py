@@ -2,12 +2,13 @@ import itertools as it
 from typing import Any, Dict, List, Optional, Union
 
 import pydantic as pd
+import pydantic_core as pdc
 from pydantic_core import core_schema as pcs
 
 from pydantic_xml import errors, utils
 from pydantic_xml.element import XmlElementReader, XmlElementWriter
-from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, Serializer
-from pydantic_xml.typedefs import EntityLocation, Location
+from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, Serializer, ValidationMode
+from pydantic_xml.typedefs import ElementBinding, EntityLocation, Location
 
 HomogeneousCollectionTypeSchema = Union[
     pcs.TupleSchema,
@@ -38,11 +39,18 @@ class ElementSerializer(Serializer):
         self._inner_serializer = inner_serializer
         self._hide_input_in_errors = hide_input_in_errors
 
+    @property
+    def encoded_required(self) -> bool:
+        return self._inner_serializer.encoded_required
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return self._inner_serializer.bind_elements(binding)
+
     def serialize(
             self,
             element: XmlElementWriter,
             value: List[Any],
-            encoded: List[Any],
+            encoded: Any,
             *,
             skip_empty: bool = False,
             exclude_none: bool = False,
@@ -54,6 +62,9 @@ class ElementSerializer(Serializer):
         if skip_empty and len(value) == 0:
             return element
 
+        if encoded is pdc.PydanticUndefined:
+            encoded = it.repeat(encoded)
+
         for val, enc in zip(value, encoded):
             if skip_empty and val is None:
                 continue
@@ -69,9 +80,10 @@ class ElementSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[List[Any]]:
         if self._computed:
             return None
@@ -84,8 +96,10 @@ class ElementSerializer(Serializer):
         item_errors: Dict[Union[None, str, int], pd.ValidationError] = {}
         for idx in it.count():
             try:
+                item_loc = loc + (idx,) if sourcemap is not None else loc
                 value = serializer.deserialize(
-                    element, context=context, sourcemap=sourcemap, loc=loc + (idx,), empty_as_string=empty_as_string,
+                    element, context=context, sourcemap=sourcemap, loc=item_loc, empty_as_string=empty_as_string,
+                    validation=validation,
                 )
                 if value is None:
                     break
@@ -4,9 +4,10 @@ from pydantic_core import core_schema as pcs
 
 from pydantic_xml import errors
 from pydantic_xml.element import XmlElementReader, XmlElementWriter
-from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, SearchMode, Serializer
-from pydantic_xml.typedefs import EntityLocation, Location, NsMap
-from pydantic_xml.utils import QName, merge_nsmaps, select_ns
+from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, SearchMode, Serializer, ValidationMode
+from pydantic_xml.serializers.serializer import bind_element, can_prune
+from pydantic_xml.typedefs import ElementBinding, EntityLocation, Location, NsMap
+from pydantic_xml.utils import QName, merge_nsmaps, select_ns, split_uri
 
 
 class AttributesSerializer(Serializer):
@@ -25,6 +26,13 @@ class AttributesSerializer(Serializer):
         self._nsmap = nsmap
         self._computed = computed
 
+    @property
+    def writes_sub_elements(self) -> bool:
+        return False
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return True
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -51,9 +59,10 @@ class AttributesSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[Dict[str, str]]:
         if self._computed:
             return None
@@ -62,7 +71,7 @@ class AttributesSerializer(Serializer):
             return None
 
         return {
-            QName.from_uri(attr).tag if self._namespaced_attrs else attr: val
+            split_uri(attr)[1] if self._namespaced_attrs else attr: val
             for attr, val in attributes.items()
         }
 
@@ -96,6 +105,17 @@ class ElementSerializer(AttributesSerializer):
         self._name = name
         self._element_name = QName.from_alias(tag=self._name, ns=self._ns, nsmap=self._nsmap).uri
 
+    @property
+    def writes_sub_elements(self) -> bool:
+        return True
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        if not can_prune(self._search_mode):
+            return False
+
+        bind_element(binding, self._element_name, {})
+        return True
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -124,17 +144,20 @@ class ElementSerializer(AttributesSerializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[Dict[str, str]]:
         if self._computed:
             return None
 
         if element and (sub_element := element.pop_element(self._element_name, self._search_mode)) is not None:
-            sourcemap[loc] = sub_element.get_sourceline()
+            if sourcemap is not None:
+                sourcemap[loc] = sub_element.get_sourceline()
             return super().deserialize(
                 sub_element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+                validation=validation,
             )
         else:
             return None
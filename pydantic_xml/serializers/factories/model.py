@@ -1,21 +1,25 @@
 import abc
 import typing
-from typing import Any, Dict, List, Mapping, Optional, Set, Type, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Set, Tuple, Type, Union
 
 import pydantic as pd
 import pydantic_core as pdc
 from pydantic_core import core_schema as pcs
 
 import pydantic_xml as pxml
-from pydantic_xml import errors, utils
+from pydantic_xml import compat, errors, utils
 from pydantic_xml.element import XmlElementReader, XmlElementWriter, is_element_nill, make_element_nill
 from pydantic_xml.fields import ComputedXmlEntityInfo, NoXml, XmlEntityInfoP, extract_field_xml_entity_info
-from pydantic_xml.serializers.serializer import SearchMode, Serializer
-from pydantic_xml.typedefs import EntityLocation, Location, NsMap
+from pydantic_xml.serializers.coercion import Coercer, build_coercer, coerce
+from pydantic_xml.serializers.serializer import FieldDeserializer, SearchMode, Serializer, ValidationMode, bind_element
+from pydantic_xml.serializers.serializer import can_prune, encode_fallback
+from pydantic_xml.typedefs import ElementBinding, EntityLocation, Location, NsMap
 from pydantic_xml.utils import QName, merge_nsmaps, select_ns
 
 
 class BaseModelSerializer(Serializer, abc.ABC):
+    _element_binding: Any = pdc.PydanticUndefined
+
     @property
     @abc.abstractmethod
     def model(self) -> Type['pxml.BaseXmlModel']: ...
@@ -28,8 +32,31 @@ class BaseModelSerializer(Serializer, abc.ABC):
     @abc.abstractmethod
     def nsmap(self) -> Optional[NsMap]: ...
 
+    @property
+    def element_binding(self) -> Optional[ElementBinding]:
+        """
+        Model element binding. Sub-elements that are not bound are not consumed during
+        the deserialization and can be pruned. `None` if the model consumes the whole element.
+        """
+
+        binding = self._element_binding
+        if binding is pdc.PydanticUndefined:
+            # protects from infinite recursion in self-referencing models
+            self._element_binding = None
+            # collected on the first access since custom validators are collected after the serializer is built
+            self._element_binding = binding = self._collect_element_binding()
+
+        return typing.cast(Optional[ElementBinding], binding)
+
+    def _collect_element_binding(self) -> Optional[ElementBinding]:
+        return None
+
     @classmethod
     def _check_extra(cls, error_title: str, element: XmlElementReader, hide_input_in_errors: bool) -> None:
+        # the sub-tree is walked only if something may be left unbound
+        if not element.has_unbound():
+            return
+
         line_errors: List[pdc.InitErrorDetails] = []
 
         for path, attr, value in element.get_unbound():
@@ -56,6 +83,32 @@ class BaseModelSerializer(Serializer, abc.ABC):
             )
 
 
+# field name, validation name, field location, field deserializer
+FieldDeserializationStep = Tuple[str, str, Location, FieldDeserializer]
+
+
+def compile_custom_validator(
+        model: Type['pxml.BaseXmlModel'],
+        field_name: str,
+        validator: 'pxml.model.ValidatorFunc',
+) -> FieldDeserializer:
+    """
+    Compiles a custom xml field validator into a model field deserializer.
+    """
+
+    def deserializer(
+            element: XmlElementReader,
+            context: Optional[Dict[str, Any]],
+            sourcemap: Optional[Dict[Location, int]],
+            loc: Location,
+            empty_as_string: bool,
+            validation: ValidationMode,
+    ) -> Any:
+        return validator(model, element, field_name)
+
+    return deserializer
+
+
 class ModelSerializer(BaseModelSerializer):
     @classmethod
     def from_core_schema(cls, schema: pcs.ModelSchema, ctx: Serializer.Context) -> 'ModelSerializer':
@@ -75,6 +128,8 @@ class ModelSerializer(BaseModelSerializer):
         fields_serialization_exclude: Set[str] = set()
         fields_validation_aliases: Dict[str, str] = {}
         fields_serializers: Dict[str, Serializer] = {}
+        fields_schemas: Dict[str, pcs.CoreSchema] = {}
+        fields_computed: Set[str] = set()
         for field_name, model_field in fields_schema['fields'].items():
             field_info = model_cls.model_fields[field_name]
             if NoXml in field_info.metadata:
@@ -95,6 +150,7 @@ class ModelSerializer(BaseModelSerializer):
                 hide_input_in_errors=hide_input_in_errors,
             )
             fields_serializers[field_name] = Serializer.parse_core_schema(model_field['schema'], field_ctx)
+            fields_schemas[field_name] = model_field['schema']
 
         for model_field in fields_schema['computed_fields']:
             field_name = model_field['property_name']
@@ -114,17 +170,31 @@ class ModelSerializer(BaseModelSerializer):
                 hide_input_in_errors=hide_input_in_errors,
             )
             fields_serializers[field_name] = Serializer.parse_core_schema(model_field['return_schema'], field_ctx)
+            fields_computed.add(field_name)
 
         name = model_cls.__xml_tag__ or model_cls.__name__
         ns = model_cls.__xml_ns__
-        nsmap = model_cls.__xml_nsmap__
+        nsmap = merge_nsmaps(model_cls.__xml_nsmap__)
 
         return cls(
             model_cls, name, ns, nsmap,
-            fields_serializers, fields_validation_aliases, fields_serialization_exclude,
-            hide_input_in_errors,
+            fields_serializers, fields_validation_aliases, fields_serialization_exclude, fields_computed,
+            fields_schemas, ctx.definitions, hide_input_in_errors,
         )
 
+    @staticmethod
+    def _get_encoded_fields(
+            field_serializers: Dict[str, Serializer],
+            fields_schemas: Dict[str, pcs.CoreSchema],
+    ) -> Optional[Set[str]]:
+        encoded_fields = {
+            field_name
+            for field_name, field_serializer in field_serializers.items()
+            if field_serializer.encoded_required or has_custom_serializer(fields_schemas.get(field_name))
+        }
+
+        return encoded_fields if len(encoded_fields) != len(field_serializers) else None
+
     def __init__(
             self,
             model: Type['pxml.BaseXmlModel'],
@@ -134,6 +204,9 @@ class ModelSerializer(BaseModelSerializer):
             field_serializers: Dict[str, Serializer],
             fields_validation_aliases: Dict[str, str],
             fields_serialization_exclude: Set[str],
+            fields_computed: Set[str],
+            fields_schemas: Dict[str, pcs.CoreSchema],
+            definitions: Mapping[str, pcs.CoreSchema],
             hide_input_in_errors: bool,
     ):
 
@@ -144,6 +217,24 @@ class ModelSerializer(BaseModelSerializer):
         self._fields_validation_aliases = fields_validation_aliases
         self._fields_serialization_exclude = fields_serialization_exclude
         self._hide_input_in_errors = hide_input_in_errors
+        self._encoded_fields = self._get_encoded_fields(field_serializers, fields_schemas)
+        # the element attributes and text are serialized before the sub-elements so that a stream writer
+        # is able to write the element start tag as soon as the first sub-element is completed
+        self._fields_serialization_order = sorted(
+            field_serializers.items(),
+            key=lambda item: item[1].writes_sub_elements,
+        )
+        self._fields_computed = fields_computed
+        self._forbid_extra = model.model_config.get('extra', 'ignore') == 'forbid'
+        # compiled on the first deserialization since custom validators are collected after the serializer is built
+        self._deserialization_plan: Optional[List[FieldDeserializationStep]] = None
+        self._fields_schemas = fields_schemas
+        self._definitions = definitions
+        # built on the first deserialization without validation
+        self._fields_coercers: Optional[Dict[str, Coercer]] = None
+        # model fields in the declaration order with the field info if the field has a default value
+        self._model_fields: List[Tuple[str, Optional[pd.fields.FieldInfo]]] = []
+        self._plain_model = False
 
     @property
     def model(self) -> Type['pxml.BaseXmlModel']:
@@ -161,11 +252,25 @@ class ModelSerializer(BaseModelSerializer):
     def fields_serializers(self) -> Mapping[str, Serializer]:
         return self._field_serializers
 
+    def _collect_element_binding(self) -> Optional[ElementBinding]:
+        # unbound elements are reported as extra ones, custom validators have access to the whole element
+        if self._forbid_extra or self._model.__xml_field_validators__:
+            return None
+
+        binding: ElementBinding = {}
+        for field_name, field_serializer in self._field_serializers.items():
+            if field_name in self._fields_computed:
+                continue
+            if not field_serializer.bind_elements(binding):
+                return None
+
+        return binding
+
     def serialize(
             self,
             element: XmlElementWriter,
             value: 'pxml.BaseXmlModel',
-            encoded: Dict[str, Any],
+            encoded: Any,
             *,
             skip_empty: bool = False,
             exclude_none: bool = False,
@@ -177,7 +282,18 @@ class ModelSerializer(BaseModelSerializer):
         if self._model.__xml_skip_empty__ is not None:
             skip_empty = self._model.__xml_skip_empty__
 
-        for field_name, field_serializer in self._field_serializers.items():
+        if encoded is pdc.PydanticUndefined:
+            # only the fields that use encoded values are encoded, sub-models are encoded by their own serializers
+            encoded = self._model.__pydantic_serializer__.to_python(
+                value,
+                mode='json',
+                by_alias=False,
+                include=self._encoded_fields,
+                fallback=encode_fallback,
+                warnings=False,
+            )
+
+        for field_name, field_serializer in self._fields_serialization_order:
             if field_name in self._fields_serialization_exclude:
                 continue
             if exclude_unset and field_name not in value.__pydantic_fields_set__:
@@ -187,7 +303,7 @@ class ModelSerializer(BaseModelSerializer):
                 custom_field_serializer(value, element, getattr(value, field_name), field_name)
             else:
                 field_serializer.serialize(
-                    element, getattr(value, field_name), encoded[field_name],
+                    element, getattr(value, field_name), encoded.get(field_name, pdc.PydanticUndefined),
                     skip_empty=skip_empty,
                     exclude_none=exclude_none,
                     exclude_unset=exclude_unset,
@@ -195,34 +311,114 @@ class ModelSerializer(BaseModelSerializer):
 
         return element
 
+    def _compile_deserialization_plan(self) -> List[FieldDeserializationStep]:
+        """
+        Compiles the model fields deserialization plan. Each field serializer is compiled into a deserializer
+        with the field invariants bound, custom validators replace the field deserializers.
+        Computed fields are excluded since they are never deserialized.
+        """
+
+        plan: List[FieldDeserializationStep] = []
+        for field_name, field_serializer in self._field_serializers.items():
+            field_deserializer: FieldDeserializer
+            if (custom_field_validator := self._model.__xml_field_validators__.get(field_name)) is not None:
+                field_deserializer = compile_custom_validator(self._model, field_name, custom_field_validator)
+            elif field_name in self._fields_computed:
+                continue
+            else:
+                field_deserializer = field_serializer.compile_deserializer()
+
+            plan.append((
+                field_name,
+                self._fields_validation_aliases.get(field_name, field_name),
+                (field_name,),
+                field_deserializer,
+            ))
+
+        return plan
+
+    def _construct(self, fields: Dict[str, Any]) -> 'pxml.BaseXmlModel':
+        """
+        Creates a model instance from the deserialized fields without validation.
+        The fields are coerced to the field types, computed fields are dropped.
+        """
+
+        if (coercers := self._fields_coercers) is None:
+            coercers = self._fields_coercers = {
+                field_name: build_coercer(field_schema, self._model.model_config, self._definitions)
+                for field_name, field_schema in self._fields_schemas.items()
+            }
+            self._plain_model = compat.is_plain_model(self._model)
+            self._model_fields = [
+                (field_name, None if field_info.is_required() else field_info)
+                for field_name, field_info in self._model.model_fields.items()
+            ]
+
+        values: Dict[str, Any] = {}
+        field_errors: Dict[Union[None, str, int], pd.ValidationError] = {}
+        for field_name, field_value in fields.items():
+            if (coercer := coercers.get(field_name)) is None:
+                continue
+            try:
+                values[field_name] = coerce(coercer, field_value)
+            except pd.ValidationError as err:
+                field_errors[field_name] = err
+
+        if field_errors:
+            raise utils.into_validation_error(
+                title=self._model.__name__,
+                errors_map=field_errors,
+                hide_input=self._hide_input_in_errors,
+            )
+
+        if not self._plain_model:
+            return self._model.model_construct(**values)
+
+        # the values are placed in the model fields order as pydantic does
+        fields_values: Dict[str, Any] = {}
+        for field_name, field_info in self._model_fields:
+            if field_name in values:
+                fields_values[field_name] = values[field_name]
+            elif field_info is not None:
+                fields_values[field_name] = field_info.get_default(call_default_factory=True)
+
+        return compat.construct_plain_model(self._model, fields_values, set(values))
+
     def deserialize(
             self,
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
-    ) -> Optional['pxml.BaseXmlModel']:
+            validation: ValidationMode = ValidationMode.MODEL,
+    ) -> Union['pxml.BaseXmlModel', Dict[str, Any], None]:
         if element is None:
             return None
 
+        if (plan := self._deserialization_plan) is None:
+            plan = self._deserialization_plan = self._compile_deserialization_plan()
+
+        # sub-models are validated by the model itself in the document validation mode
+        fields_validation = ValidationMode.DEFERRED if validation is ValidationMode.DOCUMENT else validation
+        construct = validation is ValidationMode.NONE
+
+        sourceline = element.get_sourceline() if sourcemap is not None else -1
         result: Dict[str, Any] = {}
         field_errors: Dict[Union[None, str, int], pd.ValidationError] = {}
-        for field_name, field_serializer in self._field_serializers.items():
+        for field_name, validation_name, field_loc, field_deserializer in plan:
             try:
-                loc = (field_name,)
-                sourcemap[loc] = element.get_sourceline()
-                if custom_field_validator := self._model.__xml_field_validators__.get(field_name):
-                    field_value = custom_field_validator(self._model, element, field_name)
-                else:
-                    field_value = field_serializer.deserialize(
-                        element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
-                    )
+                if sourcemap is not None:
+                    # source map locations are absolute so that the whole document errors can be mapped
+                    field_loc = loc + field_loc
+                    sourcemap[field_loc] = sourceline
 
+                field_value = field_deserializer(
+                    element, context, sourcemap, field_loc, empty_as_string, fields_validation,
+                )
                 if field_value is not None:
-                    field_name = self._fields_validation_aliases.get(field_name, field_name)
-                    result[field_name] = field_value
+                    result[field_name if construct else validation_name] = field_value
             except pd.ValidationError as err:
                 field_errors[field_name] = err
 
@@ -233,13 +429,20 @@ class ModelSerializer(BaseModelSerializer):
                 hide_input=self._hide_input_in_errors,
             )
 
-        if self._model.model_config.get('extra', 'ignore') == 'forbid':
+        if self._forbid_extra:
             self._check_extra(self._model.__name__, element, self._hide_input_in_errors)
 
+        if construct:
+            return self._construct(result)
+        elif validation is ValidationMode.DEFERRED:
+            return result
+
         try:
             return self._model.model_validate(result, strict=False, context=context)
         except pd.ValidationError as err:
-            raise utils.set_validation_error_sourceline(err, sourcemap, hide_input=self._hide_input_in_errors)
+            if sourcemap is None:
+                raise
+            raise utils.set_validation_error_sourceline(err, sourcemap, loc, hide_input=self._hide_input_in_errors)
 
 
 class RootModelSerializer(BaseModelSerializer):
@@ -262,9 +465,9 @@ class RootModelSerializer(BaseModelSerializer):
 
         name = model_cls.__xml_tag__ or model_cls.__name__
         ns = model_cls.__xml_ns__
-        nsmap = model_cls.__xml_nsmap__
+        nsmap = merge_nsmaps(model_cls.__xml_nsmap__)
 
-        return cls(model_cls, name, ns, nsmap, root_serializer, hide_input_in_errors)
+        return cls(model_cls, name, ns, nsmap, root_serializer, root_schema, ctx.definitions, hide_input_in_errors)
 
     def __init__(
             self,
@@ -273,15 +476,32 @@ class RootModelSerializer(BaseModelSerializer):
             ns: Optional[str],
             nsmap: Optional[NsMap],
             root_serializer: Serializer,
+            root_schema: pcs.CoreSchema,
+            definitions: Mapping[str, pcs.CoreSchema],
             hide_input_in_errors: bool,
     ):
 
         self._model = model
         self._root_serializer = root_serializer
+        self._root_schema = root_schema
+        self._root_encoded_required = root_serializer.encoded_required or has_custom_serializer(root_schema)
+        self._definitions = definitions
+        # built on the first deserialization without validation
+        self._root_coercer: Optional[Coercer] = None
         self._element_name = QName.from_alias(tag=name, ns=ns, nsmap=nsmap).uri
         self._nsmap = nsmap
         self._hide_input_in_errors = hide_input_in_errors
 
+    def _collect_element_binding(self) -> Optional[ElementBinding]:
+        if self._model.model_config.get('extra', 'ignore') == 'forbid':
+            return None
+
+        binding: ElementBinding = {}
+        if not self._root_serializer.bind_elements(binding):
+            return None
+
+        return binding
+
     @property
     def model(self) -> Type['pxml.BaseXmlModel']:
         return self._model
@@ -298,7 +518,7 @@ class RootModelSerializer(BaseModelSerializer):
             self,
             element: XmlElementWriter,
             value: 'pxml.RootXmlModel[Any]',
-            encoded: Dict[str, Any],
+            encoded: Any,
             *,
             skip_empty: bool = False,
             exclude_none: bool = False,
@@ -313,6 +533,15 @@ class RootModelSerializer(BaseModelSerializer):
         if self._model.__xml_skip_empty__ is not None:
             skip_empty = self._model.__xml_skip_empty__
 
+        if encoded is pdc.PydanticUndefined and self._root_encoded_required:
+            encoded = self._model.__pydantic_serializer__.to_python(
+                value,
+                mode='json',
+                by_alias=False,
+                fallback=encode_fallback,
+                warnings=False,
+            )
+
         self._root_serializer.serialize(
             element, getattr(value, 'root'), encoded,
             skip_empty=skip_empty,
@@ -327,16 +556,19 @@ class RootModelSerializer(BaseModelSerializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
-    ) -> Optional['pxml.BaseXmlModel']:
+            validation: ValidationMode = ValidationMode.MODEL,
+    ) -> Any:
         if element is None:
             return None
 
+        root_validation = ValidationMode.DEFERRED if validation is ValidationMode.DOCUMENT else validation
         try:
             result = self._root_serializer.deserialize(
                 element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+                validation=root_validation,
             )
             if result is None:
                 result = pdc.PydanticUndefined
@@ -350,10 +582,31 @@ class RootModelSerializer(BaseModelSerializer):
         if self._model.model_config.get('extra', 'ignore') == 'forbid':
             self._check_extra(self._model.__name__, element, self._hide_input_in_errors)
 
+        # a missing root value is validated to apply the default one or to report the error
+        if result is not pdc.PydanticUndefined:
+            if validation is ValidationMode.NONE:
+                if (coercer := self._root_coercer) is None:
+                    coercer = self._root_coercer = build_coercer(
+                        self._root_schema, self._model.model_config, self._definitions,
+                    )
+
+                try:
+                    return self._model.model_construct(coerce(coercer, result))
+                except pd.ValidationError as err:
+                    raise utils.into_validation_error(
+                        title=self._model.__name__,
+                        errors_map={None: err},
+                        hide_input=self._hide_input_in_errors,
+                    )
+            elif validation is ValidationMode.DEFERRED:
+                return result
+
         try:
             return self._model.model_validate(result, strict=False, context=context)
         except pd.ValidationError as err:
-            raise utils.set_validation_error_sourceline(err, sourcemap, hide_input=self._hide_input_in_errors)
+            if sourcemap is None:
+                raise
+            raise utils.set_validation_error_sourceline(err, sourcemap, loc, hide_input=self._hide_input_in_errors)
 
 
 class ModelProxySerializer(BaseModelSerializer):
@@ -396,6 +649,17 @@ class ModelProxySerializer(BaseModelSerializer):
     def model_serializer(self) -> Optional[BaseModelSerializer]:
         return self._model.__xml_serializer__
 
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        if not can_prune(self._search_mode) or (model_serializer := self.model_serializer) is None:
+            return False
+
+        bind_element(binding, self._element_name, model_serializer.element_binding)
+        return True
+
+    @property
+    def encoded_required(self) -> bool:
+        return False
+
     @property
     def element_name(self) -> str:
         return self._element_name
@@ -408,7 +672,7 @@ class ModelProxySerializer(BaseModelSerializer):
             self,
             element: XmlElementWriter,
             value: 'pxml.BaseXmlModel',
-            encoded: Dict[str, Any],
+            encoded: Any,
             *,
             skip_empty: bool = False,
             exclude_none: bool = False,
@@ -443,10 +707,11 @@ class ModelProxySerializer(BaseModelSerializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
-    ) -> Optional['pxml.BaseXmlModel']:
+            validation: ValidationMode = ValidationMode.MODEL,
+    ) -> Any:
         assert self._model.__xml_serializer__ is not None, f"model {self._model.__name__} is partially initialized"
 
         if self._computed:
@@ -456,16 +721,83 @@ class ModelProxySerializer(BaseModelSerializer):
             return None
 
         if (sub_element := element.pop_element(self._element_name, self._search_mode)) is not None:
-            sourcemap[loc] = sub_element.get_sourceline()
+            if sourcemap is not None:
+                sourcemap[loc] = sub_element.get_sourceline()
             if is_element_nill(sub_element):
                 return None
             else:
                 return self._model.__xml_serializer__.deserialize(
                     sub_element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+                    validation=validation,
                 )
         else:
             return None
 
+    def compile_deserializer(self) -> FieldDeserializer:
+        model = self._model
+        element_name = self._element_name
+        search_mode = self._search_mode
+
+        def deserializer(
+                element: XmlElementReader,
+                context: Optional[Dict[str, Any]],
+                sourcemap: Optional[Dict[Location, int]],
+                loc: Location,
+                empty_as_string: bool,
+                validation: ValidationMode,
+        ) -> Any:
+            if (sub_element := element.pop_element(element_name, search_mode)) is None:
+                return None
+            if sourcemap is not None:
+                sourcemap[loc] = sub_element.get_sourceline()
+            if is_element_nill(sub_element):
+                return None
+
+            # the model serializer is looked up on each call since it may be built lazily
+            assert model.__xml_serializer__ is not None, f"model {model.__name__} is partially initialized"
+            return model.__xml_serializer__.deserialize(
+                sub_element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+                validation=validation,
+            )
+
+        return deserializer
+
+
+def has_custom_serializer(schema: Optional[pcs.CoreSchema]) -> bool:
+    """
+    Checks if the schema value is serialized by a custom serializer (`@field_serializer`, `PlainSerializer`, etc.).
+    Sub-models fields are not inspected since they are encoded by the sub-models serializers.
+
+    :param schema: field core schema
+    :return: `True` if a custom serializer is found
+    """
+
+    if schema is None:
+        return False
+    if 'serialization' in schema:
+        return True
+    if schema['type'] in ('model', 'definition-ref'):
+        return False
+
+    return any(
+        has_custom_serializer(sub_schema)
+        for key, value in schema.items() if key != 'metadata'
+        for sub_schema in _iter_schemas(value)
+    )
+
+
+def _iter_schemas(value: Any) -> Iterator[pcs.CoreSchema]:
+    # core schemas are nested directly, in lists, tuples (labeled union choices) or mappings (tagged union choices)
+    if isinstance(value, dict):
+        if 'type' in value:
+            yield typing.cast(pcs.CoreSchema, value)
+        else:
+            for item in value.values():
+                yield from _iter_schemas(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _iter_schemas(item)
+
 
 def from_core_schema(schema: pcs.ModelSchema, ctx: Serializer.Context) -> Serializer:
     is_root_model = schema['root_model']
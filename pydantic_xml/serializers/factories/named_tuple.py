@@ -6,8 +6,8 @@ from pydantic_core import core_schema as pcs
 from pydantic_xml import errors
 from pydantic_xml.element import XmlElementReader, XmlElementWriter
 from pydantic_xml.serializers.factories import heterogeneous
-from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, Serializer
-from pydantic_xml.typedefs import EntityLocation, Location
+from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, Serializer, ValidationMode
+from pydantic_xml.typedefs import ElementBinding, EntityLocation, Location
 
 
 class ElementSerializer(Serializer):
@@ -33,6 +33,13 @@ class ElementSerializer(Serializer):
             model_name, computed, inner_serializers, hide_input_in_errors,
         )
 
+    @property
+    def encoded_required(self) -> bool:
+        return self._inner_serializer.encoded_required
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return self._inner_serializer.bind_elements(binding)
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -52,12 +59,14 @@ class ElementSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[List[Any]]:
         return self._inner_serializer.deserialize(
             element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+            validation=validation,
         )
 
 
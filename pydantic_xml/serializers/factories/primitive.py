@@ -4,8 +4,9 @@ from pydantic_core import core_schema as pcs
 
 from pydantic_xml import errors
 from pydantic_xml.element import XmlElementReader, XmlElementWriter, is_element_nill, make_element_nill
-from pydantic_xml.serializers.serializer import SearchMode, Serializer, encode_primitive
-from pydantic_xml.typedefs import EntityLocation, Location, NsMap
+from pydantic_xml.serializers.serializer import FieldDeserializer, SearchMode, Serializer, ValidationMode, bind_element
+from pydantic_xml.serializers.serializer import can_prune, encode_primitive
+from pydantic_xml.typedefs import ElementBinding, EntityLocation, Location, NsMap
 from pydantic_xml.utils import QName, merge_nsmaps, select_ns
 
 PrimitiveTypeSchema = Union[
@@ -40,6 +41,13 @@ class TextSerializer(Serializer):
         self._computed = computed
         self._nillable = nillable
 
+    @property
+    def writes_sub_elements(self) -> bool:
+        return False
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return True
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -64,9 +72,10 @@ class TextSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[str]:
         if self._computed:
             return None
@@ -80,6 +89,33 @@ class TextSerializer(Serializer):
         default = '' if empty_as_string else None
         return element.pop_text() or default
 
+    def compile_deserializer(self) -> FieldDeserializer:
+        if self._nillable:
+            def deserializer(
+                    element: XmlElementReader,
+                    context: Optional[Dict[str, Any]],
+                    sourcemap: Optional[Dict[Location, int]],
+                    loc: Location,
+                    empty_as_string: bool,
+                    validation: ValidationMode,
+            ) -> Optional[str]:
+                if is_element_nill(element):
+                    return None
+
+                return element.pop_text() or ('' if empty_as_string else None)
+        else:
+            def deserializer(
+                    element: XmlElementReader,
+                    context: Optional[Dict[str, Any]],
+                    sourcemap: Optional[Dict[Location, int]],
+                    loc: Location,
+                    empty_as_string: bool,
+                    validation: ValidationMode,
+            ) -> Optional[str]:
+                return element.pop_text() or ('' if empty_as_string else None)
+
+        return deserializer
+
 
 class AttributeSerializer(Serializer):
     @classmethod
@@ -105,6 +141,13 @@ class AttributeSerializer(Serializer):
         self._attr_name = QName.from_alias(tag=name, ns=ns, nsmap=nsmap, is_attr=True).uri
         self._computed = computed
 
+    @property
+    def writes_sub_elements(self) -> bool:
+        return False
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return True
+
     @property
     def attr_name(self) -> str:
         return self._attr_name
@@ -131,9 +174,10 @@ class AttributeSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[str]:
         if self._computed:
             return None
@@ -143,6 +187,21 @@ class AttributeSerializer(Serializer):
 
         return element.pop_attrib(self._attr_name)
 
+    def compile_deserializer(self) -> FieldDeserializer:
+        attr_name = self._attr_name
+
+        def deserializer(
+                element: XmlElementReader,
+                context: Optional[Dict[str, Any]],
+                sourcemap: Optional[Dict[Location, int]],
+                loc: Location,
+                empty_as_string: bool,
+                validation: ValidationMode,
+        ) -> Optional[str]:
+            return element.pop_attrib(attr_name)
+
+        return deserializer
+
 
 class ElementSerializer(TextSerializer):
     @classmethod
@@ -174,6 +233,17 @@ class ElementSerializer(TextSerializer):
         self._search_mode = search_mode
         self._element_name = QName.from_alias(tag=name, ns=ns, nsmap=nsmap).uri
 
+    @property
+    def writes_sub_elements(self) -> bool:
+        return True
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        if not can_prune(self._search_mode):
+            return False
+
+        bind_element(binding, self._element_name, {})
+        return True
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -202,9 +272,10 @@ class ElementSerializer(TextSerializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[str]:
         if self._computed:
             return None
@@ -213,13 +284,39 @@ class ElementSerializer(TextSerializer):
             return None
 
         if (sub_element := element.pop_element(self._element_name, self._search_mode)) is not None:
-            sourcemap[loc] = sub_element.get_sourceline()
+            if sourcemap is not None:
+                sourcemap[loc] = sub_element.get_sourceline()
             return super().deserialize(
                 sub_element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+                validation=validation,
             )
         else:
             return None
 
+    def compile_deserializer(self) -> FieldDeserializer:
+        element_name = self._element_name
+        search_mode = self._search_mode
+        nillable = self._nillable
+
+        def deserializer(
+                element: XmlElementReader,
+                context: Optional[Dict[str, Any]],
+                sourcemap: Optional[Dict[Location, int]],
+                loc: Location,
+                empty_as_string: bool,
+                validation: ValidationMode,
+        ) -> Optional[str]:
+            if (sub_element := element.pop_element(element_name, search_mode)) is None:
+                return None
+            if sourcemap is not None:
+                sourcemap[loc] = sub_element.get_sourceline()
+            if nillable and is_element_nill(sub_element):
+                return None
+
+            return sub_element.pop_text() or ('' if empty_as_string else None)
+
+        return deserializer
+
 
 def from_core_schema(schema: PrimitiveTypeSchema, ctx: Serializer.Context) -> Serializer:
     if ctx.entity_location is EntityLocation.ELEMENT:
@@ -4,8 +4,8 @@ from pydantic_core import core_schema as pcs
 
 from pydantic_xml import errors
 from pydantic_xml.element import XmlElementReader, XmlElementWriter
-from pydantic_xml.serializers.serializer import SearchMode, Serializer
-from pydantic_xml.typedefs import EntityLocation, Location, NsMap
+from pydantic_xml.serializers.serializer import SearchMode, Serializer, ValidationMode, bind_element, can_prune
+from pydantic_xml.typedefs import ElementBinding, EntityLocation, Location, NsMap
 from pydantic_xml.utils import QName, merge_nsmaps, select_ns
 
 
@@ -29,6 +29,18 @@ class ElementSerializer(Serializer):
         self._search_mode = search_mode
         self._element_name = QName.from_alias(tag=name, ns=ns, nsmap=nsmap).uri
 
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        if not can_prune(self._search_mode):
+            return False
+
+        # raw element is consumed as is so none of its sub-elements can be pruned
+        bind_element(binding, self._element_name, None)
+        return True
+
+    @property
+    def encoded_required(self) -> bool:
+        return False
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -54,9 +66,10 @@ class ElementSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[str]:
         if self._computed:
             return None
@@ -65,7 +78,8 @@ class ElementSerializer(Serializer):
             return None
 
         if (sub_element := element.pop_element(self._element_name, self._search_mode, remove=True)) is not None:
-            sourcemap[loc] = sub_element.get_sourceline()
+            if sourcemap is not None:
+                sourcemap[loc] = sub_element.get_sourceline()
             return sub_element.to_native()
         else:
             return None
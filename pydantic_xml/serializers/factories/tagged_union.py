@@ -1,6 +1,7 @@
 import typing
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
+import pydantic_core as pdc
 from pydantic_core import core_schema as pcs
 
 import pydantic_xml as pxml
@@ -9,8 +10,8 @@ from pydantic_xml.element import XmlElementReader, XmlElementWriter
 from pydantic_xml.serializers import factories
 from pydantic_xml.serializers.factories.model import ModelProxySerializer
 from pydantic_xml.serializers.factories.primitive import AttributeSerializer
-from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, SearchMode, Serializer
-from pydantic_xml.typedefs import Location
+from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, SearchMode, Serializer, ValidationMode
+from pydantic_xml.typedefs import ElementBinding, Location
 
 
 class ModelSerializer(Serializer):
@@ -66,31 +67,55 @@ class ModelSerializer(Serializer):
         self._inner_serializers = inner_serializers
         self._search_mode = search_mode
 
+        # choices dispatch table: (element name, discriminating attribute value) -> (choice index, serializer)
+        self._choices: Dict[Tuple[str, str], Tuple[int, ModelProxySerializer]] = {}
+        for idx, (tag, serializer) in enumerate(inner_serializers.items()):
+            self._choices.setdefault((serializer.element_name, tag), (idx, serializer))
+        # distinct choices element names in the choices order
+        self._element_names = tuple(dict.fromkeys(serializer.element_name for serializer in inner_serializers.values()))
+
+    @property
+    def encoded_required(self) -> bool:
+        return False
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return all(serializer.bind_elements(binding) for serializer in self._inner_serializers.values())
+
     def serialize(
             self,
             element: XmlElementWriter,
             value: 'pxml.BaseXmlModel',
-            encoded: Dict[str, Any],
+            encoded: Any,
             *,
             skip_empty: bool = False,
             exclude_none: bool = False,
             exclude_unset: bool = False,
     ) -> Optional[XmlElementWriter]:
-        if (tag := encoded.get(self._discriminator)) and (serializer := self._inner_serializers[tag]):
-            return serializer.serialize(
-                element, value, encoded, skip_empty=skip_empty, exclude_none=exclude_none, exclude_unset=exclude_unset,
-            )
+        if value is None:
+            return None
+
+        if encoded is pdc.PydanticUndefined:
+            # the choice is selected by the value discriminator since nothing is encoded in lazy encoding mode
+            tag = getattr(value, self._discriminator)
+        else:
+            tag = encoded.get(self._discriminator)
 
-        return None
+        if (serializer := self._inner_serializers.get(tag)) is None:
+            raise errors.SerializationError(f"tagged union choice not found for discriminator value {tag!r}")
+
+        return serializer.serialize(
+            element, value, encoded, skip_empty=skip_empty, exclude_none=exclude_none, exclude_unset=exclude_unset,
+        )
 
     def deserialize(
             self,
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional['pxml.BaseXmlModel']:
         if self._computed:
             return None
@@ -98,20 +123,31 @@ class ModelSerializer(Serializer):
         if element is None:
             return None
 
-        for tag, serializer in self._inner_serializers.items():
-            sub_element = element.find_element(
-                serializer.element_name,
-                self._search_mode,
-                look_behind=False,
-                step_forward=False,
-            )
-            if sub_element is not None and sub_element.get_attrib(self._discriminating_attr_name) == tag:
-                sourcemap[loc] = sub_element.get_sourceline()
-                return serializer.deserialize(
-                    element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
-                )
+        # every distinct element name candidate is found once and dispatched by the discriminating attribute,
+        # if candidates of several element names match the first choice is selected
+        choice: Optional[Tuple[int, ModelProxySerializer]] = None
+        choice_element: Optional[XmlElementReader] = None
+        for element_name in self._element_names:
+            sub_element = element.find_element(element_name, self._search_mode, look_behind=False, step_forward=False)
+            if sub_element is None:
+                continue
+
+            tag = sub_element.get_attrib(self._discriminating_attr_name)
+            if tag is not None and (candidate := self._choices.get((element_name, tag))) is not None:
+                if choice is None or candidate[0] < choice[0]:
+                    choice, choice_element = candidate, sub_element
+
+        if choice is None:
+            return None
+
+        assert choice_element is not None
+        if sourcemap is not None:
+            sourcemap[loc] = choice_element.get_sourceline()
 
-        return None
+        return choice[1].deserialize(
+            element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+            validation=validation,
+        )
 
 
 def from_core_schema(schema: pcs.TaggedUnionSchema, ctx: Serializer.Context) -> Serializer:
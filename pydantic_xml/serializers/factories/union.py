@@ -7,8 +7,8 @@ import pydantic_xml as pxml
 from pydantic_xml import errors, utils
 from pydantic_xml.element import XmlElementReader, XmlElementWriter
 from pydantic_xml.serializers.factories.model import ModelProxySerializer
-from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, Serializer
-from pydantic_xml.typedefs import Location
+from pydantic_xml.serializers.serializer import TYPE_FAMILY, SchemaTypeFamily, Serializer, ValidationMode
+from pydantic_xml.typedefs import ElementBinding, Location
 
 
 class PrimitiveTypeSerializer(Serializer):
@@ -34,6 +34,13 @@ class PrimitiveTypeSerializer(Serializer):
         self._computed = computed
         self._inner_serializer = inner_serializer
 
+    @property
+    def writes_sub_elements(self) -> bool:
+        return self._inner_serializer.writes_sub_elements
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return self._inner_serializer.bind_elements(binding)
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -53,15 +60,17 @@ class PrimitiveTypeSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[str]:
         if self._computed:
             return None
 
         return self._inner_serializer.deserialize(
             element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+            validation=validation,
         )
 
 
@@ -96,6 +105,13 @@ class ModelSerializer(Serializer):
         self._inner_serializers = inner_serializers
         self._hide_input_in_errors = hide_input_in_errors
 
+    @property
+    def encoded_required(self) -> bool:
+        return False
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        return all(serializer.bind_elements(binding) for serializer in self._inner_serializers)
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -122,9 +138,10 @@ class ModelSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional['pxml.BaseXmlModel']:
         if self._computed:
             return None
@@ -135,19 +152,24 @@ class ModelSerializer(Serializer):
         union_errors: Dict[Union[None, str, int], pd.ValidationError] = {}
         result: Any = None
         for serializer in self._inner_serializers:
-            snapshot = element.create_snapshot()
+            checkpoint = element.create_checkpoint()
             try:
-                if (
-                    result := serializer.deserialize(
-                        snapshot, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
-                    )
-                ) is None:
-                    continue
-                else:
-                    element.apply_snapshot(snapshot)
-                    return result
+                # the union choice is selected by validation so the choices are always validated
+                result = serializer.deserialize(
+                    element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+                    validation=(
+                        ValidationMode.DOCUMENT if validation is ValidationMode.DEFERRED else ValidationMode.MODEL
+                    ),
+                )
             except pd.ValidationError as e:
+                element.rollback_checkpoint(checkpoint)
                 union_errors[e.title] = e
+            else:
+                if result is None:
+                    element.rollback_checkpoint(checkpoint)
+                else:
+                    element.release_checkpoint(checkpoint)
+                    return result
 
         if union_errors:
             element.step_forward()
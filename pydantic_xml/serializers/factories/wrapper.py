@@ -3,8 +3,8 @@ from typing import Any, Dict, Optional, Sized
 from pydantic_core import core_schema as pcs
 
 from pydantic_xml.element import XmlElementReader, XmlElementWriter
-from pydantic_xml.serializers.serializer import SearchMode, Serializer
-from pydantic_xml.typedefs import Location, NsMap
+from pydantic_xml.serializers.serializer import SearchMode, Serializer, ValidationMode, bind_element, can_prune
+from pydantic_xml.typedefs import ElementBinding, Location, NsMap
 from pydantic_xml.utils import QName, merge_nsmaps, select_ns
 
 
@@ -39,6 +39,24 @@ class ElementPathSerializer(Serializer):
         self._computed = computed
         self._inner_serializer = inner_serializer
 
+    @property
+    def encoded_required(self) -> bool:
+        return self._inner_serializer.encoded_required
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        if not can_prune(self._search_mode):
+            return False
+
+        path_binding: ElementBinding = {}
+        if not self._inner_serializer.bind_elements(path_binding):
+            return False
+
+        for part in reversed(self._path[1:]):
+            path_binding = {part: path_binding}
+        bind_element(binding, self._path[0], path_binding)
+
+        return True
+
     def serialize(
             self,
             element: XmlElementWriter,
@@ -69,9 +87,10 @@ class ElementPathSerializer(Serializer):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[Any]:
         if self._computed:
             return None
@@ -82,9 +101,11 @@ class ElementPathSerializer(Serializer):
         if sub_elements := element.find_sub_element(self._path, self._search_mode):
             sub_element = sub_elements[-1]
             if len(sub_elements) == len(self._path):
-                sourcemap[loc] = sub_element.get_sourceline()
+                if sourcemap is not None:
+                    sourcemap[loc] = sub_element.get_sourceline()
                 return self._inner_serializer.deserialize(
                     sub_element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+                    validation=validation,
                 )
             else:
                 return None
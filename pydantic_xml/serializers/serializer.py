@@ -1,18 +1,21 @@
 import abc
 import dataclasses as dc
+import threading
 import typing
-from collections import ChainMap
-from enum import IntEnum
+from collections import ChainMap, OrderedDict
+from enum import Enum, IntEnum
 from functools import cached_property
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Dict, Hashable, NamedTuple, Optional, Tuple
 
 from pydantic_core import core_schema as pcs
 
+from pydantic_xml import config
 from pydantic_xml.element import SearchMode, XmlElementReader, XmlElementWriter
+from pydantic_xml.element.native import ElementT
 from pydantic_xml.errors import ModelError
 from pydantic_xml.fields import XmlEntityInfoP
-from pydantic_xml.typedefs import EntityLocation, Location, NsMap
-from pydantic_xml.utils import select_ns
+from pydantic_xml.typedefs import ElementBinding, EntityLocation, Location, NsMap
+from pydantic_xml.utils import merge_nsmaps, select_ns
 
 from . import factories
 
@@ -26,6 +29,14 @@ def encode_primitive(value: Any) -> str:
         return str(value)
 
 
+def encode_fallback(value: Any) -> Any:
+    """
+    Pydantic encoding fallback. Raw element values are not encoded since they are serialized natively.
+    """
+
+    return value if not isinstance(value, ElementT) else None
+
+
 class SchemaTypeFamily(IntEnum):
     META = 0
     PRIMITIVE = 1
@@ -94,6 +105,94 @@ TYPE_FAMILY = {
 }
 
 
+class ValidationMode(str, Enum):
+    """
+    Deserialized data validation mode.
+
+    model: every model is validated separately as soon as it is deserialized.
+    document: the model and all its sub-models are validated at once.
+    deferred: the model is not validated but returned as a raw data to be validated by the parent one.
+    none: models are constructed without validation.
+    """
+
+    MODEL = 'model'
+    DOCUMENT = 'document'
+    DEFERRED = 'deferred'
+    NONE = 'none'
+
+
+# serializers of these families report validation errors titled with the model name
+MODEL_NAME_DEPENDENT_FAMILIES = frozenset((
+    SchemaTypeFamily.HOMOGENEOUS_COLLECTION,
+    SchemaTypeFamily.TUPLE,
+    SchemaTypeFamily.UNION,
+    SchemaTypeFamily.CALL,
+))
+
+
+SchemaKeysMemo = Dict[int, Tuple[Any, Hashable]]
+
+
+def schema_key(value: Any, memo: Optional[SchemaKeysMemo] = None) -> Hashable:
+    """
+    Builds a structural key of a core schema. Sub-models are identified by their classes
+    since model fields are serialized by the sub-model serializers. Schema metadata is ignored.
+
+    :param value: core schema or its part
+    :param memo: already built keys by schema part identity; parts are stored along with the keys
+                 to keep them alive, otherwise an identity could be reused
+    :return: hashable key
+    """
+
+    if isinstance(value, (dict, list, tuple)):
+        if memo is not None and (entry := memo.get(id(value))) is not None:
+            return entry[1]
+
+        key: Hashable
+        if isinstance(value, dict):
+            if value.get('type') == 'model':
+                key = ('model', value['cls'])
+            else:
+                key = tuple((name, schema_key(item, memo)) for name, item in value.items() if name != 'metadata')
+        else:
+            key = tuple(schema_key(item, memo) for item in value)
+
+        if memo is not None:
+            memo[id(value)] = (value, key)
+
+        return key
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(schema_key(item, memo) for item in value)
+
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+
+    return value
+
+
+def entity_info_key(entity_info: Optional[XmlEntityInfoP]) -> Hashable:
+    if entity_info is None:
+        return None
+
+    return (
+        entity_info.location,
+        entity_info.path,
+        entity_info.ns,
+        tuple(entity_info.nsmap.items()) if entity_info.nsmap is not None else None,
+        entity_info.nillable,
+        entity_info_key(entity_info.wrapped),
+    )
+
+
+# model field deserializer: (element, context, sourcemap, loc, empty_as_string, validation) -> value
+FieldDeserializer = typing.Callable[
+    [XmlElementReader, Optional[Dict[str, Any]], Optional[Dict[Location, int]], Location, bool, ValidationMode],
+    Any,
+]
+
+
 class Serializer(abc.ABC):
     @dc.dataclass(frozen=True)
     class Context:
@@ -112,6 +211,9 @@ class Serializer(abc.ABC):
 
         hide_input_in_errors: bool = False
 
+        # schema keys are shared by all the contexts of a model so that each sub-schema key is built once
+        schema_keys: SchemaKeysMemo = dc.field(default_factory=dict, compare=False, repr=False)
+
         parent_ctx: Optional['Serializer.Context'] = None
 
         @property
@@ -153,13 +255,33 @@ class Serializer(abc.ABC):
         @cached_property
         def parent_nsmap(self) -> Optional[NsMap]:
             if parent_ctx := self.parent_ctx:
-                return {
-                    **(parent_ctx.entity_nsmap or {}),
-                    **(parent_ctx.parent_nsmap or {}),
-                }
+                return merge_nsmaps(parent_ctx.parent_nsmap, parent_ctx.entity_nsmap)
 
             return None
 
+        @cached_property
+        def cache_key(self) -> Hashable:
+            """
+            Context variables a serializer built in the context depends on except the model name.
+            Definitions are not included since schema references are unique.
+            """
+
+            parent_nsmap = self.parent_nsmap
+            return (
+                self.field_name,
+                self.field_alias,
+                self.field_computed,
+                entity_info_key(self.entity_info),
+                self.namespaced_attrs,
+                self.search_mode,
+                self.optional,
+                self.has_default,
+                self.hide_input_in_errors,
+                self.top,
+                self.parent_ns,
+                tuple(parent_nsmap.items()) if parent_nsmap is not None else None,
+            )
+
         def child(self, **kwargs: Any) -> 'Serializer.Context':
             """
             Creates child context.
@@ -175,7 +297,12 @@ class Serializer(abc.ABC):
     @classmethod
     def parse_core_schema(cls, schema: pcs.CoreSchema, ctx: Context) -> 'Serializer':
         schema, ctx = cls.preprocess_schema(schema, ctx)
-        return cls.select_serializer(schema, ctx)
+
+        # model serializers are built once per model class
+        if ctx.top and TYPE_FAMILY.get(schema['type']) is SchemaTypeFamily.MODEL:
+            return cls.select_serializer(schema, ctx)
+        else:
+            return SERIALIZER_CACHE.get_or_build(schema, ctx, cls.select_serializer)
 
     @classmethod
     def preprocess_schema(cls, schema: pcs.CoreSchema, ctx: Context) -> Tuple[pcs.CoreSchema, Context]:
@@ -273,6 +400,61 @@ class Serializer(abc.ABC):
         else:
             raise AssertionError("unreachable")
 
+    @property
+    def encoded_required(self) -> bool:
+        """
+        Whether the serializer uses the encoded value. If not the value is not encoded
+        in lazy encoding mode and `pydantic_core.PydanticUndefined` is passed instead.
+        """
+
+        return True
+
+    @property
+    def writes_sub_elements(self) -> bool:
+        """
+        Whether the serializer may create sub-elements of the element it serializes a value to.
+        If not only the element attributes and text are set.
+        """
+
+        return True
+
+    def bind_elements(self, binding: ElementBinding) -> bool:
+        """
+        Adds the sub-elements the serializer consumes from the element it deserializes a value from to the binding.
+        Sub-elements that are not bound are pruned during deserialization.
+
+        :param binding: element binding
+        :return: `False` if the element sub-elements can't be pruned otherwise `True`
+        """
+
+        return False
+
+    def compile_deserializer(self) -> FieldDeserializer:
+        """
+        Compiles the serializer into a model field deserializer. The serializer invariants are bound
+        to the deserializer so that they are not looked up on each call. The deserializer is called
+        with positional arguments only, the element is never `None` and the field is never a computed one.
+
+        :return: field deserializer
+        """
+
+        deserialize = self.deserialize
+
+        def deserializer(
+                element: XmlElementReader,
+                context: Optional[Dict[str, Any]],
+                sourcemap: Optional[Dict[Location, int]],
+                loc: Location,
+                empty_as_string: bool,
+                validation: ValidationMode,
+        ) -> Any:
+            return deserialize(
+                element, context=context, sourcemap=sourcemap, loc=loc, empty_as_string=empty_as_string,
+                validation=validation,
+            )
+
+        return deserializer
+
     @abc.abstractmethod
     def serialize(
             self,
@@ -289,7 +471,8 @@ class Serializer(abc.ABC):
 
         :param element: xml element the value is serialized to
         :param value: original value
-        :param encoded: encoded value (encoded by pydantic)
+        :param encoded: encoded value (encoded by pydantic) or `pydantic_core.PydanticUndefined`
+                        if the value is not encoded yet
         :param skip_empty: skip empty element
         :param exclude_none: exclude `None` values
         :param exclude_unset: exclude unset values
@@ -302,17 +485,144 @@ class Serializer(abc.ABC):
             element: Optional[XmlElementReader],
             *,
             context: Optional[Dict[str, Any]],
-            sourcemap: Dict[Location, int],
+            sourcemap: Optional[Dict[Location, int]],
             loc: Location,
             empty_as_string: bool,
+            validation: ValidationMode = ValidationMode.MODEL,
     ) -> Optional[Any]:
         """
         Deserializes a value from the xml element.
 
         :param element: xml element the value is deserialized from
         :param context: pydantic validation context
-        :param sourcemap: source-to-element mapping
+        :param sourcemap: source-to-element mapping (`None` if source lines are not tracked)
         :param loc: entity location
         :param empty_as_string: deserialize empty element data as empty string not None
+        :param validation: deserialized data validation mode
         :return: deserialized value
         """
+
+
+def bind_element(binding: ElementBinding, tag: str, sub_binding: Optional[ElementBinding]) -> None:
+    """
+    Adds a sub-element to the element binding merging it with the already bound one.
+
+    :param binding: element binding
+    :param tag: sub-element tag
+    :param sub_binding: sub-element binding (`None` if all the sub-element sub-elements are consumed)
+    """
+
+    if tag not in binding:
+        binding[tag] = sub_binding
+    elif (bound := binding[tag]) is not None and sub_binding is not None:
+        # bindings are shared between models so they are copied on merge
+        merged = dict(bound)
+        for sub_tag, sub_sub_binding in sub_binding.items():
+            bind_element(merged, sub_tag, sub_sub_binding)
+        binding[tag] = merged
+    else:
+        binding[tag] = None
+
+
+def can_prune(search_mode: SearchMode) -> bool:
+    """
+    Checks if the unbound sub-elements of an element searched in the provided mode can be pruned.
+    Ordered and unordered searches skip unmatched sub-elements so the unbound ones never affect
+    the search result. The strict search stops at the first unmatched sub-element, so pruning
+    would make a model accept a document with unknown elements between the bound ones.
+
+    :param search_mode: sub-elements search mode
+    :return: `True` if the unbound sub-elements can be pruned otherwise `False`
+    """
+
+    return search_mode != SearchMode.STRICT
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class SerializerCache:
+    """
+    Serializers cache. Serializers are keyed by the core schema structure and the building context
+    so that identical sub-schemas are parsed once and the built serializer trees are shared between models
+    (generic model parametrizations, dynamically created models and so on).
+    The least recently used serializers are evicted when the cache is full.
+
+    Keep in mind that the cached serializers keep the referenced model classes alive.
+
+    :param maxsize: cache maximum size (`0` disables the cache)
+    """
+
+    def __init__(self, maxsize: int):
+        self._maxsize = maxsize
+        self._cache: 'OrderedDict[Hashable, Serializer]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get_or_build(
+            self,
+            schema: pcs.CoreSchema,
+            ctx: Serializer.Context,
+            builder: typing.Callable[[pcs.CoreSchema, Serializer.Context], Serializer],
+    ) -> Serializer:
+        """
+        Returns the cached serializer for the schema or builds a new one.
+
+        :param schema: core schema
+        :param ctx: serializer context
+        :param builder: serializer builder
+        :return: serializer
+        """
+
+        if self._maxsize <= 0:
+            return builder(schema, ctx)
+
+        key: Hashable
+        if TYPE_FAMILY.get(schema['type']) in MODEL_NAME_DEPENDENT_FAMILIES or \
+                ctx.entity_location is EntityLocation.WRAPPED:
+            key = (schema_key(schema, ctx.schema_keys), ctx.cache_key, ctx.model_name)
+        else:
+            key = (schema_key(schema, ctx.schema_keys), ctx.cache_key)
+
+        with self._lock:
+            if (serializer := self._cache.get(key)) is not None:
+                self._cache.move_to_end(key)
+                self._hits += 1
+                return serializer
+
+        # sub-schemas are parsed recursively, so the lock is not held while building
+        serializer = builder(schema, ctx)
+
+        with self._lock:
+            self._misses += 1
+            self._cache[key] = serializer
+            if len(self._cache) > self._maxsize:
+                self._cache.popitem(last=False)
+
+        return serializer
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Returns the cache statistics.
+        """
+
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._cache))
+
+    def cache_clear(self) -> None:
+        """
+        Clears the cache and its statistics.
+        """
+
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+SERIALIZER_CACHE = SerializerCache(config.SERIALIZER_CACHE_SIZE)
@@ -1,8 +1,41 @@
+import mmap
 from enum import IntEnum
-from typing import Dict, Tuple, Union
+from typing import Any, Dict, Literal, Optional, Protocol, Tuple, Union
 
 Location = Tuple[Union[str, int], ...]
 NsMap = Dict[str, str]
+# xml document source (buffer protocol objects are parsed without copying)
+XmlSource = Union[str, bytes, bytearray, memoryview, mmap.mmap]
+# xml document compression ('infer' detects it by the file name extension)
+Compression = Literal['infer', 'gzip', 'bz2', 'xz', 'zstd']
+# sub-elements consumed from an element mapped to their own bindings (`None` if all the sub-elements are consumed)
+ElementBinding = Dict[str, Optional['ElementBinding']]
+
+
+class FrozenNsMap(Dict[str, str]):
+    """
+    Immutable namespace map. Frozen maps are interned (see `utils.intern_nsmap`)
+    so that equal maps can be compared by identity.
+    """
+
+    __slots__ = ()
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError(f"{self.__class__.__name__} is immutable")
+
+    __setitem__ = __delitem__ = __ior__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+    def __copy__(self) -> 'FrozenNsMap':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenNsMap':
+        return self
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        from pydantic_xml.utils import intern_nsmap
+
+        return intern_nsmap, (dict(self),)
 
 
 class EntityLocation(IntEnum):
@@ -13,3 +46,12 @@ class EntityLocation(IntEnum):
     ELEMENT = 1  # entity data is located at xml element
     ATTRIBUTE = 2  # entity data is located at xml attribute
     WRAPPED = 3  # entity data is wrapped by an element
+
+
+class AsyncReader(Protocol):
+    """
+    Asynchronous byte stream (like `asyncio.StreamReader`).
+    """
+
+    async def read(self, n: int = -1) -> bytes:
+        ...
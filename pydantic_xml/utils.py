@@ -1,8 +1,15 @@
+import bz2
+import contextlib
 import dataclasses as dc
+import functools
+import gzip
+import importlib
 import itertools as it
+import lzma
+import os
 import re
-from collections import ChainMap
-from typing import Dict, Iterable, List, Optional, Union, cast
+import zlib
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
 
 import pydantic as pd
 import pydantic_core as pdc
@@ -10,7 +17,26 @@ import pydantic_core as pdc
 from pydantic_xml import errors
 
 from .element.native import etree
-from .typedefs import Location, NsMap
+from .typedefs import Compression, FrozenNsMap, Location, NsMap
+
+RESERVED_NS_PREFIX_RE = re.compile(r'ns\d+$')
+URI_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=URI_CACHE_SIZE)
+def split_uri(uri: str) -> Tuple[Optional[str], str]:
+    """
+    Splits an entity uri into the namespace and the tag. The results are cached
+    since documents usually consist of a limited set of tags.
+
+    :param uri: entity uri in format '{namespace}tag'
+    :return: namespace (`None` if the uri is not qualified) and tag
+    """
+
+    if uri[:1] == '{' and (ns_end := uri.rfind('}')) != -1:
+        return uri[1:ns_end], uri[ns_end + 1:]
+
+    return None, uri
 
 
 @dc.dataclass(frozen=True)
@@ -34,10 +60,9 @@ class QName:
         :return: qualified name
         """
 
-        if (m := re.match(r'({(.*)})?(.*)', uri)) is None:
-            raise ValueError
+        ns, tag = split_uri(uri)
 
-        return cls(tag=m[3], ns=m[2])
+        return cls(tag=tag, ns=ns)
 
     @classmethod
     def from_alias(
@@ -72,15 +97,45 @@ class QName:
         return self.uri
 
 
+_interned_nsmaps: Dict[Tuple[Tuple[str, str], ...], FrozenNsMap] = {}
+
+
+def intern_nsmap(nsmap: NsMap) -> FrozenNsMap:
+    """
+    Returns the interned frozen copy of the namespace map.
+
+    :param nsmap: namespace map
+    :return: frozen namespace map
+    """
+
+    if isinstance(nsmap, FrozenNsMap):
+        return nsmap
+
+    key = tuple(nsmap.items())
+    if (frozen_nsmap := _interned_nsmaps.get(key)) is None:
+        frozen_nsmap = _interned_nsmaps.setdefault(key, FrozenNsMap(nsmap))
+
+    return frozen_nsmap
+
+
 def merge_nsmaps(*maps: Optional[NsMap]) -> NsMap:
     """
-    Merges multiple namespace maps into s single one respecting provided order.
+    Merges multiple namespace maps into s single one respecting provided order
+    (the first map a prefix is found in takes precedence).
 
     :param maps: namespace maps
-    :return: merged namespace
+    :return: merged interned namespace map
     """
 
-    return cast(NsMap, ChainMap(*(nsmap for nsmap in maps if nsmap)))
+    nsmaps = [nsmap for nsmap in maps if nsmap]
+    if len(nsmaps) == 1:
+        return intern_nsmap(nsmaps[0])
+
+    merged: NsMap = {}
+    for nsmap in reversed(nsmaps):
+        merged.update(nsmap)
+
+    return intern_nsmap(merged)
 
 
 def register_nsmap(nsmap: NsMap) -> None:
@@ -89,10 +144,144 @@ def register_nsmap(nsmap: NsMap) -> None:
     """
 
     for prefix, uri in nsmap.items():
-        if prefix != '' and not re.match(r"ns\d+$", prefix):  # skip default namespace and reserved ones
+        if prefix != '' and not RESERVED_NS_PREFIX_RE.match(prefix):  # skip default namespace and reserved ones
             etree.register_namespace(prefix, uri)
 
 
+class CompressionCodec(NamedTuple):
+    """
+    Compression codec.
+
+    :param open: opens a compressed file (accepts a file name or a file object and a mode)
+    :param decompressor: creates an incremental decompressor (an object with `decompress(data)` method)
+    """
+
+    open: Callable[[Any, str], Any]
+    decompressor: Callable[[], Any]
+
+
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.bz2': 'bz2', '.xz': 'xz', '.zst': 'zstd'}
+
+
+@functools.lru_cache(maxsize=None)
+def get_compression_codec(compression: str) -> CompressionCodec:
+    """
+    Returns the codec of the compression.
+
+    :param compression: compression name
+    :return: compression codec
+    """
+
+    if compression == 'gzip':
+        return CompressionCodec(gzip.open, functools.partial(zlib.decompressobj, zlib.MAX_WBITS | 16))
+    elif compression == 'bz2':
+        return CompressionCodec(bz2.open, bz2.BZ2Decompressor)
+    elif compression == 'xz':
+        return CompressionCodec(lzma.open, lzma.LZMADecompressor)
+    elif compression == 'zstd':
+        try:
+            zstd = importlib.import_module('compression.zstd')  # python 3.14+
+            return CompressionCodec(zstd.open, zstd.ZstdDecompressor)
+        except ImportError:
+            pass
+
+        try:
+            zstandard = importlib.import_module('zstandard')
+        except ImportError:
+            raise ImportError("zstd compression requires python 3.14+ or zstandard package") from None
+
+        return CompressionCodec(
+            functools.partial(zstandard.open, closefd=False),
+            lambda: zstandard.ZstdDecompressor().decompressobj(),
+        )
+    else:
+        raise ValueError(f"unsupported compression: {compression}")
+
+
+def resolve_compression(file: Any, compression: Optional[Compression]) -> Optional[str]:
+    """
+    Resolves the file compression.
+
+    :param file: file name or file object
+    :param compression: compression name or 'infer' to detect it by the file name extension
+    :return: compression name or `None` if the file is not compressed
+    """
+
+    if compression == 'infer':
+        if isinstance(file, (str, os.PathLike)):
+            return COMPRESSION_EXTENSIONS.get(os.path.splitext(file)[1].lower())
+        else:
+            return None
+
+    return compression
+
+
+class StreamDecompressor:
+    """
+    Incremental decompressor of a compressed stream. The stream may consist of several
+    concatenated members (multi-member gzip, multi-stream bz2 or xz), each one is decompressed
+    by a new decompressor.
+
+    :param compression: compression name
+    """
+
+    def __init__(self, compression: str):
+        self._make_decompressor = get_compression_codec(compression).decompressor
+        self._decompressor = self._make_decompressor()
+
+    def decompress(self, data: bytes) -> bytes:
+        """
+        Decompresses the next chunk of the stream.
+
+        :param data: compressed data
+        :return: decompressed data
+        """
+
+        chunks = []
+        while data:
+            chunks.append(self._decompressor.decompress(data))
+            if not getattr(self._decompressor, 'eof', False):
+                break
+
+            # the member is over, the rest of the data belongs to the next one
+            data = self._decompressor.unused_data
+            self._decompressor = self._make_decompressor()
+
+        return b''.join(chunks)
+
+    def flush(self) -> bytes:
+        """
+        Flushes the data buffered by the decompressor at the end of the stream.
+
+        :return: decompressed data
+        """
+
+        if (flush := getattr(self._decompressor, 'flush', None)) is not None:
+            return flush()
+
+        return b''
+
+
+@contextlib.contextmanager
+def open_compressed(file: Any, mode: str, compression: Optional[Compression]) -> Iterator[Any]:
+    """
+    Opens a compressed file. The data is compressed or decompressed incrementally as it is written or read.
+    A file object passed is not closed.
+
+    :param file: file name or file object
+    :param mode: file open mode
+    :param compression: compression name, 'infer' to detect it by the file name extension
+                        or `None` if the file is not compressed
+    :return: the file itself if it is not compressed otherwise a compressed file object
+    """
+
+    if (compression := resolve_compression(file, compression)) is None:
+        yield file
+    else:
+        with get_compression_codec(compression).open(file, mode) as compressed_file:
+            yield compressed_file
+
+
 def get_slots(o: object) -> Iterable[str]:
     return it.chain.from_iterable(getattr(cls, '__slots__', []) for cls in o.__class__.__mro__)
 
@@ -133,12 +322,14 @@ def into_validation_error(
 def set_validation_error_sourceline(
         err: pd.ValidationError,
         sourcemap: Dict[Location, int],
+        base_loc: Location,
         hide_input: bool,
 ) -> pd.ValidationError:
     line_errors: List[pdc.InitErrorDetails] = []
     for error in err.errors():
-        loc, sourceline = error['loc'], -1
-        while loc and (sourceline := sourcemap.get(loc, sourceline)) == -1:
+        # error locations are relative to the validated model location
+        loc, sourceline = base_loc + tuple(error['loc']), -1
+        while len(loc) > len(base_loc) and (sourceline := sourcemap.get(loc, sourceline)) == -1:
             loc = tuple(loc[:-1])
 
         line_errors.append(
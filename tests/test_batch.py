@@ -0,0 +1,57 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pydantic as pd
+import pytest
+from helpers import assert_xml_equal
+
+from pydantic_xml import BaseXmlModel, attr, element, errors
+
+
+class Message(BaseXmlModel, tag='model'):
+    attr1: int = attr()
+    element1: str = element()
+
+
+@pytest.mark.parametrize('executor_cls', [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_from_xml_many(executor_cls):
+    sources = [
+        '<model attr1="1"><element1>a</element1></model>',
+        '<model attr1="b"><element1>b</element1></model>',
+        '<model attr1="3"><element1>c</element1>',
+        b'<model attr1="4"><element1>d</element1></model>',
+    ]
+
+    if executor_cls is None:
+        results = Message.from_xml_many(sources)
+    else:
+        with executor_cls(max_workers=2) as executor:
+            results = Message.from_xml_many(sources, executor=executor, chunksize=2)
+
+    assert len(results) == 4
+    assert results[0] == Message(attr1=1, element1='a')
+    assert isinstance(results[1], pd.ValidationError)
+    assert results[1].errors()[0]['loc'] == ('attr1',)
+    assert isinstance(results[2], errors.ParsingError)
+    assert results[3] == Message(attr1=4, element1='d')
+
+
+@pytest.mark.parametrize('executor_cls', [None, ThreadPoolExecutor, ProcessPoolExecutor])
+def test_to_xml_many(executor_cls):
+    objs = [Message(attr1=idx, element1=str(idx)) for idx in range(10)]
+
+    if executor_cls is None:
+        results = Message.to_xml_many(objs)
+    else:
+        with executor_cls(max_workers=2) as executor:
+            results = Message.to_xml_many(objs, executor=executor, chunksize=3)
+
+    assert len(results) == len(objs)
+    for obj, result in zip(objs, results):
+        assert_xml_equal(result, obj.to_xml())
+
+
+def test_from_xml_many_unexpected_error():
+    sources = ['<model attr1="1"><element1>a</element1></model>']
+
+    with pytest.raises(TypeError):
+        Message.from_xml_many(sources, unknown_argument=True)
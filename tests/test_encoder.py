@@ -3,17 +3,21 @@ import ipaddress
 import sys
 from decimal import Decimal
 from enum import Enum
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 from uuid import UUID
 
 import pytest
 from helpers import assert_xml_equal
-from pydantic import SerializerFunctionWrapHandler, ValidatorFunctionWrapHandler, field_serializer, field_validator
-from pydantic import model_validator
+from pydantic import Field, SerializerFunctionWrapHandler, ValidatorFunctionWrapHandler, field_serializer
+from pydantic import field_validator, model_validator
 from pydantic.functional_serializers import PlainSerializer, WrapSerializer
 from pydantic.functional_validators import AfterValidator, BeforeValidator, WrapValidator
 
-from pydantic_xml import BaseXmlModel, element
+from pydantic_xml import BaseXmlModel, RootXmlModel, attr, computed_element, element
+
+
+class Enum1(Enum):
+    val1 = 1
 
 
 def test_primitive_types_encoding():
@@ -303,3 +307,132 @@ def test_model_validator():
     )
 
     assert actual_obj == expected_obj
+
+
+def test_lazy_encoding():
+    class TestSubModel1(BaseXmlModel, tag='submodel'):
+        type: Literal['type1'] = attr()
+        field1: dt.datetime = element()
+
+        @field_serializer('field1')
+        def serialize_field1(self, value: dt.datetime) -> float:
+            return value.timestamp()
+
+    class TestSubModel2(BaseXmlModel, tag='submodel'):
+        type: Literal['type2'] = attr()
+        field1: Decimal
+
+    class TestRootModel(RootXmlModel[dt.time], tag='root'):
+        pass
+
+    class TestModel(BaseXmlModel, tag='model'):
+        field1: dt.date = attr()
+        field2: Tuple[UUID, TestSubModel1] = element(tag='field2')
+        field3: List[Union[TestSubModel1, TestSubModel2]] = element()
+        field4: Optional[Union[TestSubModel1, TestSubModel2]] = Field(discriminator='type', default=None)
+        field5: Dict[str, bool] = element(tag='field5')
+        field6: TestRootModel
+        field7: Optional[int] = element(default=None)
+
+        @computed_element
+        def field8(self) -> Enum1:
+            return Enum1.val1
+
+    xml = '''
+    <model field1="2023-02-04">
+        <field2>a5bf7ff2-2b37-4ab2-a8f4-b8af1d1a9bd9</field2>
+        <field2 type="type1"><field1>1675468800.0</field1></field2>
+        <submodel type="type1"><field1>1675468800.0</field1></submodel>
+        <submodel type="type2">1.5</submodel>
+        <submodel type="type2">2.5</submodel>
+        <field5 key1="True" key2="False"/>
+        <root>12:30:00</root>
+        <field8>1</field8>
+    </model>
+    '''
+
+    obj = TestModel(
+        field1=dt.date(2023, 2, 4),
+        field2=(
+            UUID('a5bf7ff2-2b37-4ab2-a8f4-b8af1d1a9bd9'),
+            TestSubModel1(type='type1', field1=dt.datetime(2023, 2, 4, tzinfo=dt.timezone.utc)),
+        ),
+        field3=[
+            TestSubModel1(type='type1', field1=dt.datetime(2023, 2, 4, tzinfo=dt.timezone.utc)),
+            TestSubModel2(type='type2', field1=Decimal('1.5')),
+        ],
+        field4=TestSubModel2(type='type2', field1=Decimal('2.5')),
+        field5={'key1': True, 'key2': False},
+        field6=TestRootModel(dt.time(12, 30)),
+    )
+
+    actual_xml = obj.to_xml(lazy_encoding=True, skip_empty=True)
+    assert_xml_equal(actual_xml, obj.to_xml(skip_empty=True))
+    assert_xml_equal(actual_xml, xml.encode())
+
+
+def test_lazy_encoding_tagged_union_subclass():
+    class TestSubModel1(BaseXmlModel, tag='submodel1'):
+        type: Literal['type1'] = attr()
+        field1: int = element()
+
+    class TestSubModel2(BaseXmlModel, tag='submodel2'):
+        type: Literal['type2'] = attr()
+        field1: int = element()
+
+    class TestSubModel1Subclass(TestSubModel1, tag='submodel1'):
+        pass
+
+    class TestModel(BaseXmlModel, tag='model'):
+        field1: Union[TestSubModel1, TestSubModel2] = Field(discriminator='type')
+
+    obj = TestModel(field1=TestSubModel1Subclass(type='type1', field1=1))
+
+    actual_xml = obj.to_xml(lazy_encoding=True)
+    assert_xml_equal(actual_xml, obj.to_xml())
+    assert_xml_equal(actual_xml, b'<model><submodel1 type="type1"><field1>1</field1></submodel1></model>')
+
+
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python 3.9 and above")
+def test_lazy_encoding_sub_model_custom_serializers():
+    from typing import Annotated
+
+    class TestSubModel(BaseXmlModel, tag='submodel'):
+        field1: int = element()
+
+    def serialize_submodel(value: TestSubModel) -> Dict[str, int]:
+        return {'field1': value.field1 * 10}
+
+    class TestRootModel(RootXmlModel[Annotated[TestSubModel, PlainSerializer(serialize_submodel)]], tag='root'):
+        pass
+
+    class TestModel(BaseXmlModel, tag='model'):
+        field1: TestSubModel = element(tag='field1')
+        field2: Annotated[TestSubModel, PlainSerializer(serialize_submodel)] = element(tag='field2')
+        field3: List[Annotated[TestSubModel, PlainSerializer(serialize_submodel)]] = element(tag='field3')
+        field4: TestRootModel
+
+        @field_serializer('field1')
+        def serialize_field1(self, value: TestSubModel) -> Dict[str, int]:
+            return serialize_submodel(value)
+
+    obj = TestModel(
+        field1=TestSubModel(field1=1),
+        field2=TestSubModel(field1=2),
+        field3=[TestSubModel(field1=3), TestSubModel(field1=4)],
+        field4=TestRootModel(TestSubModel(field1=5)),
+    )
+
+    xml = '''
+    <model>
+        <field1><field1>10</field1></field1>
+        <field2><field1>20</field1></field2>
+        <field3><field1>30</field1></field3>
+        <field3><field1>40</field1></field3>
+        <root><submodel><field1>50</field1></submodel></root>
+    </model>
+    '''
+
+    actual_xml = obj.to_xml(lazy_encoding=True)
+    assert_xml_equal(actual_xml, obj.to_xml())
+    assert_xml_equal(actual_xml, xml.encode())
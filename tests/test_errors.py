@@ -217,3 +217,76 @@ def test_models_union_errors():
             },
         },
     ]
+
+
+def test_untracked_sourcelines_errors():
+    class TestSubModel(BaseXmlModel, tag='submodel'):
+        attr1: int = attr()
+
+    class TestModel(BaseXmlModel, tag='model'):
+        submodels: List[TestSubModel]
+        element1: int = element()
+
+    xml = '''
+        <model>
+            <submodel attr1="1"/>
+            <submodel attr1="a"/>
+            <element1>1</element1>
+        </model>
+    '''
+
+    assert TestModel.from_xml(
+        '<model><submodel attr1="1"/><element1>1</element1></model>',
+        track_sourcelines=False,
+    ) == TestModel(submodels=[TestSubModel(attr1=1)], element1=1)
+
+    with pytest.raises(pd.ValidationError) as tracked_exc:
+        TestModel.from_xml(xml)
+
+    with pytest.raises(pd.ValidationError) as untracked_exc:
+        TestModel.from_xml(xml, track_sourcelines=False)
+
+    assert untracked_exc.value.errors() == tracked_exc.value.errors()
+    assert untracked_exc.value.errors()[0]['ctx']['sourceline'] == fmt_sourceline(4)
+
+
+def test_document_validation_errors():
+    class TestSubModel(BaseXmlModel, tag='submodel'):
+        attr1: int = attr()
+        element1: int = element()
+
+    class TestModel(BaseXmlModel, tag='model'):
+        submodels: List[TestSubModel]
+        wrapped1: TestSubModel = wrapped('wrapper')
+
+    xml = '''
+        <model>
+            <submodel attr1="1"><element1>1</element1></submodel>
+            <submodel attr1="a">
+                <element1>b</element1>
+            </submodel>
+            <wrapper>
+                <submodel attr1="2"/>
+            </wrapper>
+        </model>
+    '''
+
+    assert TestModel.from_xml(
+        '<model><submodel attr1="1"><element1>1</element1></submodel>'
+        '<wrapper><submodel attr1="2"><element1>2</element1></submodel></wrapper></model>',
+        validate_once=True,
+    ) == TestModel(
+        submodels=[TestSubModel(attr1=1, element1=1)],
+        wrapped1=TestSubModel(attr1=2, element1=2),
+    )
+
+    with pytest.raises(pd.ValidationError) as model_exc:
+        TestModel.from_xml(xml)
+
+    with pytest.raises(pd.ValidationError) as document_exc:
+        TestModel.from_xml(xml, validate_once=True)
+
+    assert document_exc.value.errors() == model_exc.value.errors()
+    assert [err['ctx']['sourceline'] for err in document_exc.value.errors()] == [
+        fmt_sourceline(4), fmt_sourceline(5), fmt_sourceline(8),
+    ]
@@ -1,10 +1,10 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Union
 
 import pydantic as pd
 import pytest
 
 from pydantic_xml import BaseXmlModel, attr, element, wrapped
-from pydantic_xml.element.native import ElementT
+from pydantic_xml.element.native import ElementT, XmlElement, etree
 from tests.helpers import fmt_sourceline
 
 
@@ -280,3 +280,73 @@ def test_raw_extra_forbid(search_mode: str):
             },
         },
     ]
+
+
+@pytest.mark.parametrize('engine', ['tree', 'events'])
+def test_union_extra_forbid(engine: str):
+    class SubModel1(BaseXmlModel, tag='submodel', extra='forbid'):
+        attr1: int = attr()
+        element1: int = element()
+
+    class SubModel2(BaseXmlModel, tag='submodel', extra='forbid'):
+        attr2: int = attr()
+        element1: str = element()
+
+    class TestModel(BaseXmlModel, tag='model', extra='forbid'):
+        submodels: List[Union[SubModel1, SubModel2]]
+        flag: Optional[str] = element(default=None)
+
+    xml = '''
+    <model>
+        <submodel attr2="1"><element1>value</element1></submodel>
+        <submodel attr1="2"><element1>2</element1></submodel>
+        <flag/>
+    </model>
+    '''
+
+    actual_obj = TestModel.from_xml(xml, engine=engine)
+    expected_obj = TestModel(submodels=[SubModel2(attr2=1, element1='value'), SubModel1(attr1=2, element1=2)], flag='')
+    assert actual_obj.submodels == expected_obj.submodels
+
+    # entities left after a rolled back union choice are still reported
+    xml = '''
+    <model>
+        <submodel attr2="1"><element1>value<extra/>tail</element1></submodel>
+    </model>
+    '''
+
+    with pytest.raises(pd.ValidationError) as exc:
+        TestModel.from_xml(xml, engine=engine)
+
+    assert [err['input'] for err in exc.value.errors() if err['type'] == 'extra_forbidden'] == ['1', 'tail', 'tail']
+
+
+def test_unbound_counter():
+    element = XmlElement.from_native(etree.fromstring(
+        '<model attr1="1">\n  <element1>value</element1>\n  <element2/>\n  <element3 attr2="2"/>\n</model>',
+    ))
+    assert element.has_unbound()
+
+    assert element.pop_attrib('attr1') == '1'
+    assert element.pop_element('element1', 'strict').pop_text() == 'value'
+    assert element.has_unbound()
+
+    checkpoint = element.create_checkpoint()
+    assert element.pop_element('element3', 'unordered').pop_attrib('attr2') == '2'
+    element.rollback_checkpoint(checkpoint)
+    assert element.has_unbound()
+    assert [(attr, value) for _, attr, value in element.get_unbound()] == [('attr2', '2')]
+
+    assert element.pop_element('element3', 'unordered').pop_attrib('attr2') == '2'
+    assert not element.has_unbound()
+    assert element.get_unbound() == []
+
+
+def test_unbound_counter_sync():
+    element = XmlElement.from_native(etree.fromstring('<model attr1="1"><element1/><element2></element2></model>'))
+
+    assert element.pop_attrib('attr1') == '1'
+    # not touched empty sub-elements are counted until the sub-tree is checked
+    assert element.has_unbound()
+    assert element.get_unbound() == []
+    assert not element.has_unbound()
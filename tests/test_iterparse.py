@@ -0,0 +1,256 @@
+import asyncio
+import bz2
+import gzip
+import io
+import lzma
+from typing import Callable, List
+
+import pydantic as pd
+import pytest
+from helpers import fmt_sourceline, is_lxml_native
+
+from pydantic_xml import BaseXmlModel, attr, element
+from pydantic_xml.element import native
+from pydantic_xml.element.native import std
+
+
+def test_iter_from_xml():
+    class TestModel(BaseXmlModel, tag='item'):
+        attr1: int = attr()
+        element1: str = element()
+
+    xml = b'''
+    <items>
+        <header>header</header>
+        <item attr1="1"><element1>a</element1></item>
+        <item attr1="2"><element1>b</element1></item>
+        <item attr1="3"><element1>c</element1></item>
+    </items>
+    '''
+
+    actual_objs = list(TestModel.iter_from_xml(io.BytesIO(xml)))
+    expected_objs = [
+        TestModel(attr1=1, element1='a'),
+        TestModel(attr1=2, element1='b'),
+        TestModel(attr1=3, element1='c'),
+    ]
+
+    assert actual_objs == expected_objs
+
+
+def test_iterparse_processed_siblings_removed(monkeypatch):
+    xml = b'<items>' + b''.join(b'<item/><other/>' for _ in range(500)) + b'</items>'
+
+    roots = []
+    if not is_lxml_native():
+        std_iterparse = std.etree.iterparse
+
+        def tracking_iterparse(*args, **kwargs):
+            for event, element in std_iterparse(*args, **kwargs):
+                if not roots:
+                    roots.append(element)
+                yield event, element
+
+        monkeypatch.setattr(std.etree, 'iterparse', tracking_iterparse)
+
+    count = 0
+    for element in native.iterparse(io.BytesIO(xml), 'item'):
+        parent = element.getparent() if is_lxml_native() else roots[0]
+        # only the siblings processed since the previous item are left
+        assert list(parent).index(element) <= 2
+        count += 1
+
+    assert count == 500
+
+
+def test_iter_from_xml_file(tmp_path):
+    class TestSubModel(BaseXmlModel, tag='submodel'):
+        text: str
+
+    class TestModel(BaseXmlModel):
+        submodels: List[TestSubModel]
+
+    xml = b'''
+    <root>
+        <wrapper>
+            <record><submodel>1</submodel><submodel>2</submodel></record>
+        </wrapper>
+        <wrapper>
+            <record><submodel>3</submodel></record>
+        </wrapper>
+    </root>
+    '''
+
+    path = tmp_path / 'doc.xml'
+    path.write_bytes(xml)
+
+    actual_objs = list(TestModel.iter_from_xml(str(path), tag='record'))
+    expected_objs = [
+        TestModel(submodels=[TestSubModel(text='1'), TestSubModel(text='2')]),
+        TestModel(submodels=[TestSubModel(text='3')]),
+    ]
+
+    assert actual_objs == expected_objs
+
+
+def test_iter_from_xml_namespaced():
+    class TestModel(BaseXmlModel, tag='item', ns='tst', nsmap={'tst': 'http://test.org'}):
+        text: str
+
+    xml = b'''
+    <tst:items xmlns:tst="http://test.org">
+        <tst:item>1</tst:item>
+        <item>skipped</item>
+        <tst:item>2</tst:item>
+    </tst:items>
+    '''
+
+    actual_objs = list(TestModel.iter_from_xml(io.BytesIO(xml)))
+    expected_objs = [
+        TestModel(text='1'),
+        TestModel(text='2'),
+    ]
+
+    assert actual_objs == expected_objs
+
+
+def test_iter_from_xml_errors():
+    class TestModel(BaseXmlModel, tag='item'):
+        element1: int = element()
+
+    xml = b'''<items>
+        <item><element1>1</element1></item>
+        <item><element1>a</element1></item>
+    </items>
+    '''
+
+    objs = TestModel.iter_from_xml(io.BytesIO(xml))
+    assert next(objs) == TestModel(element1=1)
+
+    with pytest.raises(pd.ValidationError) as exc:
+        next(objs)
+
+    err = exc.value
+    assert err.errors() == [
+        {
+            'input': 'a',
+            'loc': ('element1',),
+            'msg': f'[line {fmt_sourceline(3)}]: Input should be a valid integer, unable to parse string as an integer',
+            'type': 'int_parsing',
+            'ctx': {
+                'orig': 'Input should be a valid integer, unable to parse string as an integer',
+                'sourceline': fmt_sourceline(3),
+            },
+        },
+    ]
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 1024])
+def test_aiter_from_xml(chunk_size: int):
+    class TestModel(BaseXmlModel, tag='item'):
+        attr1: int = attr()
+        element1: str = element()
+
+    xml = b'''
+    <items>
+        <header>header</header>
+        <item attr1="1"><element1>a</element1></item>
+        <item attr1="2"><element1>b</element1></item>
+        <item attr1="3"><element1>c</element1></item>
+    </items>
+    '''
+
+    async def collect_from_reader():
+        reader = asyncio.StreamReader()
+        reader.feed_data(xml)
+        reader.feed_eof()
+
+        return [obj async for obj in TestModel.aiter_from_xml(reader, chunk_size=chunk_size)]
+
+    async def collect_from_iterable():
+        async def chunks():
+            for i in range(0, len(xml), chunk_size):
+                yield xml[i:i + chunk_size]
+
+        return [obj async for obj in TestModel.aiter_from_xml(chunks())]
+
+    expected_objs = [
+        TestModel(attr1=1, element1='a'),
+        TestModel(attr1=2, element1='b'),
+        TestModel(attr1=3, element1='c'),
+    ]
+
+    assert asyncio.run(collect_from_reader()) == expected_objs
+    assert asyncio.run(collect_from_iterable()) == expected_objs
+
+
+def test_aiter_from_xml_single_line_reader():
+    class TestModel(BaseXmlModel, tag='item'):
+        attr1: int = attr()
+
+    # the document is larger than the asyncio.StreamReader line limit
+    xml = b'<items>' + b''.join(b'<item attr1="%d"/>' % idx for idx in range(10000)) + b'</items>'
+    assert len(xml) > 64 * 1024
+
+    async def collect():
+        reader = asyncio.StreamReader()
+        reader.feed_data(xml)
+        reader.feed_eof()
+
+        return [obj async for obj in TestModel.aiter_from_xml(reader)]
+
+    assert asyncio.run(collect()) == [TestModel(attr1=idx) for idx in range(10000)]
+
+def test_aiter_from_xml_compressed():
+    class TestModel(BaseXmlModel, tag='item'):
+        attr1: int = attr()
+
+    xml = gzip.compress(b'<items>' + b''.join(b'<item attr1="%d"/>' % idx for idx in range(100)) + b'</items>')
+
+    async def collect():
+        reader = asyncio.StreamReader()
+        reader.feed_data(xml)
+        reader.feed_eof()
+
+        return [obj async for obj in TestModel.aiter_from_xml(reader, chunk_size=16, compression='gzip')]
+
+    assert asyncio.run(collect()) == [TestModel(attr1=idx) for idx in range(100)]
+
+
+@pytest.mark.parametrize(
+    'compression, compress', [
+        ('gzip', gzip.compress),
+        ('bz2', bz2.compress),
+        ('xz', lzma.compress),
+    ],
+)
+def test_aiter_from_xml_multi_member_compressed(compression: str, compress: Callable[[bytes], bytes]):
+    class TestModel(BaseXmlModel, tag='item'):
+        attr1: int = attr()
+
+    xml = b'<items>' + b''.join(b'<item attr1="%d"/>' % idx for idx in range(10)) + b'</items>'
+    data = compress(xml[:len(xml) // 2]) + compress(xml[len(xml) // 2:])
+
+    async def collect(chunk_size: int):
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+
+        return [obj async for obj in TestModel.aiter_from_xml(reader, chunk_size=chunk_size, compression=compression)]
+
+    for chunk_size in (7, len(data)):
+        assert asyncio.run(collect(chunk_size)) == [TestModel(attr1=idx) for idx in range(10)]
+
+
+def test_aiter_from_xml_compression_infer():
+    class TestModel(BaseXmlModel, tag='item'):
+        attr1: int = attr()
+
+    async def collect():
+        reader = asyncio.StreamReader()
+        reader.feed_eof()
+
+        return [obj async for obj in TestModel.aiter_from_xml(reader, compression='infer')]
+
+    with pytest.raises(ValueError):
+        asyncio.run(collect())
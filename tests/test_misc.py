@@ -1,12 +1,22 @@
+import datetime as dt
+import inspect
+import mmap
 import re
 import sys
-from typing import Dict, List, Optional, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from enum import Enum
+from typing import Dict, Generic, List, Optional, Tuple, TypeVar, Union
 
 import pydantic as pd
 import pytest
-from helpers import assert_xml_equal
+from helpers import assert_xml_equal, is_lxml_native
 
 from pydantic_xml import BaseXmlModel, NoXml, RootXmlModel, attr, element, errors, wrapped
+from pydantic_xml.element.native import XmlElement, etree
+from pydantic_xml.model import LazySerializer, build_serializers
+from pydantic_xml.serializers import serializer as serializer_module
+from pydantic_xml.serializers.serializer import SerializerCache, ValidationMode, schema_key
 
 
 def test_xml_declaration():
@@ -485,3 +495,462 @@ def test_no_xml_annotation():
     assert actual_obj == expected_obj
 
     assert actual_obj.model_dump() == expected_json
+
+
+def test_lazy_element_loading():
+    class TestModel(BaseXmlModel, tag='model', search_mode='ordered'):
+        element2: str = element()
+
+    xml = '''
+    <model>
+        <element1><sub-element1>a</sub-element1></element1>
+        <element2>b</element2>
+    </model>
+    '''
+
+    root = XmlElement.from_native(etree.fromstring(xml))
+    actual_obj = TestModel.__xml_serializer__.deserialize(
+        root, context=None, sourcemap={}, loc=(), empty_as_string=False, validation=ValidationMode.MODEL,
+    )
+    assert actual_obj == TestModel(element2='b')
+
+    def is_loaded(element: XmlElement) -> bool:
+        try:
+            object.__getattribute__(element, '_state')
+        except AttributeError:
+            return False
+        else:
+            return True
+
+    element1, element2 = root.pop_elements()
+    assert element1.tag == 'element1'
+    assert not is_loaded(element1)
+    assert is_loaded(element2)
+
+    assert [el.tag for el in element1.pop_elements()] == ['sub-element1']
+    assert is_loaded(element1)
+
+
+@pytest.mark.parametrize('search_mode', ['strict', 'ordered', 'unordered'])
+def test_events_engine(search_mode: str):
+    class TestSubModel(BaseXmlModel, tag='submodel', search_mode=search_mode):
+        attr1: int = attr()
+        text: str
+
+    class TestModel(BaseXmlModel, tag='model', nsmap={'tst': 'http://test.org'}, search_mode=search_mode):
+        element1: str = element(ns='tst')
+        submodels: List[TestSubModel] = element()
+        mapping: Dict[str, int] = element()
+        wrapped1: List[int] = wrapped('wrapper', element(tag='element2'))
+
+    xml = '''
+    <model xmlns:tst="http://test.org">
+        <!-- comment -->
+        <tst:element1>text<!-- comment -->tail</tst:element1>
+        <submodel attr1="1">a</submodel>
+        <submodel attr1="2"><![CDATA[b&c]]></submodel>
+        <mapping key1="1" key2="2"/>
+        <wrapper><element2>1</element2><element2>2</element2></wrapper>
+    </model>
+    '''
+
+    tree_obj = TestModel.from_xml(xml, engine='tree')
+    events_obj = TestModel.from_xml(xml, engine='events')
+
+    assert events_obj == tree_obj
+    assert events_obj.submodels[1].text == 'b&c'
+
+    with pytest.raises(errors.ParsingError):
+        TestSubModel.from_xml(xml, engine='events')
+
+
+def test_events_engine_errors():
+    class TestModel(BaseXmlModel, tag='model'):
+        element1: int = element()
+
+    xml = '<model><element1>a</element1></model>'
+
+    for track_sourcelines in (True, False):
+        with pytest.raises(pd.ValidationError) as exc:
+            TestModel.from_xml(xml, engine='events', track_sourcelines=track_sourcelines)
+
+        assert exc.value.errors()[0]['loc'] == ('element1',)
+
+    with pytest.raises(ValueError, match='unknown deserialization engine'):
+        TestModel.from_xml(xml, engine='unknown')
+
+
+def test_from_xml_without_validation():
+    class TestSubModel(BaseXmlModel, tag='submodel'):
+        attr1: int = attr()
+        text: str
+
+    class TestModel(BaseXmlModel, tag='model', str_strip_whitespace=True):
+        attr1: float = attr()
+        attr2: bool = attr()
+        text: str
+        element1: Optional[int] = element(default=None)
+        element2: int = element(default=1)
+        elements: Tuple[int, ...] = element(tag='element3')
+        mapping: Dict[str, int] = element()
+        submodels: List[TestSubModel] = element()
+        timestamp: dt.datetime = element()
+        union: Union[int, str] = element()
+
+    xml = '''
+    <model attr1="1.5" attr2="true">
+        text
+        <element3>1</element3>
+        <element3>2</element3>
+        <mapping key1="1" key2="2"/>
+        <submodel attr1="1">a</submodel>
+        <submodel attr1="2">b</submodel>
+        <timestamp>2023-01-01T12:00:00</timestamp>
+        <union>value</union>
+    </model>
+    '''
+
+    validated_obj = TestModel.from_xml(xml)
+    constructed_obj = TestModel.from_xml(xml, validate=False)
+
+    assert constructed_obj == validated_obj
+    assert constructed_obj.model_fields_set == validated_obj.model_fields_set
+
+
+def test_from_xml_without_validation_fields_order():
+    class TestModel(BaseXmlModel, tag='model'):
+        field1: Optional[int] = element(default=None)
+        field2: int = element()
+        field3: str = attr(default='default')
+        field4: List[int] = element(default_factory=list)
+
+    for xml in (
+            '<model><field2>1</field2></model>',
+            '<model field3="value"><field2>1</field2><field4>1</field4></model>',
+            '<model><field1>1</field1><field2>2</field2></model>',
+    ):
+        validated_obj = TestModel.from_xml(xml)
+        constructed_obj = TestModel.from_xml(xml, validate=False)
+
+        assert list(constructed_obj.__dict__) == list(validated_obj.__dict__)
+        assert repr(constructed_obj) == repr(validated_obj)
+        assert constructed_obj.model_dump_json() == validated_obj.model_dump_json()
+        assert constructed_obj.model_fields_set == validated_obj.model_fields_set
+
+
+def test_from_xml_without_validation_shared_definitions():
+    class Color(str, Enum):
+        RED = 'red'
+        BLUE = 'blue'
+
+    class TestModel(BaseXmlModel, tag='model'):
+        color1: Color = element()
+        color2: Optional[Color] = element(default=None)
+        colors: List[Color] = element(tag='color', default=[])
+
+    xml = '''
+    <model><color1>red</color1><color2>blue</color2><color>red</color><color>blue</color></model>
+    '''
+
+    validated_obj = TestModel.from_xml(xml)
+    constructed_obj = TestModel.from_xml(xml, validate=False)
+
+    assert constructed_obj == validated_obj
+    assert constructed_obj.color1 is Color.RED
+    assert constructed_obj.color2 is Color.BLUE
+    assert constructed_obj.colors == [Color.RED, Color.BLUE]
+
+
+def test_from_xml_without_validation_coercion_errors():
+    class TestSubModel(BaseXmlModel, tag='submodel'):
+        field1: Decimal = attr()
+
+    class TestModel(BaseXmlModel, tag='model'):
+        field1: int = element()
+        field2: float = element()
+        field3: List[int] = element(default=[])
+        sub: Optional[TestSubModel] = None
+
+    class TestRootModel(RootXmlModel[int], tag='model'):
+        pass
+
+    with pytest.raises(pd.ValidationError) as exc:
+        TestModel.from_xml(
+            '<model><field1>a</field1><field2>b</field2><field3>1</field3><field3>c</field3></model>',
+            validate=False,
+        )
+
+    assert [(err['type'], err['loc'], err['input']) for err in exc.value.errors()] == [
+        ('value_error', ('field1',), 'a'),
+        ('value_error', ('field2',), 'b'),
+        ('value_error', ('field3',), ['1', 'c']),
+    ]
+
+    with pytest.raises(pd.ValidationError) as exc:
+        TestModel.from_xml(
+            '<model><field1>1</field1><field2>1.0</field2><submodel field1="d"/></model>',
+            validate=False,
+        )
+
+    assert [(err['type'], err['loc'], err['input']) for err in exc.value.errors()] == [
+        ('value_error', ('sub', 'field1'), 'd'),
+    ]
+
+    with pytest.raises(pd.ValidationError) as exc:
+        TestRootModel.from_xml('<model>e</model>', validate=False)
+
+    assert [(err['type'], err['loc'], err['input']) for err in exc.value.errors()] == [
+        ('value_error', (), 'e'),
+    ]
+
+
+def test_compiled_field_deserializers():
+    class TestSubModel(BaseXmlModel, tag='submodel'):
+        attr1: int = attr()
+
+    class TestModel(BaseXmlModel, tag='model'):
+        text: Optional[str] = None
+        attr1: Optional[str] = attr(default=None)
+        element1: Optional[str] = element(default=None)
+        element2: Optional[str] = element(default=None, nillable=True)
+        sub: Optional[TestSubModel] = element(default=None, nillable=True)
+        elements: List[int] = element(tag='item', default=[])
+        mapping: Dict[str, int] = element(tag='mapping', default={})
+        wrapped1: Optional[str] = wrapped('wrapper', element(tag='element3', default=None))
+
+    documents = (
+        '<model/>',
+        '<model attr1="a">text<element1/><element2/><submodel attr1="1"/><item>1</item><item>2</item></model>',
+        '<model attr1=""><element1>b</element1><mapping key="1"/><wrapper><element3>c</element3></wrapper></model>',
+        '<model xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+        '<element2 xsi:nil="true"/><submodel xsi:nil="true"/></model>',
+        '<model><submodel attr1="d"/><item>e</item></model>',
+        '<model><submodel/></model>',
+    )
+
+    def deserialize(field_deserializer, xml, sourcemap, empty_as_string):
+        element = XmlElement.from_native(etree.fromstring(xml))
+        try:
+            value = field_deserializer(
+                element, None, sourcemap, ('field',), empty_as_string, ValidationMode.MODEL,
+            )
+        except pd.ValidationError as err:
+            return 'error', err.errors()
+
+        # the consumed entities are compared through the entities left unbound
+        unbound = [
+            (tuple(el.tag for el in path), attr, value)
+            for path, attr, value in (element.get_unbound() if element.has_unbound() else [])
+        ]
+        return value, unbound
+
+    serializer = TestModel.__xml_serializer__
+    for field_name, field_serializer in serializer.fields_serializers.items():
+        compiled_deserializer = field_serializer.compile_deserializer()
+        # the base implementation calls the generic deserialize method
+        generic_deserializer = serializer_module.Serializer.compile_deserializer(field_serializer)
+
+        for xml in documents:
+            for empty_as_string in (False, True):
+                for sourcemap, generic_sourcemap in ((None, None), ({}, {})):
+                    assert (
+                        deserialize(compiled_deserializer, xml, sourcemap, empty_as_string) ==
+                        deserialize(generic_deserializer, xml, generic_sourcemap, empty_as_string)
+                    ), (field_name, xml, empty_as_string)
+                    assert sourcemap == generic_sourcemap
+
+    for xml, expected_errors in (
+            (documents[4], [('int_parsing', ('sub', 'attr1'))]),
+            ('<model><item>1</item><item>f</item></model>', [('int_parsing', ('elements', 1))]),
+    ):
+        with pytest.raises(pd.ValidationError) as exc:
+            TestModel.from_xml(xml)
+
+        assert [(err['type'], err['loc']) for err in exc.value.errors()] == expected_errors
+
+
+def test_serializer_cache(monkeypatch):
+    monkeypatch.setattr(serializer_module, 'SERIALIZER_CACHE', SerializerCache(maxsize=1024))
+    T = TypeVar('T')
+
+    class SubModel(BaseXmlModel, tag='sub'):
+        field1: int = element()
+
+    class TestModel(BaseXmlModel, Generic[T], tag='model'):
+        sub: SubModel
+        field1: T = element()
+        field2: Optional[str] = attr(default=None)
+
+    serializer_module.SERIALIZER_CACHE.cache_clear()
+
+    IntModel = TestModel[int]
+    StrModel = TestModel[str]
+
+    cache_info = serializer_module.SERIALIZER_CACHE.cache_info()
+    assert cache_info.hits == 2
+    assert cache_info.misses == 4
+
+    assert IntModel.__xml_serializer__ is not StrModel.__xml_serializer__
+    for field_name in ('sub', 'field2'):
+        assert (
+            IntModel.__xml_serializer__.fields_serializers[field_name] is
+            StrModel.__xml_serializer__.fields_serializers[field_name]
+        )
+
+    xml = '''
+    <model field2="a"><sub><field1>1</field1></sub><field1>2</field1></model>
+    '''
+
+    assert IntModel.from_xml(xml) == IntModel(sub=SubModel(field1=1), field1=2, field2='a')
+    assert StrModel.from_xml(xml) == StrModel(sub=SubModel(field1=1), field1='2', field2='a')
+
+
+def test_serializer_cache_disabled(monkeypatch):
+    monkeypatch.setattr(serializer_module, 'SERIALIZER_CACHE', SerializerCache(maxsize=0))
+
+    class TestModel(BaseXmlModel, tag='model'):
+        field1: Optional[int] = element(default=None)
+
+    assert serializer_module.SERIALIZER_CACHE.cache_info().currsize == 0
+
+
+def test_schema_key():
+    class SubModel(BaseXmlModel, tag='sub'):
+        field1: int = element()
+
+    def build_schema():
+        return {
+            'type': 'list',
+            'items_schema': {
+                'type': 'nullable',
+                'schema': {'type': 'model', 'cls': SubModel, 'schema': {}},
+                'metadata': {'key': object()},
+            },
+            'metadata': {'key': object()},
+        }
+
+    schema1, schema2 = build_schema(), build_schema()
+    assert schema_key(schema1) == schema_key(schema2)
+    assert hash(schema_key(schema1)) == hash(schema_key(schema2))
+
+    schema2['items_schema']['schema']['cls'] = BaseXmlModel
+    assert schema_key(schema1) != schema_key(schema2)
+
+    # sub-schema keys are built once and reused by the enclosing schema keys
+    memo = {}
+    key = schema_key(schema1, memo)
+    assert schema_key(schema1, memo) is key
+    assert schema_key(schema1['items_schema'], memo) is key[1][1]
+
+
+def test_lazy_serializer():
+    class SubModel(BaseXmlModel, tag='sub', lazy_serializer=True):
+        field1: int = element()
+
+    class TestModel(BaseXmlModel, tag='model', lazy_serializer=True):
+        sub: SubModel
+
+    assert isinstance(inspect.getattr_static(TestModel, '__xml_serializer__'), LazySerializer)
+    assert isinstance(inspect.getattr_static(SubModel, '__xml_serializer__'), LazySerializer)
+
+    xml = '''
+    <model><sub><field1>1</field1></sub></model>
+    '''
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        serializers = list(executor.map(lambda _: TestModel.__xml_serializer__, range(8)))
+
+    assert all(serializer is serializers[0] for serializer in serializers)
+    assert inspect.getattr_static(TestModel, '__xml_serializer__') is serializers[0]
+
+    actual_obj = TestModel.from_xml(xml)
+    assert actual_obj == TestModel(sub=SubModel(field1=1))
+    assert_xml_equal(actual_obj.to_xml(), xml)
+
+    class InvalidModel(BaseXmlModel, lazy_serializer=True):
+        field1: Dict[str, int] = attr()
+
+    with pytest.raises(errors.ModelFieldError):
+        build_serializers()
+
+    with pytest.raises(errors.ModelFieldError):
+        InvalidModel.from_xml('<InvalidModel/>')
+
+
+def test_parser_options():
+    class TestModel(BaseXmlModel, tag='model', parser_options={'remove_comments': True, 'resolve_entities': False}):
+        text: str
+        element1: str = element()
+
+    class TestSubModel(TestModel, tag='model'):
+        pass
+
+    assert TestSubModel.__xml_parser__ is TestModel.__xml_parser__
+
+    xml = '''
+    <model>text<!-- comment --><element1>value<!-- comment --></element1></model>
+    '''
+
+    for engine in ('tree', 'events'):
+        actual_obj = TestModel.from_xml(xml, engine=engine)
+        assert actual_obj == TestModel(text='text', element1='value')
+
+    if is_lxml_native():
+        parser = TestModel.__xml_parser__.get_parser()
+        assert parser is TestModel.__xml_parser__.get_parser()
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            assert executor.submit(TestModel.__xml_parser__.get_parser).result() is not parser
+
+
+@pytest.mark.skipif(not is_lxml_native(), reason='not lxml used')
+def test_parser_options_with_kwargs(tmp_path):
+    class TestModel(BaseXmlModel, tag='model', parser_options={'remove_comments': True}):
+        text: str
+        element1: str = element()
+
+    xml = b'''
+    <model>text<!-- comment --><element1>value<!-- comment --></element1></model>
+    '''
+    expected_obj = TestModel(text='text', element1='value')
+
+    path = tmp_path / 'model.xml'
+    path.write_bytes(xml)
+
+    for kwargs in ({'base_url': 'http://example.com/'}, {'huge_tree': True}):
+        for engine in ('tree', 'events'):
+            assert TestModel.from_xml(xml, engine=engine, **kwargs) == expected_obj
+
+        assert TestModel.from_xml_file(path, **kwargs) == expected_obj
+
+
+@pytest.mark.parametrize('parser_options', [None, {'remove_comments': True}])
+def test_xml_sources(tmp_path, parser_options):
+    class TestModel(BaseXmlModel, tag='model', parser_options=parser_options):
+        text: str
+        element1: int = element()
+
+    xml = b'''
+    <model>text<element1>1</element1></model>
+    '''
+    expected_obj = TestModel(text='text', element1=1)
+
+    for source in (bytearray(xml), memoryview(xml)):
+        for engine in ('tree', 'events'):
+            assert TestModel.from_xml(source, engine=engine) == expected_obj
+
+    path = tmp_path / 'model.xml'
+    path.write_bytes(xml)
+
+    assert TestModel.from_xml_file(path) == expected_obj
+    assert TestModel.from_xml_file(str(path)) == expected_obj
+
+    with path.open('rb') as file:
+        assert TestModel.from_xml_file(file) == expected_obj
+
+    with path.open('rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        assert TestModel.from_xml(buffer) == expected_obj
+
+    path.write_bytes(b'<model>text<element1>value</element1></model>')
+    with pytest.raises(pd.ValidationError):
+        TestModel.from_xml_file(path, track_sourcelines=False)
@@ -1,9 +1,12 @@
+import copy
+import pickle
 from typing import Dict, List, Tuple
 
 import pytest
 from helpers import assert_xml_equal, is_lxml_native
 
 from pydantic_xml import BaseXmlModel, attr, element, wrapped
+from pydantic_xml.utils import merge_nsmaps
 
 
 def test_default_namespaces():
@@ -391,3 +394,39 @@ def test_submodel_namespaces_default_namespace_inheritance():
 
     actual_xml = actual_obj.to_xml()
     assert_xml_equal(actual_xml, xml)
+
+
+def test_nsmaps_interning():
+    nsmap = merge_nsmaps({'tst1': 'http://test1.org'}, None, {'tst1': 'http://test3.org', 'tst2': 'http://test2.org'})
+
+    assert nsmap == {'tst1': 'http://test1.org', 'tst2': 'http://test2.org'}
+    assert nsmap is merge_nsmaps({'tst2': 'http://test2.org'}, {'tst1': 'http://test1.org'})
+    assert nsmap is copy.deepcopy(nsmap)
+    assert nsmap is pickle.loads(pickle.dumps(nsmap))
+
+    with pytest.raises(TypeError):
+        nsmap['tst3'] = 'http://test3.org'
+
+    class TestSubModel(BaseXmlModel, tag='submodel', ns='tst1', nsmap={'tst1': 'http://test1.org'}):
+        element1: str = element()
+
+    class TestModel(BaseXmlModel, tag='model', ns='tst1', nsmap={'tst1': 'http://test1.org'}):
+        element1: str = element()
+        submodel: TestSubModel
+
+    assert TestModel.__xml_serializer__.nsmap is TestSubModel.__xml_serializer__.nsmap
+
+    xml = '''
+    <tst1:model xmlns:tst1="http://test1.org">
+        <tst1:element1>value1</tst1:element1>
+        <tst1:submodel>
+            <tst1:element1>value2</tst1:element1>
+        </tst1:submodel>
+    </tst1:model>
+    '''
+
+    actual_obj = TestModel.from_xml(xml)
+    assert actual_obj == TestModel(element1='value1', submodel=TestSubModel(element1='value2'))
+
+    actual_xml = actual_obj.to_xml()
+    assert_xml_equal(actual_xml, xml)
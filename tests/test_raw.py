@@ -151,3 +151,29 @@ def test_wrapped_raw_element_serialization():
     actual_obj = TestModel(field1=field1)
     actual_xml = actual_obj.to_xml()
     assert_xml_equal(actual_xml, xml)
+
+
+def test_raw_element_serialization_source_untouched():
+    class TestModel(BaseXmlModel, tag='model', arbitrary_types_allowed=True):
+        element1: ElementT = element()
+
+    xml = '''
+    <model>
+        <element1 attr1="1"><sub-element1>text</sub-element1></element1>
+    </model>
+    '''
+
+    source = etree.Element('source')
+    element1 = etree.SubElement(source, 'element1', attr1='1')
+    sub_element = etree.SubElement(element1, 'sub-element1')
+    sub_element.text = 'text'
+
+    obj = TestModel(element1=element1)
+    assert_xml_equal(obj.to_xml(), xml)
+    assert_xml_equal(obj.to_xml(), xml)
+
+    tree = obj.to_xml_tree()
+    tree[0][0].text = 'modified'
+
+    assert list(source) == [element1]
+    assert sub_element.text == 'text'
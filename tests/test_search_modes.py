@@ -6,6 +6,8 @@ import pytest
 from helpers import assert_xml_equal
 
 from pydantic_xml import BaseXmlModel, attr, element, wrapped
+from pydantic_xml.element import element as element_module
+from pydantic_xml.element.native import ElementT, etree
 from tests.helpers import fmt_sourceline
 
 
@@ -621,3 +623,129 @@ def test_wrapper_unordered_mode_error():
         'type': 'missing',
         'input': ANY,
     }
+
+
+@pytest.mark.parametrize('search_mode', ['ordered', 'unordered'])
+def test_wide_element_indexed_search(search_mode: str, monkeypatch: pytest.MonkeyPatch):
+    class TestSubModel(BaseXmlModel, tag='submodel', search_mode=search_mode):
+        element1: str = element()
+        elements2: List[int] = element(tag='element2', default=[])
+
+    class TestModel(BaseXmlModel, tag='model', search_mode=search_mode):
+        elements3: List[str] = element(tag='element3')
+        element1: Optional[str] = element(default=None)
+        submodels: List[TestSubModel] = element()
+        elements2: List[int] = element(tag='element2', default=[])
+        element4: Optional[str] = element(default=None)
+
+    xml = '''
+    <model>
+        {}
+        <element1>a</element1>
+        {}
+        <submodel>
+            <element2>1</element2>
+            <element1>b</element1>
+            <element2>2</element2>
+        </submodel>
+        {}
+        <submodel>
+            <element1>c</element1>
+        </submodel>
+        <element4>d</element4>
+    </model>
+    '''.format(
+        ''.join(f'<element2>{i}</element2><element3>{i}</element3>' for i in range(10)),
+        ''.join(f'<element3>{i}</element3><skip/>' for i in range(10, 20)),
+        ''.join(f'<element2>{i}</element2>' for i in range(20, 30)),
+    )
+
+    monkeypatch.setattr(element_module, 'INDEXED_SEARCH_THRESHOLD', 1_000_000)
+    linear_obj = TestModel.from_xml(xml)
+
+    monkeypatch.setattr(element_module, 'INDEXED_SEARCH_THRESHOLD', 0)
+    indexed_obj = TestModel.from_xml(xml)
+
+    assert indexed_obj == linear_obj
+    assert len(indexed_obj.elements3) == 20
+    assert len(indexed_obj.submodels) == 2
+    assert indexed_obj.element4 == 'd'
+
+
+def test_unbound_elements_pruning():
+    class TestSubModel(BaseXmlModel, tag='submodel', search_mode='ordered'):
+        attr1: int = attr()
+        element1: str = element()
+
+    class TestModel(BaseXmlModel, tag='model', search_mode='ordered', arbitrary_types_allowed=True):
+        element1: str = element()
+        wrapped1: List[int] = wrapped('wrapper1/wrapper2', element(tag='element2'))
+        submodels: List[TestSubModel] = element()
+        raw: ElementT = element()
+
+    class UnorderedModel(TestModel, search_mode='unordered'):
+        pass
+
+    class StrictModel(TestModel, search_mode='strict'):
+        pass
+
+    class ForbidModel(TestModel, extra='forbid'):
+        pass
+
+    expected_binding = {
+        'element1': {},
+        'wrapper1': {'wrapper2': {'element2': {}}},
+        'submodel': {'element1': {}},
+        'raw': None,
+    }
+    assert TestModel.__xml_serializer__.element_binding == expected_binding
+    assert UnorderedModel.__xml_serializer__.element_binding == expected_binding
+    assert StrictModel.__xml_serializer__.element_binding is None
+    assert ForbidModel.__xml_serializer__.element_binding is None
+
+    xml = '''
+    <model>
+        <skip><element1>skipped</element1></skip>
+        <element1>a</element1>
+        <wrapper1>
+            <skip/>
+            <wrapper2><skip/><element2>1</element2><skip/><element2>2</element2></wrapper2>
+        </wrapper1>
+        <submodel attr1="1"><skip/><element1>b</element1></submodel>
+        <skip/>
+        <submodel attr1="2"><element1>c</element1><skip/></submodel>
+        <raw><skip>raw</skip></raw>
+    </model>
+    '''
+
+    for model in (TestModel, UnorderedModel):
+        actual_obj = model.from_xml(xml)
+        assert actual_obj.element1 == 'a'
+        assert actual_obj.wrapped1 == [1, 2]
+        assert actual_obj.submodels == [
+            TestSubModel(attr1=1, element1='b'),
+            TestSubModel(attr1=2, element1='c'),
+        ]
+        assert_xml_equal(etree.tostring(actual_obj.raw), '<raw><skip>raw</skip></raw>')
+
+
+def test_strict_mode_unbound_elements_not_pruned():
+    class TestModel(BaseXmlModel, tag='model', search_mode='strict'):
+        element1: str = element()
+        element2: str = element()
+
+    assert TestModel.__xml_serializer__.element_binding is None
+
+    # the strict search stops at an unknown element, pruning it would make the document valid
+    xml = '''
+    <model>
+        <element1>a</element1>
+        <skip/>
+        <element2>b</element2>
+    </model>
+    '''
+
+    with pytest.raises(pydantic.ValidationError) as exc:
+        TestModel.from_xml(xml)
+
+    assert [(err['type'], err['loc']) for err in exc.value.errors()] == [('missing', ('element2',))]
@@ -0,0 +1,144 @@
+import bz2
+import gzip
+import io
+import lzma
+from typing import List, Optional
+
+import pytest
+from helpers import assert_xml_equal
+
+from pydantic_xml import BaseXmlModel, attr, computed_attr, element, wrapped
+
+
+class Item(BaseXmlModel, tag='item', ns='tst', nsmap={'tst': 'http://test.org'}):
+    attr1: int = attr()
+    element1: Optional[str] = element(default=None)
+
+
+def test_write_xml():
+    class TestModel(BaseXmlModel, tag='model', ns='tst', nsmap={'tst': 'http://test.org'}):
+        attr1: str = attr()
+        element1: str = wrapped('wrapper', element(ns='tst'))
+        element2: str = wrapped('wrapper', element(ns='tst'))
+        items: List[Item]
+
+    xml = '''
+    <tst:model xmlns:tst="http://test.org" attr1="value">
+        <tst:wrapper>
+            <tst:element1>value1</tst:element1>
+            <tst:element2>value2</tst:element2>
+        </tst:wrapper>
+        <tst:item attr1="1"><tst:element1>a</tst:element1></tst:item>
+        <tst:item attr1="2"/>
+        <tst:item attr1="3"><tst:element1>c</tst:element1></tst:item>
+    </tst:model>
+    '''
+
+    obj = TestModel.from_xml(xml)
+
+    file = io.BytesIO()
+    obj.write_xml(file, skip_empty=True)
+    assert_xml_equal(file.getvalue(), xml)
+    assert_xml_equal(file.getvalue(), obj.to_xml(skip_empty=True))
+
+
+def test_write_xml_late_attributes():
+    class TestModel(BaseXmlModel, tag='model', ns='tst', nsmap={'tst': 'http://test.org'}):
+        element1: str = element(ns='tst')
+        element2: str = element(ns='tst')
+        items: List[Item]
+        attr1: str = attr()
+        text: str
+
+        @computed_attr
+        def attr2(self) -> str:
+            return self.attr1.upper()
+
+    obj = TestModel(
+        element1='value1',
+        element2='value2',
+        items=[Item(attr1=1, element1='a'), Item(attr1=2)],
+        attr1='value',
+        text='text',
+    )
+
+    file = io.BytesIO()
+    obj.write_xml(file)
+    assert file.getvalue() == obj.to_xml()
+
+
+def test_to_xml_stream_namespaced():
+    nsmap = {'tst': 'http://test.org', '': 'http://default.org'}
+
+    class TestItem(BaseXmlModel, tag='item', ns='tst', nsmap=nsmap):
+        attr1: int = attr()
+        element1: str = element(ns='tst')
+        element2: str = element()
+
+    class TestModel(BaseXmlModel, tag='items', ns='tst', nsmap=nsmap):
+        items: List[TestItem]
+
+    items = [TestItem(attr1=idx, element1=str(idx), element2=str(idx)) for idx in range(3)]
+
+    file = io.BytesIO()
+    TestItem.to_xml_stream(items, file, '{http://test.org}items', nsmap)
+    assert file.getvalue() == TestModel(items=items).to_xml()
+
+    file = io.BytesIO()
+    TestModel(items=items).write_xml(file)
+    assert file.getvalue() == TestModel(items=items).to_xml()
+
+
+def test_to_xml_stream(tmp_path):
+    xml = '''
+    <tst:items xmlns:tst="http://test.org">
+        <tst:item attr1="0"><tst:element1>0</tst:element1></tst:item>
+        <tst:item attr1="1"/>
+        <tst:item attr1="2"><tst:element1>2</tst:element1></tst:item>
+        <tst:item attr1="3"/>
+    </tst:items>
+    '''
+
+    def generate_items():
+        for i in range(4):
+            yield Item(attr1=i, element1=str(i) if i % 2 == 0 else None)
+
+    path = tmp_path / 'doc.xml'
+    Item.to_xml_stream(
+        generate_items(), str(path), '{http://test.org}items', {'tst': 'http://test.org'},
+        skip_empty=True,
+    )
+
+    assert_xml_equal(path.read_bytes(), xml)
+    assert list(Item.iter_from_xml(str(path))) == list(generate_items())
+
+
+@pytest.mark.parametrize(
+    'compression, suffix, decompress', [
+        ('gzip', '.gz', gzip.decompress),
+        ('bz2', '.bz2', bz2.decompress),
+        ('xz', '.xz', lzma.decompress),
+    ],
+)
+def test_compressed_stream(tmp_path, compression, suffix, decompress):
+    def generate_items():
+        for i in range(4):
+            yield Item(attr1=i, element1=str(i) if i % 2 == 0 else None)
+
+    path = tmp_path / f'doc.xml{suffix}'
+    Item.to_xml_stream(generate_items(), path, '{http://test.org}items', {'tst': 'http://test.org'}, compression='infer')
+    expected_xml = decompress(path.read_bytes())
+
+    assert list(Item.iter_from_xml(path, compression='infer')) == list(generate_items())
+
+    file = io.BytesIO()
+    Item.to_xml_stream(generate_items(), file, '{http://test.org}items', {'tst': 'http://test.org'}, compression=compression)
+    assert_xml_equal(decompress(file.getvalue()), expected_xml)
+
+    obj = Item(attr1=1, element1='a')
+    file = io.BytesIO()
+    obj.write_xml(file, compression=compression)
+    assert_xml_equal(decompress(file.getvalue()), obj.to_xml())
+
+    file.seek(0)
+    assert Item.from_xml_file(file, compression=compression) == obj
@@ -430,6 +430,45 @@ def test_tagged_union_collection():
     assert_xml_equal(actual_xml, xml)
 
 
+def test_tagged_union_element_names():
+    from typing import Annotated
+
+    class SubModel1(BaseXmlModel, tag='submodel1'):
+        type: Literal['type1'] = attr()
+        data: int
+
+    class SubModel2(BaseXmlModel, tag='submodel2'):
+        type: Literal['type2'] = attr()
+        data: str
+
+    class SubModel3(BaseXmlModel, tag='submodel1'):
+        type: Literal['type3'] = attr()
+        data: float
+
+    class TestModel(BaseXmlModel, tag='model'):
+        collection: List[Annotated[Union[SubModel1, SubModel2, SubModel3], Field(discriminator='type')]]
+
+    xml = '''
+    <model>
+        <submodel1 type="type3">1.5</submodel1>
+        <submodel2 type="type2">a</submodel2>
+        <submodel1 type="type1">1</submodel1>
+        <submodel2 type="type1">b</submodel2>
+    </model>
+    '''
+
+    actual_obj = TestModel.from_xml(xml)
+    expected_obj = TestModel(
+        collection=[
+            SubModel3(type='type3', data=1.5),
+            SubModel2(type='type2', data='a'),
+            SubModel1(type='type1', data=1),
+        ],
+    )
+
+    assert actual_obj == expected_obj
+
+
 def test_union_snapshot():
     class SubModel1(BaseXmlModel, tag='submodel'):
         attr1: int = attr()
@@ -453,3 +492,45 @@ def test_union_snapshot():
 
     actual_xml = actual_obj.to_xml()
     assert_xml_equal(actual_xml, xml)
+
+
+def test_union_rollback():
+    class TestSubModel(BaseXmlModel, tag='sub', search_mode='unordered'):
+        attr1: str = attr()
+        element1: str = element()
+
+    class TestModel1(BaseXmlModel, tag='submodel', search_mode='unordered'):
+        element2: int = element()
+        sub: TestSubModel
+        element1: int = element()
+
+    class TestModel2(BaseXmlModel, tag='submodel'):
+        element1: str = element()
+        sub: TestSubModel
+        element2: str = element()
+
+    class TestModel(BaseXmlModel, tag='model'):
+        submodel: Union[TestModel1, TestModel2]
+        element3: str = element()
+
+    xml = '''
+    <model>
+        <submodel>
+            <element1>a</element1>
+            <sub attr1="b"><element1>c</element1></sub>
+            <element2>1</element2>
+        </submodel>
+        <element3>d</element3>
+    </model>
+    '''
+
+    actual_obj = TestModel.from_xml(xml)
+    expected_obj = TestModel(
+        submodel=TestModel2(element1='a', sub=TestSubModel(attr1='b', element1='c'), element2='1'),
+        element3='d',
+    )
+
+    assert actual_obj == expected_obj
+
+    actual_xml = actual_obj.to_xml()
+    assert_xml_equal(actual_xml, xml)